@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from abc import ABC, abstractmethod
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, MutableMapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Literal, MutableMapping, Optional, Tuple, Union
 
 import discord
 from redbot.core import Config, commands
@@ -12,6 +12,7 @@ from redbot.core.bot import Red
 if TYPE_CHECKING:
     from .adventureresult import AdventureResults
     from .adventureset import TaxesConverter
+    from .character_store import CharacterStore
     from .charsheet import Character, Item
     from .constants import Rarities, Treasure
     from .converters import (
@@ -28,8 +29,11 @@ if TYPE_CHECKING:
         ThemeSetMonterConverter,
         ThemeSetPetConverter,
     )
-    from .game_session import GameSession
+    from .game_session import GameSession, SessionCharacters, SessionRegistry
+    from .monsters import MonsterRoster
     from .rng import Random
+    from .scheduler import Deadline, Scheduler
+    from .settings import Settings
     from .types import Monster
 
 
@@ -42,28 +46,32 @@ class AdventureMixin(ABC):
 
     def __init__(self, *_args):
         self.config: Config
+        self.character_store: CharacterStore
         self.bot: Red
         self._adv_results: AdventureResults
-        self.settings: Dict[Any, Any]
+        self.settings: Settings
         self.emojis: SimpleNamespace
         self._ready: asyncio.Event
-        self._adventure_countdown: dict
         self._rewards: dict
         self._reward_message: dict
         self._loss_message = {}
         self._trader_countdown = {}
         self._current_traders = {}
         self._curent_trader_stock = {}
-        self._sessions: MutableMapping[int, GameSession] = {}
+        self._sessions: SessionRegistry
         self._react_messaged = []
         self._daily_bonus: dict = {}
         self.tasks = {}
         self.locks: MutableMapping[int, asyncio.Lock] = {}
-        self.gb_task = None
+        self.scheduler: Scheduler
 
         self.RAISINS: list = None
         self.THREATEE: list = None
         self.TR_GEAR_SET: dict = None
+        self.SET_BONUSES: dict = None
+        self.SET_BONUS_TABLES: Dict[str, List[Dict[str, float]]] = {}
+        self.SET_PARTS: Dict[str, int] = {}
+        self.SET_PIECES: Dict[str, Dict[str, dict]] = {}
         self.ATTRIBS: dict = None
         self.MONSTERS: dict = None
         self.AS_MONSTERS: dict = None
@@ -110,10 +118,6 @@ class AdventureMixin(ABC):
     async def initialize(self):
         raise NotImplementedError()
 
-    @abstractmethod
-    async def cleanup_tasks(self):
-        raise NotImplementedError()
-
     @abstractmethod
     async def _migrate_config(self, from_version: int, to_version: int) -> None:
         raise NotImplementedError()
@@ -123,7 +127,7 @@ class AdventureMixin(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    async def _garbage_collection(self):
+    def _expire_session(self, guild_id: int, session: GameSession):
         raise NotImplementedError()
 
     @abstractmethod
@@ -139,17 +143,25 @@ class AdventureMixin(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    async def get_challenge(self, monsters: Dict[str, Monster], rng: Random):
+    async def get_challenge(self, monsters: MonsterRoster, rng: Random):
         raise NotImplementedError()
 
     @abstractmethod
     def _dynamic_monster_stats(self, choice: Monster, rng: Random) -> Monster:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def get_monster_roster(self) -> MonsterRoster:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def invalidate_monster_roster(self) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def update_monster_roster(
         self, c: Optional[Character] = None, rng: Optional[Random] = None
-    ) -> Tuple[Dict[str, Monster], float, bool]:
+    ) -> Tuple[MonsterRoster, float, bool]:
         raise NotImplementedError()
 
     @abstractmethod
@@ -202,12 +214,18 @@ class AdventureMixin(ABC):
 
     @abstractmethod
     async def _add_rewards(
-        self, ctx: commands.Context, user: Union[discord.Member, discord.User], exp: int, cp: int, special: Treasure
+        self,
+        ctx: commands.Context,
+        user: Union[discord.Member, discord.User],
+        exp: int,
+        cp: int,
+        special: Treasure,
+        characters: Optional[SessionCharacters] = None,
     ) -> Optional[str]:
         raise NotImplementedError()
 
     @abstractmethod
-    async def _adv_countdown(self, ctx: commands.Context, seconds, title) -> asyncio.Task:
+    async def _adv_countdown(self, ctx: commands.Context, seconds, title) -> Deadline:
         raise NotImplementedError()
 
     @abstractmethod
@@ -218,6 +236,10 @@ class AdventureMixin(ABC):
     async def on_message_without_command(self, message):
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _spawn_cart(self, message: discord.Message):
+        raise NotImplementedError()
+
     @abstractmethod
     async def _roll_chest(self, chest_type: Rarities, c: Character):
         raise NotImplementedError()
@@ -6,9 +6,9 @@ import logging
 import random
 import time
 from abc import ABC
-from datetime import datetime, timedelta
+from datetime import datetime
 from types import SimpleNamespace
-from typing import Dict, Literal, MutableMapping, Optional, Tuple, Union
+from typing import Dict, List, Literal, MutableMapping, Optional, Tuple, Union
 
 import discord
 from discord.ext.commands import CheckFailure
@@ -22,27 +22,40 @@ from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import bold, box, humanize_list, humanize_number, pagify
 from redbot.core.utils.predicates import ReactionPredicate
 
+from . import combat
 from .adventureresult import AdventureResults
 from .adventureset import AdventureSetCommands
 from .backpack import BackPackCommands
 from .bank import bank
 from .cart import Trader
 from .character import CharacterCommands
-from .charsheet import Character, Item, calculate_sp, has_funds
+from .character_store import CharacterStore
+from .charsheet import (
+    Character,
+    Item,
+    calculate_sp,
+    compile_set_bonuses,
+    compile_set_pieces,
+    count_set_items,
+    has_funds,
+)
 from .class_abilities import ClassAbilities
 from .constants import DEV_LIST, ANSITextColours, HeroClasses, Rarities, Treasure
 from .converters import ArgParserFailure, ChallengeConverter
 from .defaults import default_global, default_guild, default_user
 from .dev import DevCommands
 from .economy import EconomyCommands
-from .game_session import GameSession
-from .helpers import _get_epoch, _remaining, is_dev, smart_embed
+from .game_session import GameSession, SessionCharacters, SessionRegistry
+from .helpers import is_dev, smart_embed
 from .leaderboards import LeaderboardCommands
 from .loadouts import LoadoutCommands
 from .loot import LootCommands
+from .monsters import MonsterRoster
 from .negaverse import Negaverse
 from .rebirth import RebirthCommands
 from .rng import GameSeed, Random
+from .scheduler import Deadline, Scheduler
+from .settings import Settings
 from .themeset import ThemesetCommands
 from .types import Monster
 
@@ -51,7 +64,9 @@ _ = Translator("Adventure", __file__)
 log = logging.getLogger("red.cogs.adventure")
 
 
-_SCHEMA_VERSION = 4
+_SCHEMA_VERSION = 5
+# Sessions still around this many seconds after they started are dropped.
+SESSION_EXPIRY = 60 * 6
 _config: Config = None
 
 
@@ -89,6 +104,7 @@ class Adventure(
         requester: Literal["discord", "owner", "user", "user_strict"],
         user_id: int,
     ):
+        self.character_store.invalidate(user_id)
         await self.config.user_from_id(user_id).clear()
         await bank._config.user_from_id(
             user_id
@@ -148,18 +164,17 @@ class Adventure(
         }
         self._yes_no_controls = {self.emojis.yes: "yes", self.emojis.no: "no"}
 
-        self._adventure_countdown = {}
         self._rewards = {}
         self._reward_message = {}
         self._loss_message = {}
         self._trader_countdown = {}
         self._current_traders = {}
         self._curent_trader_stock = {}
-        self._sessions: MutableMapping[int, GameSession] = {}
+        self._sessions = SessionRegistry()
         self._react_messaged = []
         self.tasks = {}
         self.locks: MutableMapping[int, asyncio.Lock] = {}
-        self.gb_task = None
+        self.scheduler = Scheduler()
 
         self.config = Config.get_conf(self, 2_710_801_001, force_registration=True)
         self._daily_bonus = {}
@@ -168,8 +183,13 @@ class Adventure(
         self.RAISINS: list = None
         self.THREATEE: list = None
         self.TR_GEAR_SET: dict = None
+        self.SET_BONUSES: dict = None
+        self.SET_BONUS_TABLES: Dict[str, List[Dict[str, float]]] = {}
+        self.SET_PARTS: Dict[str, int] = {}
+        self.SET_PIECES: Dict[str, Dict[str, dict]] = {}
         self.ATTRIBS: dict = None
         self.MONSTERS: Dict[str, Monster] = None
+        self._monster_roster: Optional[MonsterRoster] = None
         self.AS_MONSTERS: dict = None
         self.MONSTER_NOW: dict = None
         self.LOCATIONS: list = None
@@ -179,7 +199,8 @@ class Adventure(
         self.config.register_guild(**default_guild)
         self.config.register_global(**default_global)
         self.config.register_user(**default_user)
-        self.cleanup_loop = self.bot.loop.create_task(self.cleanup_tasks())
+        self.settings = Settings(self.config)
+        self.character_store = CharacterStore(self, self.config)
         log.debug("Creating Task")
         self._init_task = self.bot.loop.create_task(self.initialize())
         self._ready_event = asyncio.Event()
@@ -245,8 +266,9 @@ class Adventure(
         try:
             global _config
             _config = self.config
-            theme = await self.config.theme()
-            self._separate_economy = await self.config.separate_economy()
+            await self.settings.load()
+            theme = self.settings["theme"]
+            self._separate_economy = self.settings["separate_economy"]
             if theme in {"default"}:
                 get_path = bundled_data_path
             else:
@@ -294,6 +316,7 @@ class Adventure(
                 self.MONSTERS = json.load(f)
             with files["as_monsters"].open("r") as f:
                 self.AS_MONSTERS = json.load(f)
+            self.invalidate_monster_roster()
             with files["location"].open("r") as f:
                 self.LOCATIONS = json.load(f)
             with files["raisins"].open("r") as f:
@@ -333,27 +356,19 @@ class Adventure(
                 ]
             ):
                 log.critical(f"{theme} theme is invalid, resetting it to the default theme.")
-                await self.config.theme.set("default")
+                await self.settings.set("theme", "default")
                 await self.initialize()
                 return
-            await self._migrate_config(from_version=await self.config.schema_version(), to_version=_SCHEMA_VERSION)
+            self.SET_BONUS_TABLES = compile_set_bonuses(self.SET_BONUSES)
+            self.SET_PARTS = {name: len(table) - 1 for name, table in self.SET_BONUS_TABLES.items()}
+            self.SET_PIECES = compile_set_pieces(self.TR_GEAR_SET)
+            await self._migrate_config(from_version=self.settings["schema_version"], to_version=_SCHEMA_VERSION)
             self._daily_bonus = await self.config.daily_bonus.all()
         except Exception as err:
             log.exception("There was an error starting up the cog", exc_info=err)
         else:
             self._ready_event.set()
-            self.gb_task = self.bot.loop.create_task(self._garbage_collection())
-
-    async def cleanup_tasks(self):
-        await self._ready_event.wait()
-        while self is self.bot.get_cog("Adventure"):
-            to_delete = []
-            for msg_id, task in self.tasks.items():
-                if task.done():
-                    to_delete.append(msg_id)
-            for task in to_delete:
-                del self.tasks[task]
-            await asyncio.sleep(300)
+            self.character_store.start()
 
     async def _migrate_config(self, from_version: int, to_version: int) -> None:
         log.debug(f"from_version: {from_version} to_version:{to_version}")
@@ -393,7 +408,7 @@ class Adventure(
                         adventurers_data[user]["loadouts"] = new_loadout
                     except Exception:
                         adventurers_data[user]["loadouts"] = {}
-            await self.config.schema_version.set(2)
+            await self.settings.set("schema_version", 2)
             from_version = 2
         if from_version < 3 <= to_version:
             group = self.config._get_base_group(self.config.USER)
@@ -424,7 +439,7 @@ class Adventure(
                         adventurers_data[user]["loadouts"] = new_loadout
                     except Exception:
                         adventurers_data[user]["loadouts"] = {}
-            await self.config.schema_version.set(3)
+            await self.settings.set("schema_version", 3)
 
         if from_version < 4 <= to_version:
             group = self.config._get_base_group(self.config.USER)
@@ -456,7 +471,15 @@ class Adventure(
                                 del adventurers_data[user]["backpack"][item_name]
                                 item_name = item_name.replace("Solomos", "Solomons")
                                 adventurers_data[user]["backpack"][item_name] = item_data
-            await self.config.schema_version.set(4)
+            await self.settings.set("schema_version", 4)
+
+        if from_version < 5 <= to_version:
+            # set_items used to be recounted on every load and is now kept up to date instead
+            group = self.config._get_base_group(self.config.USER)
+            async with group.all() as adventurers_data:
+                async for data in AsyncIter(adventurers_data.values(), steps=100):
+                    data["set_items"] = count_set_items(data)
+            await self.settings.set("schema_version", 5)
 
     def _convert_item_migration(self, item_name, item_dict):
         new_name = item_name
@@ -492,13 +515,7 @@ class Adventure(
         with something requiring their attention.
         """
         author = user or ctx.author
-        sessions = self._sessions
-        if not sessions:
-            return False or self.get_lock(author).locked()
-        for session in self._sessions.values():
-            if session.in_adventure(author):
-                return True
-        return False or self.get_lock(author).locked()
+        return self._sessions.participating(author.id) or self.get_lock(author).locked()
 
     async def allow_in_dm(self, ctx):
         """Checks if the bank is global and allows the command in dm."""
@@ -511,17 +528,10 @@ class Adventure(
             self.locks[member.id] = asyncio.Lock()
         return self.locks[member.id]
 
-    async def _garbage_collection(self):
-        await self.bot.wait_until_red_ready()
-        delta = timedelta(minutes=6)
-        with contextlib.suppress(asyncio.CancelledError):
-            while True:
-                async for guild_id, session in AsyncIter(self._sessions.copy().items(), steps=100):
-                    if datetime.now() > (session.start_time + delta):
-                        if guild_id in self._sessions:
-                            log.debug("Removing old session from %s", guild_id)
-                            del self._sessions[guild_id]
-                await asyncio.sleep(5)
+    def _expire_session(self, guild_id: int, session: GameSession):
+        if self._sessions.get(guild_id) is session:
+            log.debug("Removing old session from %s", guild_id)
+            del self._sessions[guild_id]
 
     @commands.cooldown(rate=1, per=5, type=commands.BucketType.guild)
     @commands.hybrid_command(name="adventure", aliases=["a"])
@@ -561,7 +571,7 @@ class Adventure(
                     req=250, name=currency_name, extra=extra
                 ),
             )
-        guild_settings = await self.config.guild(ctx.guild).all()
+        guild_settings = self.settings.guild(ctx.guild)
         cooldown = guild_settings["cooldown"]
 
         cooldown_time = guild_settings["cooldown_timer_manual"]
@@ -580,19 +590,24 @@ class Adventure(
         adventure_msg = _("You feel adventurous, {}?").format(bold(ctx.author.display_name))
         try:
             reward, participants = await self._simple(ctx, adventure_msg, challenge)
-            await self.config.guild(ctx.guild).cooldown.set(time.time())
+            await self.settings.set_guild(ctx.guild, "cooldown", time.time())
             if ctx.guild.id in self._sessions:
                 self._sessions[ctx.guild.id].finished = True
         except Exception as exc:
             if ctx.guild.id in self._sessions:
                 self._sessions[ctx.guild.id].finished = True
-            await self.config.guild(ctx.guild).cooldown.set(0)
+                await self._sessions[ctx.guild.id].characters.save()
+            await self.settings.set_guild(ctx.guild, "cooldown", 0)
             log.exception("Something went wrong controlling the game", exc_info=exc)
             while ctx.guild.id in self._sessions:
                 del self._sessions[ctx.guild.id]
             return
+        session = self._sessions.get(ctx.guild.id)
+        characters = session.characters if session is not None else None
         if not reward and not participants:
-            await self.config.guild(ctx.guild).cooldown.set(0)
+            await self.settings.set_guild(ctx.guild, "cooldown", 0)
+            if characters is not None:
+                await characters.save()
             while ctx.guild.id in self._sessions:
                 del self._sessions[ctx.guild.id]
             return
@@ -604,7 +619,9 @@ class Adventure(
                 if user is None:
                     # sorry no rewards if you leave the server
                     continue
-                msg = await self._add_rewards(ctx, user, rewards["xp"], rewards["cp"], rewards["special"])
+                msg = await self._add_rewards(
+                    ctx, user, rewards["xp"], rewards["cp"], rewards["special"], characters=characters
+                )
                 if msg:
                     send_message += f"{msg}\n"
                 self._rewards[userid] = {}
@@ -615,7 +632,12 @@ class Adventure(
             for user in participants:  # reset activated abilities
                 async with self.get_lock(user):
                     try:
-                        c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                        if characters is not None:
+                            c = await characters.get(user)
+                            # the shared sheet was loaded before any rewards or repair costs
+                            c.bal = await bank.get_balance(user)
+                        else:
+                            c = await self.character_store.load(ctx, user)
                     except Exception as exc:
                         log.exception("Error with the new character sheet", exc_info=exc)
                         continue
@@ -624,7 +646,12 @@ class Adventure(
                     if c.last_currency_check + 600 < time.time() or c.bal > c.last_known_currency:
                         c.last_known_currency = await bank.get_balance(user)
                         c.last_currency_check = time.time()
-                    await self.config.user(user).set(await c.to_json(ctx, self.config))
+                    if characters is not None:
+                        characters.mark_dirty(user)
+                    else:
+                        await self.character_store.save(ctx, user, c)
+        if characters is not None:
+            await characters.save()
         if ctx.message.id in self._reward_message:
             extramsg = self._reward_message.pop(ctx.message.id)
             if extramsg:
@@ -688,11 +715,20 @@ class Adventure(
 
         await ctx.bot.on_command_error(ctx, error, unhandled_by_cog=not handled)
 
-    async def get_challenge(self, monsters: Dict[str, Monster], rng: Random):
+    async def get_challenge(self, monsters: MonsterRoster, rng: Random):
         possible_monsters = []
         stat_range = rng.internal_seed.stat_range
         log.debug("Random Seed is %s", int(rng.internal_seed))
         log.debug(stat_range)
+        if rng.internal_seed.version >= 1:
+            index = monsters.index
+            stat = "hp" if (stat_range.stat_type == "hp") else "dipl"
+            low = int(stat_range.min_stat) * 0.5
+            high = int(stat_range.max_stat) * 1.2
+            choice = index.pick(stat, low, high, rng)
+            if choice is None:
+                choice = rng.choice(index.names)
+            return choice
         async for (e, (m, stats)) in AsyncIter(monsters.items(), steps=100).enumerate(start=1):
             main_stat = stats["hp"] if (stat_range.stat_type == "hp") else stats["dipl"]
             appropriate_range = (int(stat_range.min_stat) * 0.5) <= main_stat <= (int(stat_range.max_stat) * 1.2)
@@ -823,9 +859,21 @@ class Adventure(
         choice["cdef"] = new_cdef
         return choice
 
+    async def get_monster_roster(self) -> MonsterRoster:
+        """The monsters of the current theme, built again after :meth:`invalidate_monster_roster`."""
+        if self._monster_roster is None:
+            theme = self.settings["theme"]
+            extra_monsters = await self.config.themes.all()
+            extra_monsters = extra_monsters.get(theme, {}).get("monsters", {})
+            self._monster_roster = MonsterRoster(theme, self.MONSTERS, self.AS_MONSTERS, extra_monsters)
+        return self._monster_roster
+
+    def invalidate_monster_roster(self) -> None:
+        self._monster_roster = None
+
     async def update_monster_roster(
         self, c: Optional[Character] = None, rng: Optional[Random] = None
-    ) -> Tuple[Dict[str, Monster], float, bool]:
+    ) -> Tuple[MonsterRoster, float, bool]:
         """
         Gets the current list of available monsters, their stats, and whether
         or not to spawn a transcended.
@@ -838,7 +886,7 @@ class Adventure(
 
         Returns
         -------
-            Tuple[Dict[str, Monster], float, bool]
+            Tuple[MonsterRoster, float, bool]
                 The Available monsters dictionary, the stats they should have scaled,
                 and whether or not it is transcended.
         """
@@ -846,11 +894,7 @@ class Adventure(
             transcended_chance = rng.randint(0, 10)
         else:
             transcended_chance = random.randint(0, 10)
-        theme = await self.config.theme()
-        extra_monsters = await self.config.themes.all()
-        extra_monsters = extra_monsters.get(theme, {}).get("monsters", {})
-        monsters = {**self.MONSTERS, **self.AS_MONSTERS, **extra_monsters}
-        monsters = {k: v for k, v in sorted(monsters.items(), key=lambda x: x[0])}
+        monsters = await self.get_monster_roster()
         transcended = False
         # set our default return values first
         monster_stats = 1.0
@@ -871,7 +915,7 @@ class Adventure(
         self, ctx: commands.Context, adventure_msg, challenge: Union[int, str, None] = None, attribute: str = None
     ):
         stat_range = self._adv_results.get_stat_range(ctx.guild)
-        c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+        c = await self.character_store.load(ctx, ctx.author)
         if stat_range.max_stat <= 0:
             stat_range.max_stat = max(c.att, c.int, c.cha) * 5
         seed = GameSeed(ctx.message.id, stat_range)
@@ -899,7 +943,7 @@ class Adventure(
         else:
             attribute = rng.choice(list(self.ATTRIBS.keys()))
         new_challenge = challenge
-        easy_mode = await self.config.easy_mode()
+        easy_mode = self.settings["easy_mode"]
         monster = monster_roster[challenge].copy()
         dynamic_monster_stats = self._dynamic_monster_stats(monster, rng)
         # we want to copy it so that its base stats remain the same and dynamic adjustmnets
@@ -960,6 +1004,11 @@ class Adventure(
             easy_mode=easy_mode,
             no_monster=no_monster,
             rng=rng,
+            update_interval=self.settings["session_update_interval"],
+        )
+        session = self._sessions[ctx.guild.id]
+        self.scheduler.schedule(
+            ("session", ctx.guild.id), SESSION_EXPIRY, lambda: self._expire_session(ctx.guild.id, session)
         )
         adventure_msg = (
             f"{adventure_msg}{text}\n{rng.choice(self.LOCATIONS)}\n"
@@ -1007,7 +1056,7 @@ class Adventure(
         easy_mode = session.easy_mode
         embed = discord.Embed(colour=discord.Colour.blurple())
         embed.set_footer(text=f"Seed {hex(session.rng.internal_seed)[2:].upper()}")
-        use_embeds = await self.config.guild(ctx.guild).embed() and ctx.channel.permissions_for(ctx.me).embed_links
+        use_embeds = self.settings.guild(ctx.guild)["embed"] and ctx.channel.permissions_for(ctx.me).embed_links
         if easy_mode:
             dragon_text = _(
                 "but **a{attr} {chall}** "
@@ -1093,6 +1142,8 @@ class Adventure(
         except Exception as exc:
             timer.cancel()
             log.exception("Error with the countdown timer", exc_info=exc)
+        self.tasks.pop(adventure_msg.id, None)
+        await session.flush()
         await adventure_msg.edit(view=None)
         try:
             return await self._result(ctx, adventure_msg)
@@ -1156,25 +1207,21 @@ class Adventure(
             return
         if guild.id in self._sessions:
             if reaction.message.id == self._sessions[guild.id].message_id:
-                if guild.id in self._adventure_countdown:
-                    (timer, done, sremain) = self._adventure_countdown[guild.id]
-                    if sremain > 3:
-                        await self._handle_adventure(reaction, user)
+                sremain = self.scheduler.remaining(("adventure", guild.id))
+                if sremain is not None and sremain > 3:
+                    await self._handle_adventure(reaction, user)
 
     async def _handle_adventure(self, reaction: discord.Reaction, user: discord.Member):
         action = {v: k for k, v in self._adventure_controls.items()}[str(reaction.emoji)]
         session = self._sessions[user.guild.id]
         has_fund = await has_funds(user, 250)
-        for x in ["fight", "magic", "talk", "pray", "run"]:
-            if user in getattr(session, x, []):
-                getattr(session, x).remove(user)
-
-            if not has_fund or user in getattr(session, x, []):
-                if reaction.message.channel.permissions_for(user.guild.me).manage_messages:
-                    symbol = self._adventure_controls[x]
-                    await reaction.message.remove_reaction(symbol, user)
+        session.leave(user)
+        if not has_fund and reaction.message.channel.permissions_for(user.guild.me).manage_messages:
+            for x in ["fight", "magic", "talk", "pray", "run"]:
+                symbol = self._adventure_controls[x]
+                await reaction.message.remove_reaction(symbol, user)
 
-        restricted = await self.config.restrict()
+        restricted = self.settings["restrict"]
         if user not in getattr(session, action, []):
             if not has_fund:
                 with contextlib.suppress(discord.HTTPException):
@@ -1191,18 +1238,7 @@ class Adventure(
                     )
                 return
             if restricted:
-                all_users = []
-                for guild_id, guild_session in self._sessions.items():
-                    guild_users_in_game = (
-                        guild_session.fight
-                        + guild_session.magic
-                        + guild_session.talk
-                        + guild_session.pray
-                        + guild_session.run
-                    )
-                    all_users = all_users + guild_users_in_game
-
-                if user in all_users:
+                if self._sessions.participating(user.id):
                     user_id = f"{user.id}-{user.guild.id}"
                     # iterating through reactions here and removing them seems to be expensive
                     # so they can just keep their react on the adventures they can't join
@@ -1215,9 +1251,9 @@ class Adventure(
                         )
                         self._react_messaged.append(user_id)
                 else:
-                    getattr(session, action).append(user)
+                    session.join(user, action)
             else:
-                getattr(session, action).append(user)
+                session.join(user, action)
 
     async def get_treasure(
         self,
@@ -1428,6 +1464,7 @@ class Adventure(
         self._sessions[ctx.guild.id].pray = pray_list
         self._sessions[ctx.guild.id].run = run_list
         self._sessions[ctx.guild.id].magic = magic_list
+        await session.characters.load(fight_list + talk_list + pray_list + run_list + magic_list)
         fight_name_list = []
         wizard_name_list = []
         talk_name_list = []
@@ -1480,7 +1517,7 @@ class Adventure(
             for action_name, action in participants.items():
                 for user in action:
                     try:
-                        c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                        c = await session.characters.get(user)
                     except Exception as exc:
                         log.exception("Error with the new character sheet", exc_info=exc)
                         continue
@@ -1493,7 +1530,7 @@ class Adventure(
                         c.adventures.update({special_action: current_val + 1})
                         c.weekly_score.update({"adventures": c.weekly_score.get("adventures", 0) + 1})
                         parsed_users.append(user)
-                    await self.config.user(user).set(await c.to_json(ctx, self.config))
+                    session.characters.mark_dirty(user)
             attack, diplomacy, magic, run_msg = await self.handle_run(
                 ctx.guild.id, attack, diplomacy, magic, shame=True
             )
@@ -1567,7 +1604,7 @@ class Adventure(
             users = run_list
             for user in users:
                 try:
-                    c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                    c = await session.characters.get(user)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -1594,7 +1631,7 @@ class Adventure(
             )
             for user in session.participants:
                 try:
-                    c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                    c = await session.characters.get(user)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -1616,7 +1653,7 @@ class Adventure(
                             await bank.set_balance(user, 0)
                 c.adventures.update({"loses": c.adventures.get("loses", 0) + 1})
                 c.weekly_score.update({"adventures": c.weekly_score.get("adventures", 0) + 1})
-                await self.config.user(user).set(await c.to_json(ctx, self.config))
+                session.characters.mark_dirty(user)
             loss_list = []
             result_msg += session.miniboss["defeat"]
             if len(repair_list) > 0:
@@ -1642,7 +1679,7 @@ class Adventure(
             )
             for user in session.participants:
                 try:
-                    c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                    c = await session.characters.get(user)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -1720,7 +1757,7 @@ class Adventure(
                 users = set(fight_list + magic_list + talk_list + pray_list + fumblelist)
                 for user in users:
                     try:
-                        c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                        c = await session.characters.get(user)
                     except Exception as exc:
                         log.exception("Error with the new character sheet", exc_info=exc)
                         continue
@@ -1764,9 +1801,9 @@ class Adventure(
         else:
             if slain and persuaded:
                 if len(pray_list) > 0:
-                    god = await self.config.god_name()
-                    if await self.config.guild(ctx.guild).god_name():
-                        god = await self.config.guild(ctx.guild).god_name()
+                    god = self.settings["god_name"]
+                    if self.settings.guild(ctx.guild)["god_name"]:
+                        god = self.settings.guild(ctx.guild)["god_name"]
                     if len(magic_list) > 0 and len(fight_list) > 0:
                         text = _(
                             "{b_fighters} slayed the {chall} "
@@ -1892,7 +1929,7 @@ class Adventure(
                 users = set(fight_list + magic_list + talk_list + pray_list + fumblelist)
                 for user in users:
                     try:
-                        c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                        c = await session.characters.get(user)
                     except Exception as exc:
                         log.exception("Error with the new character sheet", exc_info=exc)
                         continue
@@ -1955,7 +1992,7 @@ class Adventure(
         for action_name, action in participants.items():
             for user in action:
                 try:
-                    c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                    c = await session.characters.get(user)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -1967,7 +2004,7 @@ class Adventure(
                     c.adventures.update({special_action: current_val + 1})
                     c.weekly_score.update({"adventures": c.weekly_score.get("adventures", 0) + 1})
                     parsed_users.append(user)
-                await self.config.user(user).set(await c.to_json(ctx, self.config))
+                session.characters.mark_dirty(user)
 
     async def handle_run(self, guild_id, attack, diplomacy, magic, shame=False):
         runners = []
@@ -1985,7 +2022,6 @@ class Adventure(
 
     async def handle_fight(self, guild_id, fumblelist, critlist, attack, magic):
         session = self._sessions[guild_id]
-        ctx = session.ctx
         fight_list = list(set(session.fight))
         magic_list = list(set(session.magic))
         attack_list = list(set(fight_list + magic_list))
@@ -2001,65 +2037,33 @@ class Adventure(
         else:
             return (fumblelist, critlist, attack, magic, "")
 
-        for user in fight_list:
-            try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
-            except Exception as exc:
-                log.exception("Error with the new character sheet", exc_info=exc)
-                continue
-            crit_mod = max(max(c.dex, c.luck // 2) + (c.total_att // 20), 0)  # Thanks GoaFan77
-            mod = 0
-            max_roll = 100 if c.rebirths >= 30 else 50 if c.rebirths >= 15 else 20
-            if crit_mod != 0:
-                mod = round(crit_mod / 10)
-            if c.rebirths < 15 < mod:
-                mod = 15
-                max_roll = 20
-            elif (mod + 1) > 45:
-                mod = 45
-
-            roll = max(session.rng.randint((1 + mod), max_roll), 1)
-            if c.heroclass.get("pet", {}).get("bonuses", {}).get("crit", False):
-                pet_crit = c.heroclass.get("pet", {}).get("bonuses", {}).get("crit", 0)
-                pet_crit = session.rng.randint(pet_crit, 100)
-                if pet_crit == 100:
-                    roll = max_roll
-                elif roll <= 25 and pet_crit >= 95:
-                    roll = session.rng.randint(max_roll - 5, max_roll)
-                elif roll > 25 and pet_crit >= 95:
-                    roll = session.rng.randint(roll, max_roll)
-            roll_perc = roll / max_roll
+        fighters = await session.characters.combatants(fight_list)
+        casters = await session.characters.combatants(magic_list)
+        attacks = combat.resolve([c for user, c in fighters], combat.FIGHT, pdef, session.rng)
+        spells = combat.resolve([c for user, c in casters], combat.MAGIC, mdef, session.rng)
+
+        for (user, c), outcome in zip(fighters, attacks):
+            attack += outcome.value
+            roll = outcome.roll
             att_value = c.total_att
-            rebirths = c.rebirths * (3 if c.hc is not HeroClasses.berserker else 1)
-            if roll_perc < 0.10:
-                if c.hc is HeroClasses.berserker and c.heroclass["ability"]:
-                    bonus_roll = session.rng.randint(5, 15)
-                    bonus_multi = session.rng.choice([0.2, 0.3, 0.4, 0.5])
-                    bonus = max(bonus_roll, int((roll + att_value + rebirths) * bonus_multi))
-                    attack += int((roll - bonus + att_value) / pdef)
-                    report += (
-                        f"{bold(user.display_name)}: "
-                        f"{self.emojis.dice}({roll}) + "
-                        f"{self.emojis.berserk}{humanize_number(bonus)} + "
-                        f"{self.emojis.attack}{str(humanize_number(att_value))}\n"
-                    )
-                else:
-                    msg += _("{user} fumbled the attack.\n").format(user=bold(user.display_name))
-                    fumblelist.append(user)
-                    fumble_count += 1
-            elif roll_perc > 0.95 or c.hc is HeroClasses.berserker:
+            if outcome.fumbled:
+                msg += _("{user} fumbled the attack.\n").format(user=bold(user.display_name))
+                fumblelist.append(user)
+                fumble_count += 1
+            elif outcome.bonus is not None:
+                report += (
+                    f"{bold(user.display_name)}: "
+                    f"{self.emojis.dice}({roll}) + "
+                    f"{self.emojis.berserk}{humanize_number(outcome.bonus)} + "
+                    f"{self.emojis.attack}{str(humanize_number(att_value))}\n"
+                )
+            elif outcome.base_bonus is not None:
                 crit_str = ""
-                crit_bonus = 0
-                base_bonus = session.rng.randint(5, 10) + rebirths
-                if roll_perc > 0.95:
+                if outcome.critical:
                     msg += _("{user} landed a critical hit.\n").format(user=bold(user.display_name))
                     critlist.append(user)
-                    crit_bonus = (session.rng.randint(5, 20)) + (rebirths * 2)
-                    crit_str = f"{self.emojis.crit} {humanize_number(crit_bonus)}"
-                if c.hc is HeroClasses.berserker and c.heroclass["ability"]:
-                    base_bonus = (session.rng.randint(1, 10) + 5) * (rebirths // 2)
-                base_str = f"{self.emojis.crit}️ {humanize_number(base_bonus)}"
-                attack += int((roll + base_bonus + crit_bonus + att_value) / pdef)
+                    crit_str = f"{self.emojis.crit} {humanize_number(outcome.crit_bonus)}"
+                base_str = f"{self.emojis.crit}️ {humanize_number(outcome.base_bonus)}"
                 bonus = base_str + crit_str
                 report += (
                     f"{bold(user.display_name)}: "
@@ -2068,7 +2072,6 @@ class Adventure(
                     f"{self.emojis.attack}{str(humanize_number(att_value))}\n"
                 )
             else:
-                attack += int((roll + att_value) / pdef) + rebirths
                 report += (
                     f"{bold(user.display_name)}: "
                     f"{self.emojis.dice}({roll}) + "
@@ -2076,64 +2079,28 @@ class Adventure(
                 )
             if session.insight[0] == 1 and user.id != session.insight[1].user.id:
                 attack += int(session.insight[1].total_att * 0.2)
-        for user in magic_list:
-            try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
-            except Exception as exc:
-                log.exception("Error with the new character sheet", exc_info=exc)
-                continue
-            crit_mod = max(max(c.dex, c.luck // 2) + (c.total_int // 20), 0)
-            mod = 0
-            max_roll = 100 if c.rebirths >= 30 else 50 if c.rebirths >= 15 else 20
-            if crit_mod != 0:
-                mod = round(crit_mod / 10)
-            if c.rebirths < 15 < mod:
-                mod = 15
-                max_roll = 20
-            elif (mod + 1) > 45:
-                mod = 45
-            roll = max(session.rng.randint((1 + mod), max_roll), 1)
-            if c.heroclass.get("pet", {}).get("bonuses", {}).get("crit", False):
-                pet_crit = c.heroclass.get("pet", {}).get("bonuses", {}).get("crit", 0)
-                pet_crit = session.rng.randint(pet_crit, 100)
-                if pet_crit == 100:
-                    roll = max_roll
-                elif roll <= 25 and pet_crit >= 95:
-                    roll = session.rng.randint(max_roll - 5, max_roll)
-                elif roll > 25 and pet_crit >= 95:
-                    roll = session.rng.randint(roll, max_roll)
-            roll_perc = roll / max_roll
+        for (user, c), outcome in zip(casters, spells):
+            magic += outcome.value
+            roll = outcome.roll
             int_value = c.total_int
-            rebirths = c.rebirths * (3 if c.hc is HeroClasses.wizard else 1)
-            if roll_perc < 0.10:
+            if outcome.fumbled:
                 msg += _("{}{} almost set themselves on fire.\n").format(failed_emoji, bold(user.display_name))
                 fumblelist.append(user)
                 fumble_count += 1
-                if c.hc is HeroClasses.wizard and c.heroclass["ability"]:
-                    bonus_roll = session.rng.randint(5, 15)
-                    bonus_multi = session.rng.choice([0.2, 0.3, 0.4, 0.5])
-                    bonus = max(bonus_roll, int((roll + int_value + rebirths) * bonus_multi))
-                    magic += int((roll - bonus + int_value) / mdef)
+                if outcome.bonus is not None:
                     report += (
                         f"{bold(user.display_name)}: "
                         f"{self.emojis.dice}({roll}) + "
-                        f"{self.emojis.magic_crit}{humanize_number(bonus)} + "
+                        f"{self.emojis.magic_crit}{humanize_number(outcome.bonus)} + "
                         f"{self.emojis.magic}{str(humanize_number(int_value))}\n"
                     )
-            elif roll_perc > 0.95 or (c.hc is HeroClasses.wizard):
+            elif outcome.base_bonus is not None:
                 crit_str = ""
-                crit_bonus = 0
-                base_bonus = session.rng.randint(5, 10) + rebirths
-                base_str = f"{self.emojis.magic_crit}️ {humanize_number(base_bonus)}"
-                if roll_perc > 0.95:
+                if outcome.critical:
                     msg += _("{} had a surge of energy.\n").format(bold(user.display_name))
                     critlist.append(user)
-                    crit_bonus = (session.rng.randint(5, 20)) + (rebirths * 2)
-                    crit_str = f"{self.emojis.crit} {humanize_number(crit_bonus)}"
-                if c.hc is HeroClasses.wizard and c.heroclass["ability"]:
-                    base_bonus = (session.rng.randint(1, 10) + 5) * (rebirths // 2)
-                    base_str = f"{self.emojis.magic_crit}️ {humanize_number(base_bonus)}"
-                magic += int((roll + base_bonus + crit_bonus + int_value) / mdef)
+                    crit_str = f"{self.emojis.crit} {humanize_number(outcome.crit_bonus)}"
+                base_str = f"{self.emojis.magic_crit}️ {humanize_number(outcome.base_bonus)}"
                 bonus = base_str + crit_str
                 report += (
                     f"{bold(user.display_name)}: "
@@ -2142,7 +2109,6 @@ class Adventure(
                     f"{self.emojis.magic}{humanize_number(int_value)}\n"
                 )
             else:
-                magic += int((roll + int_value) / mdef) + c.rebirths // 5
                 report += (
                     f"{bold(user.display_name)}: "
                     f"{self.emojis.dice}({roll}) + "
@@ -2166,54 +2132,32 @@ class Adventure(
 
     async def handle_pray(self, guild_id, fumblelist, attack, diplomacy, magic):
         session = self._sessions[guild_id]
-        ctx = session.ctx
         talk_list = list(set(session.talk))
         pray_list = list(set(session.pray))
         fight_list = list(set(session.fight))
         magic_list = list(set(session.magic))
-        god = await self.config.god_name()
-        guild_god_name = await self.config.guild(self.bot.get_guild(guild_id)).god_name()
+        god = self.settings["god_name"]
+        guild_god_name = self.settings.guild(session.guild)["god_name"]
         if guild_god_name:
             god = guild_god_name
         msg = ""
         failed_emoji = self.emojis.fumble
-        for user in pray_list:
-            try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
-            except Exception as exc:
-                log.exception("Error with the new character sheet", exc_info=exc)
-                continue
-            rebirths = c.rebirths * (2 if c.hc is HeroClasses.cleric else 1)
-            if c.hc is HeroClasses.cleric:
-                crit_mod = max(max(c.dex, c.luck // 2) + (c.total_int // 20), 0)
-                mod = 0
-                max_roll = 100 if c.rebirths >= 30 else 50 if c.rebirths >= 15 else 20
-                if crit_mod != 0:
-                    mod = round(crit_mod / 10)
-                if c.rebirths < 15 < mod:
-                    mod = 15
-                    max_roll = 20
-                elif (mod + 1) > 45:
-                    mod = 45
-                roll = max(session.rng.randint((1 + mod), max_roll), 1)
-                roll_perc = roll / max_roll
-                if len(fight_list + talk_list + magic_list) == 0:
+        alone = len(fight_list + talk_list + magic_list) == 0
+        prayers = await session.characters.combatants(pray_list)
+        blessings = [
+            combat.pray(c, len(fight_list), len(talk_list), len(magic_list), session.rng) for user, c in prayers
+        ]
+        for (user, c), blessing in zip(prayers, blessings):
+            attack += blessing.attack
+            diplomacy += blessing.diplomacy
+            magic += blessing.magic
+            roll = blessing.roll
+            if blessing.cleric:
+                if alone:
                     msg += _("{} blessed like a madman but nobody was there to receive it.\n").format(
                         bold(user.display_name)
                     )
-                if roll_perc < 0.15:
-                    pray_att_bonus = 0
-                    pray_diplo_bonus = 0
-                    pray_magic_bonus = 0
-                    if fight_list:
-                        pray_att_bonus = (5 * len(fight_list)) - ((5 * len(fight_list)) * max(rebirths * 0.01, 1.5))
-                    if talk_list:
-                        pray_diplo_bonus = (5 * len(talk_list)) - ((5 * len(talk_list)) * max(rebirths * 0.01, 1.5))
-                    if magic_list:
-                        pray_magic_bonus = (5 * len(magic_list)) - ((5 * len(magic_list)) * max(rebirths * 0.01, 1.5))
-                    attack -= pray_att_bonus
-                    diplomacy -= pray_diplo_bonus
-                    magic -= pray_magic_bonus
+                if blessing.fumbled:
                     fumblelist.append(user)
                     msg += _(
                         "{user}'s sermon offended the mighty {god}. {failed_emoji}"
@@ -2225,33 +2169,13 @@ class Adventure(
                         attack=self.emojis.attack,
                         talk=self.emojis.talk,
                         magic=self.emojis.magic,
-                        len_f_list=humanize_number(pray_att_bonus),
-                        len_t_list=humanize_number(pray_diplo_bonus),
-                        len_m_list=humanize_number(pray_magic_bonus),
+                        len_f_list=humanize_number(-blessing.attack),
+                        len_t_list=humanize_number(-blessing.diplomacy),
+                        len_m_list=humanize_number(-blessing.magic),
                         roll_emoji=self.emojis.dice,
                         roll=roll,
                     )
                 else:
-                    mod = roll // 3 if not c.heroclass["ability"] else roll
-                    pray_att_bonus = 0
-                    pray_diplo_bonus = 0
-                    pray_magic_bonus = 0
-
-                    if fight_list:
-                        pray_att_bonus = int(
-                            (mod * len(fight_list)) + ((mod * len(fight_list)) * max(rebirths * 0.05, 1.5))
-                        )
-                    if talk_list:
-                        pray_diplo_bonus = int(
-                            (mod * len(talk_list)) + ((mod * len(talk_list)) * max(rebirths * 0.05, 1.5))
-                        )
-                    if magic_list:
-                        pray_magic_bonus = int(
-                            (mod * len(magic_list)) + ((mod * len(magic_list)) * max(rebirths * 0.05, 1.5))
-                        )
-                    attack += pray_att_bonus
-                    magic += pray_magic_bonus
-                    diplomacy += pray_diplo_bonus
                     if roll == 50:
                         roll_msg = _(
                             "{user} turned into an avatar of mighty {god}. "
@@ -2268,57 +2192,37 @@ class Adventure(
                         attack=self.emojis.attack,
                         talk=self.emojis.talk,
                         magic=self.emojis.magic,
-                        len_f_list=humanize_number(pray_att_bonus),
-                        len_t_list=humanize_number(pray_diplo_bonus),
-                        len_m_list=humanize_number(pray_magic_bonus),
+                        len_f_list=humanize_number(blessing.attack),
+                        len_t_list=humanize_number(blessing.diplomacy),
+                        len_m_list=humanize_number(blessing.magic),
                         roll_emoji=self.emojis.dice,
                         roll=roll,
                     )
+            elif alone:
+                msg += _("{} prayed like a madman but nobody else helped them.\n").format(bold(user.display_name))
+            elif blessing.fumbled:
+                fumblelist.append(user)
+                msg += _("{}{}'s prayers went unanswered.\n").format(failed_emoji, bold(user.display_name))
             else:
-                roll = session.rng.randint(1, 10)
-                if len(fight_list + talk_list + magic_list) == 0:
-                    msg += _("{} prayed like a madman but nobody else helped them.\n").format(bold(user.display_name))
-
-                elif roll == 5:
-                    attack_buff = 0
-                    talk_buff = 0
-                    magic_buff = 0
-                    if fight_list:
-                        attack_buff = 10 * (len(fight_list) + rebirths // 15)
-                    if talk_list:
-                        talk_buff = 10 * (len(talk_list) + rebirths // 15)
-                    if magic_list:
-                        magic_buff = 10 * (len(magic_list) + rebirths // 15)
-
-                    attack += attack_buff
-                    magic += magic_buff
-                    diplomacy += talk_buff
-                    msg += _(
-                        "{user}'s prayer called upon the mighty {god} to help you. "
-                        "(+{len_f_list}{attack}/+{len_t_list}{talk}/+{len_m_list}{magic}) {roll_emoji}({roll})\n"
-                    ).format(
-                        user=bold(user.display_name),
-                        god=god,
-                        attack=self.emojis.attack,
-                        talk=self.emojis.talk,
-                        magic=self.emojis.magic,
-                        len_f_list=humanize_number(attack_buff),
-                        len_t_list=humanize_number(talk_buff),
-                        len_m_list=humanize_number(magic_buff),
-                        roll_emoji=self.emojis.dice,
-                        roll=roll,
-                    )
-                else:
-                    fumblelist.append(user)
-                    msg += _("{}{}'s prayers went unanswered.\n").format(failed_emoji, bold(user.display_name))
-        for user in fumblelist:
-            if user in pray_list:
-                pray_list.remove(user)
+                msg += _(
+                    "{user}'s prayer called upon the mighty {god} to help you. "
+                    "(+{len_f_list}{attack}/+{len_t_list}{talk}/+{len_m_list}{magic}) {roll_emoji}({roll})\n"
+                ).format(
+                    user=bold(user.display_name),
+                    god=god,
+                    attack=self.emojis.attack,
+                    talk=self.emojis.talk,
+                    magic=self.emojis.magic,
+                    len_f_list=humanize_number(blessing.attack),
+                    len_t_list=humanize_number(blessing.diplomacy),
+                    len_m_list=humanize_number(blessing.magic),
+                    roll_emoji=self.emojis.dice,
+                    roll=roll,
+                )
         return (fumblelist, attack, diplomacy, magic, msg)
 
     async def handle_talk(self, guild_id, fumblelist, critlist, diplomacy):
         session = self._sessions[guild_id]
-        ctx = session.ctx
         cdef = max(session.monster_modified_stats["cdef"], 0.5)
         talk_list = list(set(session.talk))
         if len(talk_list) >= 1:
@@ -2328,48 +2232,26 @@ class Adventure(
         else:
             return (fumblelist, critlist, diplomacy, "")
         failed_emoji = self.emojis.fumble
-        for user in talk_list:
-            try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
-            except Exception as exc:
-                log.exception("Error with the new character sheet", exc_info=exc)
-                continue
-            crit_mod = max(max(c.dex, c.luck // 2) + (c.total_int // 50) + (c.total_cha // 20), 0)
-            mod = 0
-            max_roll = 100 if c.rebirths >= 30 else 50 if c.rebirths >= 15 else 20
-            if crit_mod != 0:
-                mod = round(crit_mod / 10)
-            if c.rebirths < 15 < mod:
-                mod = 15
-            elif (mod + 1) > 45:
-                mod = 45
-            roll = max(session.rng.randint((1 + mod), max_roll), 1)
+        talkers = await session.characters.combatants(talk_list)
+        arguments = combat.resolve([c for user, c in talkers], combat.TALK, cdef, session.rng)
+        for (user, c), outcome in zip(talkers, arguments):
+            diplomacy += outcome.value
+            roll = outcome.roll
             dipl_value = c.total_cha
-            rebirths = c.rebirths * (3 if c.hc is HeroClasses.bard else 1)
-            roll_perc = roll / max_roll
-            if roll_perc < 0.10:
-                if c.hc is HeroClasses.bard and c.heroclass["ability"]:
-                    bonus = session.rng.randint(5, 15)
-                    diplomacy += int((roll - bonus + dipl_value + rebirths) / cdef)
-                    report += f"{bold(user.display_name)} " f"🎲({roll}) +💥{bonus} +🗨{humanize_number(dipl_value)} | "
-                else:
-                    msg += _("{}{} accidentally offended the enemy.\n").format(failed_emoji, bold(user.display_name))
-                    fumblelist.append(user)
-                    fumble_count += 1
-            elif roll_perc > 0.95 or c.hc is HeroClasses.bard:
+            if outcome.fumbled:
+                msg += _("{}{} accidentally offended the enemy.\n").format(failed_emoji, bold(user.display_name))
+                fumblelist.append(user)
+                fumble_count += 1
+            elif outcome.bonus is not None:
+                bonus = outcome.bonus
+                report += f"{bold(user.display_name)} " f"🎲({roll}) +💥{bonus} +🗨{humanize_number(dipl_value)} | "
+            elif outcome.base_bonus is not None:
                 crit_str = ""
-                crit_bonus = 0
-                base_bonus = session.rng.randint(5, 10) + rebirths
-                if roll_perc > 0.95:
+                if outcome.critical:
                     msg += _("{} made a compelling argument.\n").format(bold(user.display_name))
                     critlist.append(user)
-                    crit_bonus = (session.rng.randint(5, 20)) + (rebirths * 2)
-                    crit_str = f"{self.emojis.crit} {crit_bonus}"
-
-                if c.hc is HeroClasses.bard and c.heroclass["ability"]:
-                    base_bonus = (session.rng.randint(1, 10) + 5) * (rebirths // 2)
-                base_str = f"🎵 {humanize_number(base_bonus)}"
-                diplomacy += int((roll + base_bonus + crit_bonus + dipl_value) / cdef)
+                    crit_str = f"{self.emojis.crit} {outcome.crit_bonus}"
+                base_str = f"🎵 {humanize_number(outcome.base_bonus)}"
                 bonus = base_str + crit_str
                 report += (
                     f"{bold(user.display_name)} "
@@ -2378,7 +2260,6 @@ class Adventure(
                     f"{self.emojis.talk}{humanize_number(dipl_value)}\n"
                 )
             else:
-                diplomacy += int((roll + dipl_value + c.rebirths // 5) / cdef)
                 report += (
                     f"{bold(user.display_name)} "
                     f"{self.emojis.dice}({roll}) + "
@@ -2415,7 +2296,7 @@ class Adventure(
             elif req_item == "item":
                 for user in participants:  # check if any fighter has an equipped mirror shield to give them a chance.
                     try:
-                        c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                        c = await session.characters.get(user)
                     except Exception as exc:
                         log.exception("Error with the new character sheet", exc_info=exc)
                         continue
@@ -2439,11 +2320,20 @@ class Adventure(
         return failed
 
     async def _add_rewards(
-        self, ctx: commands.Context, user: Union[discord.Member, discord.User], exp: int, cp: int, special: Treasure
+        self,
+        ctx: commands.Context,
+        user: Union[discord.Member, discord.User],
+        exp: int,
+        cp: int,
+        special: Treasure,
+        characters: Optional[SessionCharacters] = None,
     ) -> Optional[str]:
         async with self.get_lock(user):
             try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                if characters is not None:
+                    c = await characters.get(user)
+                else:
+                    c = await self.character_store.load(ctx, user)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -2507,36 +2397,25 @@ class Adventure(
                         special.legendary += 1
             if special:
                 c.treasure += special
-            await self.config.user(user).set(await c.to_json(ctx, self.config))
+            if characters is not None:
+                characters.mark_dirty(user)
+            else:
+                await self.character_store.save(ctx, user, c)
             return rebirth_text
 
-    async def _adv_countdown(self, ctx: commands.Context, seconds, title) -> asyncio.Task:
+    async def _adv_countdown(self, ctx: commands.Context, seconds, title) -> Deadline:
         await self._data_check(ctx)
+        secondint = int(seconds)
+        message_adv = await ctx.send(f"⏳ [{title}] <t:{int(time.time() + secondint)}:R>")
 
-        async def adv_countdown():
-            secondint = int(seconds)
-            adv_end = await _get_epoch(secondint)
-            timer, done, sremain = await _remaining(adv_end)
-            timer = f"<t:{int(adv_end)}:R>"
-            message_adv = await ctx.send(f"⏳ [{title}] {timer}")
-            deleted = False
-            while not done:
-                timer, done, sremain = await _remaining(adv_end)
-                self._adventure_countdown[ctx.guild.id] = (timer, done, sremain)
-                if done:
-                    if not deleted:
-                        await message_adv.delete()
-                    break
-                await asyncio.sleep(1)
+        async def countdown_done():
             log.debug("Timer countdown done.")
+            with contextlib.suppress(discord.HTTPException):
+                await message_adv.delete()
 
-        return ctx.bot.loop.create_task(adv_countdown())
+        return self.scheduler.schedule(("adventure", ctx.guild.id), secondint, countdown_done)
 
     async def _data_check(self, ctx: commands.Context):
-        try:
-            self._adventure_countdown[ctx.guild.id]
-        except KeyError:
-            self._adventure_countdown[ctx.guild.id] = 0
         try:
             self._rewards[ctx.author.id]
         except KeyError:
@@ -2548,34 +2427,33 @@ class Adventure(
 
     @commands.Cog.listener()
     async def on_message_without_command(self, message):
+        # Nearly every message the bot sees ends here, so nothing is awaited until
+        # the message is known to be in a cart channel.
+        if message.channel.id not in self.settings.cart_channels or message.guild is None:
+            return
         await self._ready_event.wait()
         if self.red_340_or_newer:
-            if message.guild is not None:
-                if await self.bot.cog_disabled_in_guild(self, message.guild):
-                    return
-            else:
+            if await self.bot.cog_disabled_in_guild(self, message.guild):
                 return
-        channels = await self.config.guild(message.guild).cart_channels()
-        if not channels:
-            return
-        if message.channel.id not in channels:
-            return
         if not message.author.bot and message.guild.id not in self._sessions:
             roll = random.randint(1, 20)
-            if roll == 20:
+            # A cart already on its way isn't held back by later rolls
+            if roll == 20 and ("cart spawn", message.guild.id) not in self.scheduler:
                 try:
                     self._last_trade[message.guild.id]
                 except KeyError:
                     self._last_trade[message.guild.id] = 0
-                ctx = await self.bot.get_context(message)
-                ctx.command = self.makecart
-                await asyncio.sleep(5)
-                timeout = await self.config.guild(ctx.guild).cart_timeout()
-                trader = Trader(timeout, ctx, self)
-                await trader.start(ctx)
-                await asyncio.sleep(timeout)
-                trader.stop()
-                await trader.on_timeout()
+                self.scheduler.schedule(("cart spawn", message.guild.id), 5, lambda: self._spawn_cart(message))
+
+    async def _spawn_cart(self, message: discord.Message):
+        ctx = await self.bot.get_context(message)
+        ctx.command = self.makecart
+        timeout = self.settings.guild(ctx.guild)["cart_timeout"]
+        trader = Trader(timeout, ctx, self)
+        await trader.start(ctx)
+        if trader.message is not None:
+            # The trader doesn't come when the last one left too recently
+            self.scheduler.schedule(("cart", ctx.guild.id), timeout, trader.leave)
 
     async def _roll_chest(self, chest_type: Rarities, c: Character) -> Item:
         # set rarity to chest by default
@@ -2660,7 +2538,7 @@ class Adventure(
         currency_name = await bank.get_currency_name(
             ctx.guild,
         )
-        can_embed = not ctx.guild or (await _config.guild(ctx.guild).embed() and await ctx.embed_requested())
+        can_embed = not ctx.guild or (self.settings.guild(ctx.guild)["embed"] and await ctx.embed_requested())
         session = self._sessions.get(ctx.guild.id)
         if session:
             session_bonus = 0 if session.easy_mode else 1
@@ -2669,7 +2547,10 @@ class Adventure(
         async for user in AsyncIter(userlist, steps=100):
             self._rewards[user.id] = {}
             try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                if session:
+                    c = await session.characters.get(user)
+                else:
+                    c = await self.character_store.load(ctx, user)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 continue
@@ -2755,13 +2636,11 @@ class Adventure(
             )
         return phrase
 
-    def cog_unload(self):
-        if self.cleanup_loop:
-            self.cleanup_loop.cancel()
+    async def cog_unload(self):
+        await self.character_store.stop()
         if self._init_task:
             self._init_task.cancel()
-        if self.gb_task:
-            self.gb_task.cancel()
+        self.scheduler.close()
 
         for msg_id, task in self.tasks.items():
             task.cancel()
@@ -14,7 +14,6 @@ from redbot.core.utils.chat_formatting import bold, box, humanize_list, humanize
 
 from .abc import AdventureMixin
 from .bank import bank
-from .charsheet import Character
 from .constants import Slot
 from .converters import DayConverter, PercentageConverter, parse_timedelta
 from .helpers import has_separated_economy, smart_embed
@@ -71,13 +70,13 @@ class AdventureSetCommands(AdventureMixin):
         if percentage < 0 or percentage > 100:
             return await smart_embed(ctx, _("Percentage has to be between 0 and 100."))
         if not await bank.is_global():
-            await self.config.guild(ctx.guild).rebirth_cost.set(percentage)
+            await self.settings.set_guild(ctx.guild, "rebirth_cost", percentage)
             await smart_embed(
                 ctx,
                 _("I will now charge {0:.0%} of the user's balance for a rebirth.").format(percentage / 100),
             )
         else:
-            await self.config.rebirth_cost.set(percentage)
+            await self.settings.set("rebirth_cost", percentage)
             await smart_embed(
                 ctx,
                 _("I will now charge {0:.0%} of the user's global balance for a rebirth.").format(percentage / 100),
@@ -88,10 +87,10 @@ class AdventureSetCommands(AdventureMixin):
     async def cartroom(self, ctx: commands.Context, room: discord.TextChannel = None):
         """[Admin] Lock carts to a specific text channel."""
         if room is None:
-            await self.config.guild(ctx.guild).cartroom.set(None)
+            await self.settings.set_guild(ctx.guild, "cartroom", None)
             return await smart_embed(ctx, _("Done, carts will be able to appear in any text channel the bot can see."))
 
-        await self.config.guild(ctx.guild).cartroom.set(room.id)
+        await self.settings.set_guild(ctx.guild, "cartroom", room.id)
         await smart_embed(ctx, _("Done, carts will only appear in {room.mention}.").format(room=room))
 
     @adventureset.group(name="locks")
@@ -118,9 +117,9 @@ class AdventureSetCommands(AdventureMixin):
         **percentage** must be between 0% and 100%.
         """
         day_val, day_text = day
-        async with self.config.daily_bonus.all() as daily_bonus_data:
-            daily_bonus_data[day_val] = percentage
-            self._daily_bonus = daily_bonus_data.copy()
+        daily_bonus_data = {**self.settings["daily_bonus"], day_val: percentage}
+        await self.settings.set("daily_bonus", daily_bonus_data)
+        self._daily_bonus = daily_bonus_data.copy()
         await smart_embed(
             ctx,
             _("Daily bonus for `{0}` has been set to: {1:.0%}").format(day_text.title(), percentage),
@@ -138,10 +137,23 @@ class AdventureSetCommands(AdventureMixin):
     @commands.is_owner()
     async def restrict(self, ctx: commands.Context):
         """[Owner] Set whether or not adventurers are restricted to one adventure at a time."""
-        toggle = await self.config.restrict()
-        await self.config.restrict.set(not toggle)
+        toggle = self.settings["restrict"]
+        await self.settings.set("restrict", not toggle)
         await smart_embed(ctx, _("Adventurers restricted to one adventure at a time: {}").format(not toggle))
 
+    @adventureset.command(name="updateinterval")
+    @commands.is_owner()
+    async def update_interval(self, ctx: commands.Context, seconds: float):
+        """[Owner] Set how often adventure messages are edited to show who joined.
+
+        Clicks in between are shown together with the next edit.
+        Default is 2 seconds.
+        """
+        if not 0 <= seconds <= 30:
+            return await smart_embed(ctx, _("The update interval must be between 0 and 30 seconds."))
+        await self.settings.set("session_update_interval", seconds)
+        await smart_embed(ctx, _("Adventure messages will be updated at most every {} seconds.").format(seconds))
+
     @adventureset.command()
     @commands.is_owner()
     async def easymode(self, ctx: commands.Context):
@@ -149,8 +161,8 @@ class AdventureSetCommands(AdventureMixin):
 
         Easy mode gives less rewards, but monster information is shown.
         """
-        toggle = await self.config.easy_mode()
-        await self.config.easy_mode.set(not toggle)
+        toggle = self.settings["easy_mode"]
+        await self.settings.set("easy_mode", not toggle)
         await smart_embed(
             ctx, _("Adventure easy mode is now {}.").format(bold(_("Enabled") if not toggle else _("Disabled")))
         )
@@ -159,8 +171,8 @@ class AdventureSetCommands(AdventureMixin):
     @commands.is_owner()
     async def sepcurrency(self, ctx: commands.Context):
         """[Owner] Toggle whether the currency should be separated from main bot currency."""
-        toggle = await self.config.separate_economy()
-        await self.config.separate_economy.set(not toggle)
+        toggle = self.settings["separate_economy"]
+        await self.settings.set("separate_economy", not toggle)
         self._separate_economy = not toggle
         await smart_embed(
             ctx, _("Adventurer currency is: {}").format(bold(_("Separated") if not toggle else _("Unified")))
@@ -189,9 +201,9 @@ class AdventureSetCommands(AdventureMixin):
             if int(k) >= 0 and 0 <= float(v) <= 1:
                 new_taxes[k] = float(v)
         new_taxes = {k: v for k, v in sorted(new_taxes.items(), key=lambda item: item[1])}
-        await self.config.tax_brackets.set(new_taxes)
+        await self.settings.set("tax_brackets", new_taxes)
 
-        taxes = await self.config.tax_brackets()
+        taxes = self.settings["tax_brackets"]
         table = BeautifulTable(default_alignment=ALIGN_LEFT, maxwidth=500)
         table.set_style(BeautifulTable.STYLE_RST)
         table.columns.header = ["Tax %", "Tax Threshold"]
@@ -216,8 +228,8 @@ class AdventureSetCommands(AdventureMixin):
         """
         if rate_in < 0 or rate_out < 0:
             return await smart_embed(ctx, _("You are evil ... please DM me your phone number we need to hangout."))
-        await self.config.to_conversion_rate.set(rate_in)
-        await self.config.from_conversion_rate.set(rate_out)
+        await self.settings.set("to_conversion_rate", rate_in)
+        await self.settings.set("from_conversion_rate", rate_out)
         await smart_embed(
             ctx,
             _("1 {name} will be worth {rate_in} {a_name}.\n{rate_out} {a_name} will convert into 1 {name}").format(
@@ -234,9 +246,9 @@ class AdventureSetCommands(AdventureMixin):
         if amount < 0:
             return await smart_embed(ctx, _("You are evil ... please DM me your phone number we need to hangout."))
         if await bank.is_global(_forced=True):
-            await self.config.max_allowed_withdraw.set(amount)
+            await self.settings.set("max_allowed_withdraw", amount)
         else:
-            await self.config.guild(ctx.guild).max_allowed_withdraw.set(amount)
+            await self.settings.set_guild(ctx.guild, "max_allowed_withdraw", amount)
         await smart_embed(
             ctx,
             _(
@@ -252,11 +264,11 @@ class AdventureSetCommands(AdventureMixin):
         """[Admin] Toggle whether users are allowed to withdraw from adventure currency to main currency."""
 
         if await bank.is_global(_forced=True):
-            state = await self.config.disallow_withdraw()
-            await self.config.disallow_withdraw.set(not state)
+            state = self.settings["disallow_withdraw"]
+            await self.settings.set("disallow_withdraw", not state)
         else:
-            state = await self.config.guild(ctx.guild).disallow_withdraw()
-            await self.config.guild(ctx.guild).disallow_withdraw.set(not state)
+            state = self.settings.guild(ctx.guild)["disallow_withdraw"]
+            await self.settings.set_guild(ctx.guild, "disallow_withdraw", not state)
 
         await smart_embed(
             ctx,
@@ -276,7 +288,7 @@ class AdventureSetCommands(AdventureMixin):
         if time_in_seconds < 30:
             return await smart_embed(ctx, _("Cooldown cannot be set to less than 30 seconds."))
 
-        await self.config.guild(ctx.guild).cooldown_timer_manual.set(time_in_seconds)
+        await self.settings.set_guild(ctx.guild, "cooldown_timer_manual", time_in_seconds)
         await smart_embed(
             ctx,
             _("Adventure cooldown set to {cooldown} seconds.").format(cooldown=time_in_seconds),
@@ -297,37 +309,37 @@ class AdventureSetCommands(AdventureMixin):
     @commands.admin_or_permissions(administrator=True)
     async def god(self, ctx: commands.Context, *, name):
         """[Admin] Set the server's name of the god."""
-        await self.config.guild(ctx.guild).god_name.set(name)
+        await self.settings.set_guild(ctx.guild, "god_name", name)
         await ctx.tick()
 
     @adventureset.command()
     @commands.is_owner()
     async def globalgod(self, ctx: commands.Context, *, name):
         """[Owner] Set the default name of the god."""
-        await self.config.god_name.set(name)
+        await self.settings.set("god_name", name)
         await ctx.tick()
 
     @adventureset.command(aliases=["embed"])
     @commands.admin_or_permissions(administrator=True)
     async def embeds(self, ctx: commands.Context):
         """[Admin] Set whether or not to use embeds for the adventure game."""
-        toggle = await self.config.guild(ctx.guild).embed()
-        await self.config.guild(ctx.guild).embed.set(not toggle)
+        toggle = self.settings.guild(ctx.guild)["embed"]
+        await self.settings.set_guild(ctx.guild, "embed", not toggle)
         await smart_embed(ctx, _("Embeds: {}").format(not toggle))
 
     @adventureset.command(aliases=["chests"], enabled=False, hidden=True)
     @commands.is_owner()
     async def cartchests(self, ctx: commands.Context):
         """[Admin] Set whether or not to sell chests in the cart."""
-        toggle = await self.config.enable_chests()
-        await self.config.enable_chests.set(not toggle)
+        toggle = self.settings["enable_chests"]
+        await self.settings.set("enable_chests", not toggle)
         await smart_embed(ctx, _("Carts can sell chests: {}").format(not toggle))
 
     @adventureset.command()
     @commands.admin_or_permissions(administrator=True)
     async def cartname(self, ctx: commands.Context, *, name):
         """[Admin] Set the server's name of the cart."""
-        await self.config.guild(ctx.guild).cart_name.set(name)
+        await self.settings.set_guild(ctx.guild, "cart_name", name)
         await ctx.tick()
 
     @adventureset.command()
@@ -342,13 +354,13 @@ class AdventureSetCommands(AdventureMixin):
         if time_delta is None:
             return await smart_embed(ctx, _("You must supply a amount and time unit like `120 seconds`."))
         if time_delta.total_seconds() < 600:
-            cartname = await self.config.guild(ctx.guild).cart_name()
+            cartname = self.settings.guild(ctx.guild)["cart_name"]
             if not cartname:
-                cartname = await self.config.cart_name()
+                cartname = self.settings["cart_name"]
             return await smart_embed(
                 ctx, _("{} doesn't have the energy to return that often. Try 10 minutes or more.").format(cartname)
             )
-        await self.config.guild(ctx.guild).cart_timeout.set(int(time_delta.total_seconds()))
+        await self.settings.set_guild(ctx.guild, "cart_timeout", int(time_delta.total_seconds()))
         await ctx.tick()
 
     @adventureset.command(name="clear")
@@ -356,6 +368,7 @@ class AdventureSetCommands(AdventureMixin):
     async def clear_user(self, ctx: commands.Context, users: commands.Greedy[discord.User]):
         """[Owner] Lets you clear multiple users character sheets."""
         for user in users:
+            self.character_store.invalidate(user.id)
             await self.config.user(user).clear()
             await smart_embed(ctx, _("{user}'s character sheet has been erased.").format(user=user))
 
@@ -371,7 +384,7 @@ class AdventureSetCommands(AdventureMixin):
         async with self.get_lock(user):
             item = None
             try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                c = await self.character_store.load(ctx, user)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -392,15 +405,15 @@ class AdventureSetCommands(AdventureMixin):
                         ctx, _("{} does not have an item named `{}`.").format(bold(user), full_item_name)
                     )
             with contextlib.suppress(KeyError):
-                del c.backpack[item.name]
-            await self.config.user(user).set(await c.to_json(self.config))
+                c.remove_from_backpack(item, c.backpack[item.name].owned)
+            await self.character_store.save(ctx, user, c)
         await ctx.send(_("{item} removed from {user}.").format(item=box(str(item), lang="ansi"), user=bold(user)))
 
     @adventureset.command()
     @commands.is_owner()
     async def globalcartname(self, ctx: commands.Context, *, name):
         """[Owner] Set the default name of the cart."""
-        await self.config.cart_name.set(name)
+        await self.settings.set("cart_name", name)
         await ctx.tick()
 
     @adventureset.command()
@@ -412,7 +425,7 @@ class AdventureSetCommands(AdventureMixin):
         More info can be found at: <https://github.com/aikaterna/gobcog#make-your-own-adventure-theme>
         """
         if theme == "default":
-            await self.config.theme.set("default")
+            await self.settings.set("theme", "default")
             await smart_embed(ctx, _("Going back to the default theme."))
             await self.initialize()
             return
@@ -443,7 +456,7 @@ class AdventureSetCommands(AdventureMixin):
             )
             return
         else:
-            await self.config.theme.set(theme)
+            await self.settings.set("theme", theme)
             await ctx.tick()
         await self.initialize()
 
@@ -457,9 +470,7 @@ class AdventureSetCommands(AdventureMixin):
         Use `[p]adventureset cart` with no arguments to show the channel list.
         """
 
-        channel_list = await self.config.guild(ctx.guild).cart_channels()
-        if not channel_list:
-            channel_list = []
+        channel_list = list(self.settings.guild(ctx.guild)["cart_channels"] or [])
         if channel is None:
             msg = _("Active Cart Channels:\n")
             if not channel_list:
@@ -471,24 +482,24 @@ class AdventureSetCommands(AdventureMixin):
                 msg += "\n".join(chan.name for chan in name_list)
             return await ctx.send(box(msg))
         elif channel.id in channel_list:
-            new_channels = channel_list.remove(channel.id)
+            channel_list.remove(channel.id)
             await smart_embed(
                 ctx,
                 _("The {} channel has been removed from the cart delivery list.").format(channel),
             )
-            return await self.config.guild(ctx.guild).cart_channels.set(new_channels)
+            return await self.settings.set_guild(ctx.guild, "cart_channels", channel_list)
         else:
             channel_list.append(channel.id)
             await smart_embed(ctx, _("The {} channel has been added to the cart delivery list.").format(channel))
-            await self.config.guild(ctx.guild).cart_channels.set(channel_list)
+            await self.settings.set_guild(ctx.guild, "cart_channels", channel_list)
 
     @commands.guild_only()
     @adventureset.command()
     @commands.cooldown(rate=1, per=4, type=commands.BucketType.guild)
     async def showsettings(self, ctx: commands.Context):
         """Display current settings."""
-        global_data = await self.config.all()
-        guild_data = await self.config.guild(ctx.guild).all()
+        global_data = self.settings
+        guild_data = self.settings.guild(ctx.guild)
         is_owner = await self.bot.is_owner(ctx.author)
         theme = global_data["theme"]
         god_name = global_data["god_name"] if not guild_data["god_name"] else guild_data["god_name"]
@@ -593,6 +604,9 @@ class AdventureSetCommands(AdventureMixin):
         msg += _("[Multi-adventure restriction]:          {single_adventure_restrict}\n").format(
             single_adventure_restrict=single_adventure_restrict
         )
+        msg += _("[Adventure update interval]:            {interval} seconds\n").format(
+            interval=global_data["session_update_interval"]
+        )
         msg += _("[Post-adventure cooldown (hh:mm:ss)]:   {time_after_adventure}\n\n").format(
             time_after_adventure=time_after_adventure
         )
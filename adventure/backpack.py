@@ -27,6 +27,7 @@ from .converters import (
 )
 from .helpers import ConfirmView, _sell, escape, is_dev, smart_embed
 from .menus import BackpackMenu, BackpackSource, BaseMenu, SimpleSource
+from .pages import boxed_pages
 
 _ = Translator("Adventure", __file__)
 
@@ -46,7 +47,7 @@ class BackpackSellView(discord.ui.View):
     async def final_message(self, msg: str, interaction: discord.Interaction, character: Character):
         character.last_known_currency = await bank.get_balance(self.ctx.author)
         character.last_currency_check = time.time()
-        await self.cog.config.user(self.ctx.author).set(await character.to_json(self.ctx, self.cog.config))
+        await self.cog.character_store.save(self.ctx, self.ctx.author, character)
         self.stop()
         pages = [page for page in pagify(msg, delims=["\n"], page_length=1900)]
         await BaseMenu(
@@ -73,7 +74,7 @@ class BackpackSellView(discord.ui.View):
         # sell one of the item
         async with self.cog.get_lock(self.author):
             try:
-                character = await Character.from_json(self.ctx, self.cog.config, self.author, self.cog._daily_bonus)
+                character = await self.cog.character_store.load(self.ctx, self.author)
             except Exception as exc:
                 self.ctx.command.reset_cooldown(self.ctx)
                 log.exception("Error with the new character sheet", exc_info=exc)
@@ -89,9 +90,7 @@ class BackpackSellView(discord.ui.View):
                 price=humanize_number(price),
                 currency_name=currency_name,
             )
-            character.backpack[self.item.name].owned -= 1
-            if character.backpack[self.item.name].owned <= 0:
-                del character.backpack[self.item.name]
+            character.remove_from_backpack(self.item)
             price = max(price, 0)
             if price > 0:
                 try:
@@ -109,7 +108,7 @@ class BackpackSellView(discord.ui.View):
         self.ctx.command.reset_cooldown(self.ctx)
         async with self.cog.get_lock(self.author):
             try:
-                character = await Character.from_json(self.ctx, self.cog.config, self.author, self.cog._daily_bonus)
+                character = await self.cog.character_store.load(self.ctx, self.author)
             except Exception as exc:
                 self.ctx.command.reset_cooldown(self.ctx)
                 log.exception("Error with the new character sheet", exc_info=exc)
@@ -122,9 +121,7 @@ class BackpackSellView(discord.ui.View):
             count = 0
             async for _loop_counter in AsyncIter(range(0, self.item.owned), steps=50):
                 price += self.price
-                character.backpack[self.item.name].owned -= 1
-                if character.backpack[self.item.name].owned <= 0:
-                    del character.backpack[self.item.name]
+                character.remove_from_backpack(self.item)
                 count += 1
             msg = _("**{author}** sold all their {old_item} for {price} {currency_name}.\n").format(
                 author=escape(self.ctx.author.display_name),
@@ -154,7 +151,7 @@ class BackpackSellView(discord.ui.View):
         )
         async with self.cog.get_lock(self.author):
             try:
-                character = await Character.from_json(self.ctx, self.cog.config, self.author, self.cog._daily_bonus)
+                character = await self.cog.character_store.load(self.ctx, self.author)
             except Exception as exc:
                 self.ctx.command.reset_cooldown(self.ctx)
                 log.exception("Error with the new character sheet", exc_info=exc)
@@ -165,7 +162,7 @@ class BackpackSellView(discord.ui.View):
             async for _loop_counter in AsyncIter(range(1, character.backpack[self.item.name].owned), steps=50):
                 if character.backpack[self.item.name].owned == 1:
                     break
-                character.backpack[self.item.name].owned -= 1
+                character.remove_from_backpack(self.item)
                 price += self.price
                 count += 1
 
@@ -217,7 +214,7 @@ class BackPackCommands(AdventureMixin):
             return await smart_embed(ctx, _("This command is not available in DM's on this bot."))
         if not ctx.invoked_subcommand:
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -250,7 +247,7 @@ class BackPackCommands(AdventureMixin):
         await ctx.defer()
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -283,7 +280,7 @@ class BackPackCommands(AdventureMixin):
                 equip_msg += f".\n{equip.table(c)}"
 
                 c = await c.equip_item(equip, True, is_dev(ctx.author))  # FIXME:
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, c)
         await ctx.send(box(equip_msg, lang="ansi"))
 
     @_backpack.command(name="eset", cooldown_after_parsing=True)
@@ -307,7 +304,7 @@ class BackPackCommands(AdventureMixin):
             )
         async with self.get_lock(ctx.author):
             try:
-                character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                character = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 ctx.command.reset_cooldown(ctx)
@@ -322,7 +319,7 @@ class BackPackCommands(AdventureMixin):
                 )
             for piece in pieces:
                 character = await character.equip_item(piece, from_backpack=True)
-            await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, character)
             await smart_embed(
                 ctx,
                 _("I've equipped all pieces of `{set_name}` that you are able to equip.").format(set_name=set_name),
@@ -359,7 +356,7 @@ class BackPackCommands(AdventureMixin):
                     return
 
             try:
-                character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                character = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -385,20 +382,16 @@ class BackPackCommands(AdventureMixin):
                         roll = random.randint(0, 3)
                         chests = random.randint(1, 2)
                     if roll != 0:
-                        item.owned -= 1
-                        if item.owned <= 0:
-                            del character.backpack[item.name]
-                        await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                        character.remove_from_backpack(item)
+                        await self.character_store.save(ctx, ctx.author, character)
                         return await smart_embed(
                             ctx,
                             _("Your attempt at disassembling `{}` failed and it has been destroyed.").format(item.name),
                         )
                     else:
-                        item.owned -= 1
-                        if item.owned <= 0:
-                            del character.backpack[item.name]
+                        character.remove_from_backpack(item)
                         character.treasure[index] += chests
-                        await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, character)
                         return await smart_embed(
                             ctx,
                             _("Your attempt at disassembling `{}` was successful and you have received {} {}.").format(
@@ -416,17 +409,13 @@ class BackPackCommands(AdventureMixin):
                             roll = random.randint(0, 3)
                             chests = random.randint(1, 2)
                         if roll != 0:
-                            item.owned -= 1
-                            if item.owned <= 0 and item.name in character.backpack:
-                                del character.backpack[item.name]
+                            character.remove_from_backpack(item)
                             failed += 1
                         else:
-                            item.owned -= 1
-                            if item.owned <= 0 and item.name in character.backpack:
-                                del character.backpack[item.name]
+                            character.remove_from_backpack(item)
                             character.treasure[index] += chests
                             success += 1
-            await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, character)
             return await smart_embed(
                 ctx,
                 _("You attempted to disassemble multiple items: {succ} were successful and {fail} failed.").format(
@@ -478,29 +467,23 @@ class BackPackCommands(AdventureMixin):
             async with self.get_lock(ctx.author):
                 msg = ""
                 try:
-                    c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                    c = await self.character_store.load(ctx, ctx.author)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     return
                 total_price = 0
 
-                items = [i for n, i in c.backpack.items() if i.rarity not in [Rarities.forged]]
+                items = c.backpack.find(
+                    slots=[slot] if slot else None,
+                    rarities=[rarity] if rarity else None,
+                    exclude=[Rarities.forged],
+                )
                 count = 0
                 async for item in AsyncIter(items, steps=100):
-                    if rarity and item.rarity is not rarity:
-                        continue
-                    if slot:
-                        if item.slot is not slot:
-                            continue
-                    item_price = 0
                     old_owned = item.owned
-                    async for _loop_counter in AsyncIter(range(0, old_owned), steps=100):
-                        item.owned -= 1
-                        item_price += _sell(c, item)
-                        log.debug(f"{item_price=}")
-                        if item.owned <= 0:
-                            del c.backpack[item.name]
-                    item_price = max(item_price, 0)
+                    c.remove_from_backpack(item, old_owned)
+                    item_price = max(_sell(c, item, amount=old_owned), 0)
+                    log.debug(f"{item_price=}")
                     msg += _("{old_item} sold for {price}.\n").format(
                         old_item=str(old_owned) + " " + item.ansi,
                         price=humanize_number(item_price),
@@ -514,18 +497,15 @@ class BackPackCommands(AdventureMixin):
                         await bank.set_balance(ctx.author, e.max_balance)
                 c.last_known_currency = await bank.get_balance(ctx.author)
                 c.last_currency_check = time.time()
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
-        msg_list = []
+                await self.character_store.save(ctx, ctx.author, c)
         new_msg = _("{author} sold all their{rarity} items for {price}.\n\n{items}").format(
             author=escape(ctx.author.display_name),
             rarity=f" {rarity}" if rarity else "",
             price=humanize_number(total_price),
             items=msg,
         )
-        for page in pagify(new_msg, shorten_by=10, page_length=1900):
-            msg_list.append(box(page, lang="ansi"))
         await BaseMenu(
-            source=SimpleSource(msg_list),
+            source=SimpleSource(boxed_pages(new_msg)),
             delete_message_after=True,
             clear_reactions_after=True,
             timeout=60,
@@ -554,7 +534,7 @@ class BackPackCommands(AdventureMixin):
             )
         await ctx.defer()
         try:
-            c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            c = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             ctx.command.reset_cooldown(ctx)
             log.exception("Error with the new character sheet", exc_info=exc)
@@ -615,12 +595,12 @@ class BackPackCommands(AdventureMixin):
             return await ctx.send(_("You can't *sell* for less than 0..."), ephemeral=True)
         await ctx.defer()
         try:
-            c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            c = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return
         try:
-            buy_user = await Character.from_json(ctx, self.config, buyer, self._daily_bonus)
+            buy_user = await self.character_store.load(ctx, buyer)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return
@@ -709,19 +689,14 @@ class BackPackCommands(AdventureMixin):
                             except BalanceTooHigh as e:
                                 await bank.withdraw_credits(buyer, asking)
                                 await bank.set_balance(ctx.author, e.max_balance)
-                            c.backpack[item.name].owned -= 1
-                            newly_owned = c.backpack[item.name].owned
-                            if c.backpack[item.name].owned <= 0:
-                                del c.backpack[item.name]
+                            c.remove_from_backpack(item)
                             async with self.get_lock(buyer):
-                                if item.name in buy_user.backpack:
-                                    buy_user.backpack[item.name].owned += 1
-                                else:
-                                    item.owned = 1
-                                    buy_user.backpack[item.name] = item
-                                await self.config.user(buyer).set(await buy_user.to_json(ctx, self.config))
-                                item.owned = newly_owned
-                                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                                still_owned = item.owned
+                                item.owned = 1
+                                await buy_user.add_to_backpack(item)
+                                await self.character_store.save(ctx, buyer, buy_user)
+                                item.owned = still_owned
+                                await self.character_store.save(ctx, ctx.author, c)
 
                             await trade_msg.edit(
                                 content=(
@@ -771,7 +746,7 @@ class BackPackCommands(AdventureMixin):
             return await smart_embed(ctx, _("This command is not available in DM's on this bot."))
         if not ctx.invoked_subcommand:
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -817,7 +792,7 @@ class BackPackCommands(AdventureMixin):
         if not await self.allow_in_dm(ctx):
             return await smart_embed(ctx, _("This command is not available in DM's on this bot."))
         try:
-            c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            c = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return
@@ -855,7 +830,7 @@ class BackPackCommands(AdventureMixin):
         query.pop("degrade", None)  # Disallow selling by degrade levels
         async with self.get_lock(ctx.author):
             try:
-                character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                character = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -892,6 +867,7 @@ class BackPackCommands(AdventureMixin):
                 index = min(item.rarity.value, 4)
                 disassembled.add(item.name)
                 owned = item.owned
+                character.remove_from_backpack(item, owned)
                 async for _loop_counter in AsyncIter(range(0, owned), steps=100):
                     if character.hc is not HeroClasses.tinkerer:
                         roll = random.randint(0, 5)
@@ -900,14 +876,8 @@ class BackPackCommands(AdventureMixin):
                         roll = random.randint(0, 3)
                         chests = random.randint(1, 2)
                     if roll != 0:
-                        item.owned -= 1
-                        if item.owned <= 0 and item.name in character.backpack:
-                            del character.backpack[item.name]
                         failed += 1
                     else:
-                        item.owned -= 1
-                        if item.owned <= 0 and item.name in character.backpack:
-                            del character.backpack[item.name]
                         character.treasure[index] += chests
                         success += 1
         if (not failed) and (not success):
@@ -916,7 +886,7 @@ class BackPackCommands(AdventureMixin):
                 _("No items matched your query.").format(),
             )
         else:
-            await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, character)
             return await smart_embed(
                 ctx,
                 _("You attempted to disassemble multiple items: {succ} were successful and {fail} failed.").format(
@@ -942,7 +912,7 @@ class BackPackCommands(AdventureMixin):
         query.pop("degrade", None)  # Disallow selling by degrade levels
         async with self.get_lock(ctx.author):
             try:
-                character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                character = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -967,13 +937,8 @@ class BackPackCommands(AdventureMixin):
                 async for slot_name, slot_group in AsyncIter(slots, steps=100):
                     async for item in AsyncIter(slot_group, steps=100):
                         old_owned = item.owned
-                        item_price = 0
-                        async for _loop_counter in AsyncIter(range(0, old_owned), steps=100):
-                            item.owned -= 1
-                            item_price += _sell(character, item)
-                            if item.owned <= 0 and item.name in character.backpack:
-                                del character.backpack[item.name]
-                        item_price = max(item_price, 0)
+                        character.remove_from_backpack(item, old_owned)
+                        item_price = max(_sell(character, item, amount=old_owned), 0)
                         msg += _("{old_item} sold for {price}.\n").format(
                             old_item=str(old_owned) + " " + item.ansi,
                             price=humanize_number(item_price),
@@ -986,24 +951,21 @@ class BackPackCommands(AdventureMixin):
                         await bank.set_balance(ctx.author, e.max_balance)
                 character.last_known_currency = await bank.get_balance(ctx.author)
                 character.last_currency_check = time.time()
-                await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, character)
             if total_price == 0:
                 return await smart_embed(
                     ctx,
                     _("No items matched your query.").format(),
                 )
             if msg:
-                msg_list = []
                 new_msg = _("{author} sold {number} items and their duplicates for {price}.\n\n{items}").format(
                     author=escape(ctx.author.display_name),
                     number=humanize_number(total_items),
                     price=humanize_number(total_price),
                     items=msg,
                 )
-                for page in pagify(new_msg, shorten_by=10, page_length=1900):
-                    msg_list.append(box(page, lang="ansi"))
                 await BaseMenu(
-                    source=SimpleSource(msg_list),
+                    source=SimpleSource(boxed_pages(new_msg)),
                     delete_message_after=True,
                     clear_reactions_after=True,
                     timeout=180,
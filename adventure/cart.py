@@ -13,7 +13,7 @@ from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box, humanize_number, pagify
 
 from .bank import bank
-from .charsheet import Character, Item
+from .charsheet import Item
 from .constants import ANSIBackgroundColours, ANSIBackgroundTextColours, ANSITextColours, Rarities
 from .helpers import escape, is_dev, smart_embed
 
@@ -74,7 +74,7 @@ class TraderModal(discord.ui.Modal):
             await bank.withdraw_credits(spender, price)
             async with self.cog.get_lock(spender):
                 try:
-                    c = await Character.from_json(self.ctx, self.cog.config, spender, self.cog._daily_bonus)
+                    c = await self.cog.character_store.load(self.ctx, spender)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     return
@@ -87,7 +87,7 @@ class TraderModal(discord.ui.Modal):
                 item = self.item
                 item.owned = number
                 await c.add_to_backpack(item, number=number)
-                await self.cog.config.user(spender).set(await c.to_json(self.ctx, self.cog.config))
+                await self.cog.character_store.save(self.ctx, spender, c)
                 await interaction.response.send_message(
                     box(
                         _(
@@ -170,6 +170,10 @@ class Trader(discord.ui.View):
             new_content = _("{cart_name} left {time}.").format(time=timestamp, cart_name=self.cart_name)
             await self.message.edit(content=new_content, view=None)
 
+    async def leave(self):
+        self.stop()
+        await self.on_timeout()
+
     async def edit_timestamp(self):
         if self.timeout is None:
             return
@@ -182,9 +186,9 @@ class Trader(discord.ui.View):
         await self.message.edit(content=text)
 
     async def start(self, ctx: commands.Context, bypass: bool = False, stockcount: Optional[int] = None):
-        cart = await self.cog.config.cart_name()
-        if await self.cog.config.guild(ctx.guild).cart_name():
-            cart = await self.cog.config.guild(ctx.guild).cart_name()
+        cart = self.cog.settings["cart_name"]
+        if self.cog.settings.guild(ctx.guild)["cart_name"]:
+            cart = self.cog.settings.guild(ctx.guild)["cart_name"]
         self.cart_name = cart
         cart_header = _("[{cart_name} is bringing the cart around!]").format(cart_name=cart) + "\n\n"
         text = ANSITextColours.blue.as_str(cart_header)
@@ -199,7 +203,7 @@ class Trader(discord.ui.View):
                 return  # silent return.
         self.cog._last_trade[ctx.guild.id] = time.time()
 
-        room = await self.cog.config.guild(ctx.guild).cartroom()
+        room = self.cog.settings.guild(ctx.guild)["cartroom"]
         if room:
             room = ctx.guild.get_channel(room)
         if room is None or bypass:
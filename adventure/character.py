@@ -13,7 +13,7 @@ from redbot.core.utils.chat_formatting import bold, box, humanize_list, humanize
 
 from .abc import AdventureMixin
 from .bank import bank
-from .charsheet import Character, Item
+from .charsheet import Item
 from .constants import Rarities, Slot
 from .converters import EquipableItemConverter, EquipmentConverter, SkillConverter
 from .helpers import ConfirmView, _title_case, escape, smart_embed
@@ -54,12 +54,12 @@ class CharacterCommands(AdventureMixin):
         await ctx.defer()
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
             if skill == "reset":
-                last_reset = await self.config.user(ctx.author).last_skill_reset()
+                last_reset = c.last_skill_reset
                 if last_reset + 3600 > time.time():
                     return await smart_embed(ctx, _("You reset your skills within the last hour, try again later."))
                 bal = c.bal
@@ -94,8 +94,8 @@ class CharacterCommands(AdventureMixin):
                     c.skill["att"] = 0
                     c.skill["cha"] = 0
                     c.skill["int"] = 0
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
-                    await self.config.user(ctx.author).last_skill_reset.set(int(time.time()))
+                    c.last_skill_reset = int(time.time())
+                    await self.character_store.save(ctx, ctx.author, c)
                     await bank.withdraw_credits(ctx.author, offering)
                     await smart_embed(
                         ctx,
@@ -164,7 +164,7 @@ class CharacterCommands(AdventureMixin):
                     c.skill["pool"] -= amount
                     c.skill["int"] += amount
                     spend = "intelligence"
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, c)
                 await smart_embed(
                     ctx,
                     _("{author}, you permanently raised your {spend} value by {amount}.").format(
@@ -197,7 +197,7 @@ class CharacterCommands(AdventureMixin):
             )
         await ctx.defer()
         try:
-            c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            c = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return
@@ -253,9 +253,7 @@ class CharacterCommands(AdventureMixin):
             msg_list.append(box(stats_msg, lang="ini"))
 
         dummy_items = []
-        for name, data in self.TR_GEAR_SET.items():
-            if data["set"] != title_cased_set_name:
-                continue
+        for name, data in self.SET_PIECES.get(title_cased_set_name, {}).items():
             dummy_items.append(Item.from_json(ctx, {name: data}))
 
         loadout_display = await c.make_backpack_tables(
@@ -294,7 +292,7 @@ class CharacterCommands(AdventureMixin):
         if user.bot:
             return
         try:
-            c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+            c = await self.character_store.load(ctx, user)
         except Exception:
             log.exception("Error with the new character sheet")
             return
@@ -340,7 +338,7 @@ class CharacterCommands(AdventureMixin):
         await ctx.defer()
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -387,7 +385,7 @@ class CharacterCommands(AdventureMixin):
                         break
             if msg:
                 await ctx.send(box(msg, lang="ansi"))
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, c)
             else:
                 await smart_embed(
                     ctx,
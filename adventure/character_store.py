@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple, Union
+
+import discord
+from redbot.core import Config, commands
+
+from .charsheet import Backpack, ChangeSet, Character
+from .defaults import default_user
+
+if TYPE_CHECKING:
+    from .abc import AdventureMixin
+
+log = logging.getLogger("red.cogs.adventure")
+
+
+def _merge_defaults(defaults: dict, data: dict, shared: Iterable[str] = ()) -> dict:
+    """Fill in any missing keys the same way Config does when reading a user.
+
+    Everything is copied except the ``shared`` keys, which are passed on as they are.
+    """
+    merged = copy.deepcopy(defaults)
+    for key, value in data.items():
+        if key in shared:
+            merged[key] = value
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_defaults(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+class ItemChoices:
+    """What the item autocompletes need from a character sheet.
+
+    Kept for a few seconds so every key pressed while typing an item name doesn't load the sheet again.
+    """
+
+    __slots__ = ("backpack", "equipped", "equipment")
+
+    def __init__(self, c: Character):
+        self.backpack: Backpack = c.backpack
+        equipment = c.get_current_equipment()
+        self.equipped: Set[str] = {str(item) for item in equipment}
+        self.equipment: List[Tuple[str, str]] = [(str(item), item.name) for item in equipment]
+
+    def search_backpack(self, current: str, limit: int = 25) -> List[Tuple[str, str]]:
+        """``(display name, name)`` of the backpack items whose display name contains ``current``."""
+        return [(str(item), item.name) for item in self.backpack.search_display(current, limit)]
+
+    def search_unequipped(self, current: str, limit: int = 25) -> List[Tuple[str, str]]:
+        """``(display name, name)`` of the backpack items named like ``current`` that aren't equipped."""
+        choices = []
+        for item in self.backpack.search_names(current):
+            if str(item) in self.equipped:
+                continue
+            choices.append((str(item), item.name))
+            if len(choices) >= limit:
+                break
+        return choices
+
+    def search_equipment(self, current: str, limit: int = 25) -> List[Tuple[str, str]]:
+        current = current.lower()
+        return [(display, name) for display, name in self.equipment if current in display.lower()][:limit]
+
+
+class CharacterStore:
+    """Write-behind cache of character sheets sitting in front of Config.
+
+    The store keeps the serialized sheet of recently used characters so every
+    command builds its own :class:`Character` without a config read, and edits
+    that are never saved can't leak into another command. Cached documents are
+    never changed in place: saving replaces a document with one that copies only
+    what changed, and sheets are built from copies of everything but the backpack.
+    Saved sheets are marked dirty and written back in batches by a background
+    task, when the cog unloads or when :meth:`flush` is awaited.
+
+    Only the top level fields and backpack entries that changed since the last
+    write are sent to config, unless the whole document was replaced.
+    """
+
+    # Past this many backpack entries it is cheaper to rewrite the backpack in one go.
+    BACKPACK_ENTRY_LIMIT = 100
+
+    def __init__(
+        self,
+        cog: AdventureMixin,
+        config: Config,
+        *,
+        max_size: int = 1000,
+        flush_interval: float = 60.0,
+        choices_ttl: float = 15.0,
+    ):
+        self.cog = cog
+        self.config = config
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.choices_ttl = choices_ttl
+        self.batch_size = 50
+        self._cache: MutableMapping[int, dict] = OrderedDict()
+        self._users: Dict[int, Union[discord.Member, discord.User]] = {}
+        self._dirty: Set[int] = set()
+        self._changes: Dict[int, ChangeSet] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._overflow_task: Optional[asyncio.Task] = None
+        # user id -> (expiry, choices), oldest first
+        self._choices: MutableMapping[int, Tuple[float, ItemChoices]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, user: Union[discord.Member, discord.User]) -> bool:
+        return user.id in self._cache
+
+    @property
+    def dirty(self) -> int:
+        return len(self._dirty)
+
+    def pending_changes(self, user_id: int) -> Optional[ChangeSet]:
+        return self._changes.get(user_id)
+
+    def start(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the background task and write out everything still pending."""
+        for task in (self._flush_task, self._overflow_task):
+            if task is not None:
+                task.cancel()
+        self._flush_task = None
+        self._overflow_task = None
+        await self.flush(force=True)
+
+    async def _flush_loop(self) -> None:
+        with contextlib.suppress(asyncio.CancelledError):
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                try:
+                    await self.flush()
+                except Exception as exc:
+                    log.exception("Error flushing character sheets", exc_info=exc)
+
+    async def load(self, ctx: commands.Context, user: Union[discord.Member, discord.User]) -> Character:
+        """Return a new Character for the user, reading config only on a cache miss."""
+        return (await self.checkout(ctx, user))[0]
+
+    async def checkout(
+        self, ctx: commands.Context, user: Union[discord.Member, discord.User]
+    ) -> Tuple[Character, dict]:
+        """Return a new Character for the user along with the document it was built from.
+
+        Pass the document to :meth:`save` as ``base`` when the sheet is kept while the
+        user's lock isn't held, so what was saved for them in the meantime is kept.
+        """
+        data = self._cache.get(user.id)
+        if data is None:
+            data = await self.config.user(user).all()
+            self._remember(user, data)
+        else:
+            self._cache.move_to_end(user.id)
+            self._users[user.id] = user
+        # The backpack copies the mapping itself and never changes the stored entries,
+        # every other container is copied so changes made in place stay on the new sheet
+        c = await Character.from_json(
+            ctx, self.config, user, self.cog._daily_bonus, data=_merge_defaults(default_user, data, ("backpack",))
+        )
+        return c, data
+
+    async def save(
+        self,
+        ctx: commands.Context,
+        user: Union[discord.Member, discord.User],
+        c: Character,
+        *,
+        base: Optional[dict] = None,
+    ) -> dict:
+        """Store the character and queue its changes to be written back to config.
+
+        With ``base`` only what changed since the sheet was built from it is stored,
+        on top of anything saved for the user since. Returns the document the saved
+        sheet matches, to be passed as ``base`` when the same sheet is saved again.
+        """
+        if base is None:
+            data, changes = await c.to_json_changes(ctx, self.config, self._cache.get(user.id))
+            self._queue(user, data, changes)
+            return self._cache.get(user.id, data)
+        data, changes = await c.to_json_changes(ctx, self.config, base)
+        if changes and user.id not in self._cache:
+            self._remember(user, await self.config.user(user).all())
+        self._queue(user, data, changes)
+        return self._stored(base, data, changes)
+
+    def get_choices(self, user_id: int) -> Optional[ItemChoices]:
+        """Return the users autocomplete choices if they were built recently and nothing was saved since."""
+        cached = self._choices.get(user_id)
+        if cached is None:
+            return None
+        if cached[0] < time.monotonic():
+            del self._choices[user_id]
+            return None
+        return cached[1]
+
+    async def load_choices(self, ctx: commands.Context, user: Union[discord.Member, discord.User]) -> ItemChoices:
+        """Build the users autocomplete choices and keep them for :attr:`choices_ttl` seconds."""
+        choices = self.get_choices(user.id)
+        if choices is not None:
+            return choices
+        choices = ItemChoices(await self.load(ctx, user))
+        now = time.monotonic()
+        while self._choices and next(iter(self._choices.values()))[0] < now:
+            self._choices.popitem(last=False)
+        self._choices[user.id] = (now + self.choices_ttl, choices)
+        return choices
+
+    def set(self, user: Union[discord.Member, discord.User], data: dict) -> None:
+        """Store a raw user document and queue it to be written back to config in full."""
+        self._queue(user, data, ChangeSet(full=True))
+
+    def _queue(self, user: Union[discord.Member, discord.User], data: dict, changes: ChangeSet) -> None:
+        if not changes:
+            return
+        self._choices.pop(user.id, None)
+        self._remember(user, self._stored(self._cache.get(user.id), data, changes))
+        if user.id in self._changes:
+            self._changes[user.id].update(changes)
+        else:
+            self._changes[user.id] = changes
+        self._dirty.add(user.id)
+
+    @staticmethod
+    def _stored(current: Optional[dict], data: dict, changes: ChangeSet) -> dict:
+        """The document to cache once ``changes`` from ``data`` are applied to ``current``.
+
+        Only the changed fields and backpack entries are copied, the rest is shared with
+        ``current``. Cached documents are replaced rather than changed, so that is safe.
+        """
+        if changes.full or current is None:
+            return copy.deepcopy(data)
+        stored = dict(current)
+        for field in changes.fields:
+            stored[field] = copy.deepcopy(data[field])
+        if "backpack" not in changes.fields and (changes.backpack or changes.removed):
+            backpack = stored["backpack"] = dict(current.get("backpack") or {})
+            for name in changes.backpack:
+                if name in data["backpack"]:
+                    backpack[name] = copy.deepcopy(data["backpack"][name])
+                else:
+                    backpack.pop(name, None)
+            for name in changes.removed:
+                backpack.pop(name, None)
+        return stored
+
+    def invalidate(self, user_id: int) -> None:
+        """Forget a cached sheet, discarding any pending write.
+
+        Use this when the user's config is changed directly.
+        """
+        self._cache.pop(user_id, None)
+        self._users.pop(user_id, None)
+        self._choices.pop(user_id, None)
+        self._dirty.discard(user_id)
+        self._changes.pop(user_id, None)
+
+    def _remember(self, user: Union[discord.Member, discord.User], data: dict) -> None:
+        self._cache[user.id] = data
+        self._cache.move_to_end(user.id)
+        self._users[user.id] = user
+        self._trim()
+
+    def _trim(self) -> None:
+        if len(self._cache) <= self.max_size:
+            return
+        for user_id in list(self._cache.keys()):
+            if len(self._cache) <= self.max_size:
+                break
+            if user_id in self._dirty:
+                continue
+            del self._cache[user_id]
+            self._users.pop(user_id, None)
+        if len(self._cache) > self.max_size and (self._overflow_task is None or self._overflow_task.done()):
+            # Everything left over is waiting to be written so don't wait for the next tick.
+            self._overflow_task = asyncio.create_task(self.flush())
+
+    async def flush(self, user_ids: Optional[Iterable[int]] = None, *, force: bool = False) -> int:
+        """Write pending sheets to config in batches.
+
+        Users whose lock is currently held are left for the next flush unless ``force`` is set.
+        This must not be awaited while holding the lock of a user with a pending write.
+
+        Returns the number of sheets written.
+        """
+        async with self._flush_lock:
+            pending = [i for i in (self._dirty.copy() if user_ids is None else user_ids) if i in self._dirty]
+            written = 0
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start : start + self.batch_size]
+                results = await asyncio.gather(*(self._write(i, force=force) for i in batch), return_exceptions=True)
+                for user_id, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        log.exception("Error saving character sheet for %s", user_id, exc_info=result)
+                    elif result:
+                        written += 1
+            self._trim()
+            return written
+
+    async def _write(self, user_id: int, *, force: bool = False) -> bool:
+        user = self._users.get(user_id)
+        if user is None:
+            self._dirty.discard(user_id)
+            return False
+        lock = self.cog.get_lock(user)
+        if not force:
+            if lock.locked():
+                return False
+            async with lock:
+                return await self._write_data(user_id)
+        return await self._write_data(user_id)
+
+    async def _write_data(self, user_id: int) -> bool:
+        if user_id not in self._dirty:
+            return False
+        self._dirty.discard(user_id)
+        changes = self._changes.pop(user_id, None) or ChangeSet(full=True)
+        try:
+            await self._write_changes(user_id, self._cache[user_id], changes)
+        except Exception:
+            # A partial write may have gone through, so make sure the retry covers everything.
+            self._changes[user_id] = ChangeSet(full=True)
+            self._dirty.add(user_id)
+            raise
+        return True
+
+    async def _write_changes(self, user_id: int, data: dict, changes: ChangeSet) -> None:
+        group = self.config.user_from_id(user_id)
+        if changes.full:
+            await group.set(data)
+            return
+        fields = set(changes.fields)
+        if len(changes.backpack) + len(changes.removed) > self.BACKPACK_ENTRY_LIMIT:
+            fields.add("backpack")
+        for field in fields:
+            await group.set_raw(field, value=data[field])
+        if "backpack" in fields:
+            return
+        for name in changes.backpack:
+            if name in data["backpack"]:
+                await group.set_raw("backpack", name, value=data["backpack"][name])
+            else:
+                await group.clear_raw("backpack", name)
+        for name in changes.removed:
+            await group.clear_raw("backpack", name)
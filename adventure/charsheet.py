@@ -1,29 +1,38 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
+import math
 import random
 import time
-from copy import copy
+import weakref
 from datetime import date, datetime
-from typing import Any, Dict, List, MutableMapping, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple, Union
 
 import discord
-from beautifultable import ALIGN_CENTER, BeautifulTable
 from discord.ext.commands import check
 from redbot.core import Config, commands
-from redbot.core.i18n import Translator
+from redbot.core.i18n import Translator, get_locale
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import box, escape, humanize_list, humanize_number, pagify
 
 from .bank import bank
+from .columns import BackpackColumns, columnar_available
 from .constants import DEV_LIST, REBIRTH_LVL, REBIRTH_STEP, ANSITextColours, HeroClasses, Rarities, Slot, Treasure
+from .pages import LazyPages
+from .tables import AnsiTable, align, cell_lines
 
 log = logging.getLogger("red.cogs.adventure")
 
 _ = Translator("Adventure", __file__)
 
 COLUMN_WIDTHS = [5, 5, 5, 5, 6]
+# How many rendered item rows are kept, see Item.row.
+ROW_CACHE_SIZE = 4096
+# Backpack pages are a single column 250 characters wide at most, longer lines wrap.
+BACKPACK_CELL_WIDTH = 248
 
 
 class BackpackTable:
@@ -35,49 +44,236 @@ class BackpackTable:
         return self.table
 
 
+class ChangeSet:
+    """The parts of a user document that differ from what was last stored.
+
+    ``fields`` are top level keys to rewrite, ``backpack`` and ``removed`` are backpack
+    entries to rewrite or delete. ``full`` means the whole document has to be written.
+    """
+
+    __slots__ = ("fields", "backpack", "removed", "full")
+
+    def __init__(
+        self,
+        fields: Optional[Set[str]] = None,
+        backpack: Optional[Set[str]] = None,
+        removed: Optional[Set[str]] = None,
+        full: bool = False,
+    ):
+        self.fields: Set[str] = fields or set()
+        self.backpack: Set[str] = backpack or set()
+        self.removed: Set[str] = removed or set()
+        self.full = full
+
+    def __bool__(self):
+        return self.full or bool(self.fields or self.backpack or self.removed)
+
+    def __repr__(self):
+        return (
+            f"<ChangeSet full={self.full} fields={self.fields} "
+            f"backpack={len(self.backpack)} removed={len(self.removed)}>"
+        )
+
+    @classmethod
+    def between(cls, old: Optional[dict], new: dict) -> ChangeSet:
+        """Compare two user documents."""
+        if old is None:
+            return cls(full=True)
+        changes = cls()
+        for key, value in new.items():
+            if key == "backpack" and isinstance(old.get("backpack"), dict):
+                old_backpack = old["backpack"]
+                for name, item in value.items():
+                    if old_backpack.get(name) != item:
+                        changes.backpack.add(name)
+                changes.removed.update(name for name in old_backpack if name not in value)
+            elif key not in old or old[key] != value:
+                changes.fields.add(key)
+        return changes
+
+    def update(self, other: ChangeSet) -> None:
+        """Merge changes made after this change set into it."""
+        self.full = self.full or other.full
+        self.fields |= other.fields
+        self.backpack = (self.backpack - other.removed) | other.backpack
+        self.removed = (self.removed - other.backpack) | other.removed
+
+
+class ItemTemplate:
+    """The shared, unchanging part of an item.
+
+    Every item with the same name, rarity, slot and stats points at the same template,
+    see :meth:`ItemTemplate.get`. Use :meth:`replace` rather than changing one in place.
+    """
+
+    _identity = ("name", "rarity", "slot", "att", "int", "cha", "dex", "luck", "set", "parts")
+    __slots__ = _identity + ("total_stats", "max_main_stat", "lvl", "__weakref__")
+
+    _registry: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __init__(
+        self,
+        name: str,
+        rarity: Rarities,
+        slot: Slot,
+        att: int,
+        int: int,
+        cha: int,
+        dex: int,
+        luck: int,
+        set: Union[str, bool],
+        parts: int,
+    ):
+        self.name = name
+        self.rarity = rarity
+        self.slot = slot
+        self.att = att
+        self.int = int
+        self.cha = cha
+        self.dex = dex
+        self.luck = luck
+        self.set = set
+        self.parts = parts
+        self.total_stats: int = att + int + cha + dex + luck
+        if slot is Slot.two_handed:
+            self.total_stats *= 2
+        self.max_main_stat: int = max(att, int, cha, 1)
+        self.lvl: int = self._equip_level()
+
+    def __repr__(self):
+        return f"<ItemTemplate name={self.name!r} rarity={self.rarity.name} slot={self.slot.name}>"
+
+    @classmethod
+    def get(cls, *args) -> ItemTemplate:
+        """Return the template for these values, creating it if no live item uses one yet.
+
+        Takes the same positional arguments as the constructor.
+        """
+        template = cls._registry.get(args)
+        if template is None:
+            template = cls._registry[args] = cls(*args)
+        return template
+
+    def replace(self, **changes) -> ItemTemplate:
+        """Return the template matching this one with ``changes`` applied."""
+        if not changes:
+            return self
+        return self.get(*(changes.get(field, getattr(self, field)) for field in self._identity))
+
+    def _equip_level(self) -> int:
+        lvl = 1
+        if self.rarity not in [Rarities.forged]:
+            # epic and legendary stats too similar so make level req's
+            # the same
+            rarity_multiplier = max(min(self.rarity.value, 5), 1)
+            mult = 1 + (rarity_multiplier / 10)
+            positive_stats = (
+                sum([i for i in [self.att, self.int, self.cha, self.dex, self.luck] if i > 0])
+                * mult
+                * (1.7 if self.slot is Slot.two_handed else 1)
+            )
+            negative_stats = (
+                sum([i for i in [self.att, self.int, self.cha, self.dex, self.luck] if i < 0])
+                / 2
+                * (1.7 if self.slot is Slot.two_handed else 1)
+            )
+            lvl = positive_stats + negative_stats
+        return max(int(lvl), 1)
+
+
+def _template_field(field: str, settable: bool = True) -> property:
+    def getter(self: Item):
+        return getattr(self.template, field)
+
+    def setter(self: Item, value: Any):
+        self.template = self.template.replace(**{field: value})
+
+    return property(getter, setter if settable else None)
+
+
+@functools.lru_cache(maxsize=ROW_CACHE_SIZE)
+def _item_row(
+    template: ItemTemplate, owned: int, lvl: int, degrade: int, can_equip: bool, stats: Tuple[Any, ...], locale: str
+) -> Tuple[str, str]:
+    subtable = AnsiTable(widths=COLUMN_WIDTHS, top_border=False)
+    degrade_str = ""
+    if template.rarity in [Rarities.legendary, Rarities.event, Rarities.ascended] and degrade >= 0:
+        degrade_str = f"[{degrade}]"
+    set_str = ""
+    if template.set:
+        set_str = f"\n{template.set}"
+    lvl_str = f"{ANSITextColours.red.as_str(str(lvl))}" if not can_equip else f"{lvl}"
+    lvl_str = _("Lvl: {lvl_str}").format(lvl_str=lvl_str)
+    subtable.rows.append(stats)
+    item_name = template.rarity.as_ansi(template.name, 45)
+    return f"{owned}x {lvl_str} {template.slot.get_name()} {degrade_str}\n{item_name}{set_str}", str(subtable)
+
+
 class Item:
-    """An object to represent an item in the game world."""
+    """An object to represent an item in the game world.
+
+    An item is the :class:`ItemTemplate` it shares with every identical item plus the
+    parts that belong to this copy: how many are owned, degradation and event levels.
+    """
+
+    __slots__ = ("_ctx", "template", "owned", "degrade", "_lvl")
+
+    name: str = _template_field("name")
+    rarity: Rarities = _template_field("rarity")
+    slot: Slot = _template_field("slot")
+    att: int = _template_field("att")
+    int: int = _template_field("int")
+    cha: int = _template_field("cha")
+    dex: int = _template_field("dex")
+    luck: int = _template_field("luck")
+    set: Union[str, bool] = _template_field("set")
+    parts: int = _template_field("parts")
+    total_stats: int = _template_field("total_stats", settable=False)
+    max_main_stat: int = _template_field("max_main_stat", settable=False)
 
     def __init__(self, **kwargs):
         self._ctx: commands.Context = kwargs.pop("ctx")
-        if kwargs.get("rarity") in ["event"]:
-            self.name: str = kwargs.get("name", "Default Name")
-        elif kwargs.get("rarity") in ["set", "legendary", "ascended"]:
-            self.name: str = kwargs.get("name", "Default Name").title()
-        else:
-            self.name: str = kwargs.get("name", "Default Name").lower()
+        name = self.normalize_name(kwargs.get("name", "Default Name"), kwargs.get("rarity"))
         try:
-            self.slot: Slot = Slot.from_list(kwargs.get("slot", []))
+            slot: Slot = Slot.from_list(kwargs.get("slot", []))
         except KeyError:
-            self.slot = Slot.head
-        self.att: int = kwargs.get("att", 0)
-        self.int: int = kwargs.get("int", 0)
-        self.cha: int = kwargs.get("cha", 0)
-        self._rarity: str = kwargs.get("rarity", 0)
+            slot = Slot.head
         try:
-            self.rarity: Rarities = Rarities.get_from_name(self._rarity)
+            rarity: Rarities = Rarities.get_from_name(kwargs.get("rarity", 0))
         except KeyError:
-            self.rarity = Rarities.normal
-        self.dex: int = kwargs.get("dex", 0)
-        self.luck: int = kwargs.get("luck", 0)
-        self.owned: int = kwargs.get("owned", 0)
-        self.set: bool = kwargs.get("set", False)
-        self.parts: int = kwargs.get("parts", 0)
-        self.total_stats: int = self.att + self.int + self.cha + self.dex + self.luck
-        if self.slot is Slot.two_handed:
-            self.total_stats *= 2
-        self.max_main_stat = max(self.att, self.int, self.cha, 1)
-        self.lvl: int = (
-            (kwargs.get("lvl") or self.get_equip_level()) if self.rarity is Rarities.event else self.get_equip_level()
+            rarity = Rarities.normal
+        self.template: ItemTemplate = ItemTemplate.get(
+            name,
+            rarity,
+            slot,
+            kwargs.get("att", 0),
+            kwargs.get("int", 0),
+            kwargs.get("cha", 0),
+            kwargs.get("dex", 0),
+            kwargs.get("luck", 0),
+            kwargs.get("set", False),
+            kwargs.get("parts", 0),
         )
+        self.owned: int = kwargs.get("owned", 0)
+        self._lvl: Optional[int] = (kwargs.get("lvl") or None) if rarity is Rarities.event else None
         self.degrade = kwargs.get("degrade", 5)
 
+    @property
+    def lvl(self) -> int:
+        return self._lvl or self.template.lvl
+
+    @lvl.setter
+    def lvl(self, value: int):
+        self._lvl = value
+
     def __str__(self):
         return self.rarity.as_str(self.name)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Item):
             return False
+        if other.template is self.template:
+            return True
         return (
             other.name == self.name
             and other.rarity is self.rarity
@@ -110,27 +306,19 @@ class Item:
         ret += " " + " | ".join(f"{stat_name}: {getattr(self, stat_name.lower(), 0) * mult}" for stat_name in stats)
         return ret
 
-    def row(self, player: Optional[Character], show_delta: bool = False) -> Tuple[Any, ...]:
+    def row(self, player: Optional[Character], show_delta: bool = False) -> Tuple[str, str]:
         """
         Return a tuple of relevant data for use in tables for this item.
 
+        Rows are cached by everything drawn in them, so equipping, unequipping or
+        changing an item draws a new row rather than reusing a stale one.
+
         Parameters
         ----------
             player: Character
                 The player's Character sheet to know their level and show possible deltas.
         """
         can_equip = self.lvl <= player.lvl if player is not None else True
-        subtable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-        subtable.set_style(BeautifulTable.STYLE_RST)
-        # subtable.columns.header = [self.ansi]
-        degrade_str = ""
-        if self.rarity in [Rarities.legendary, Rarities.event, Rarities.ascended] and self.degrade >= 0:
-            degrade_str = f"[{self.degrade}]"
-        set_str = ""
-        if self.set:
-            set_str = f"\n{self.set}"
-        lvl_str = f"{ANSITextColours.red.as_str(str(self.lvl))}" if not can_equip else f"{self.lvl}"
-        lvl_str = _("Lvl: {lvl_str}").format(lvl_str=lvl_str)
         if show_delta and player is not None:
             current_equipped = getattr(player, self.slot.char_slot, None)
             att = player.get_equipped_delta(current_equipped, self, "att")
@@ -144,24 +332,17 @@ class Item:
             intel = self.int * (1 if self.slot is not Slot.two_handed else 2)
             dex = self.dex * (1 if self.slot is not Slot.two_handed else 2)
             luck = self.luck * (1 if self.slot is not Slot.two_handed else 2)
-        stats = [
+        stats = (
             att,
             cha,
             intel,
             dex,
             luck,
-        ]
-        subtable.rows.append(stats)
-        subtable.columns.width = COLUMN_WIDTHS
-        subtable.border.top = ""
-        item_name = self.as_ansi(45)
-        return f"{self.owned}x {lvl_str} {self.slot.get_name()} {degrade_str}\n{item_name}{set_str}", subtable
-
-    def table(self, player: Optional[Character]) -> str:
-        table = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-        table.set_style(BeautifulTable.STYLE_RST)
-        table.border.top = ""
-        table.border.bottom = ""
+        )
+        return _item_row(self.template, self.owned, self.lvl, self.degrade, can_equip, stats, get_locale())
+
+    def table(self, player: Optional[Character]) -> AnsiTable:
+        table = AnsiTable(top_border=False, bottom_border=False)
         headers = [
             "ATT",
             "CHA",
@@ -169,12 +350,9 @@ class Item:
             "DEX",
             "LUCK",
         ]
-        subtable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-        subtable.set_style(BeautifulTable.STYLE_RST)
-        subtable.columns.width = COLUMN_WIDTHS
+        subtable = AnsiTable(widths=COLUMN_WIDTHS, top_border=False)
         subtable.rows.append(headers)
-        subtable.border.top = ""
-        table.rows.append([subtable])
+        table.rows.append([str(subtable)])
         item_name, item_row = self.row(player)
         table.rows.append([item_name])
         table.rows.append([item_row])
@@ -185,24 +363,7 @@ class Item:
         return str(self)
 
     def get_equip_level(self):
-        lvl = 1
-        if self.rarity not in [Rarities.forged]:
-            # epic and legendary stats too similar so make level req's
-            # the same
-            rarity_multiplier = max(min(self.rarity.value, 5), 1)
-            mult = 1 + (rarity_multiplier / 10)
-            positive_stats = (
-                sum([i for i in [self.att, self.int, self.cha, self.dex, self.luck] if i > 0])
-                * mult
-                * (1.7 if self.slot is Slot.two_handed else 1)
-            )
-            negative_stats = (
-                sum([i for i in [self.att, self.int, self.cha, self.dex, self.luck] if i < 0])
-                / 2
-                * (1.7 if self.slot is Slot.two_handed else 1)
-            )
-            lvl = positive_stats + negative_stats
-        return max(int(lvl), 1)
+        return self.template.lvl
 
     @staticmethod
     def remove_markdowns(item):
@@ -234,49 +395,55 @@ class Item:
             item = item.replace("{Event:'", "").replace("'}", "")
         return item
 
+    @staticmethod
+    def normalize_name(name: str, rarity: Any) -> str:
+        """The name an item of ``rarity`` goes by, event items keep theirs as it is."""
+        if rarity in ["event"]:
+            return name
+        elif rarity in ["set", "legendary", "ascended"]:
+            return name.title()
+        return name.lower()
+
     @classmethod
-    def from_json(cls, ctx: commands.Context, data: dict):
-        name = "".join(data.keys())
-        data = data[name]
+    def stored_name(cls, name: str, data: dict) -> str:
+        """The name of the item stored as ``{name: data}``, without building it."""
+        return cls.normalize_name(cls._strip_prefix(name), data.get("rarity", "normal"))
+
+    @staticmethod
+    def _strip_prefix(name: str) -> str:
         if name.startswith("."):
             name = name.replace("_", " ").replace(".", "")
-            rarity = "rare"
         elif name.startswith("["):
             name = name.replace("[", "").replace("]", "")
-            rarity = "epic"
         elif name.startswith("{Legendary:'"):
             name = name.replace("{Legendary:'", "").replace("'}", "")
-            rarity = "legendary"
         elif name.startswith("{legendary:'"):
             name = name.replace("{legendary:'", "").replace("'}", "")
-            rarity = "legendary"
         elif name.startswith("{Ascended:'"):
             name = name.replace("{Ascended:'", "").replace("'}", "")
-            rarity = "ascended"
         elif name.startswith("{ascended:'"):
             name = name.replace("{ascended:'", "").replace("'}", "")
-            rarity = "ascended"
         elif name.startswith("{Gear_Set:'"):
             name = name.replace("{Gear_Set:'", "").replace("'}", "")
-            rarity = "set"
         elif name.startswith("{Gear Set:'"):
             name = name.replace("{Gear Set:'", "").replace("'}", "")
-            rarity = "set"
         elif name.startswith("{gear_set:'"):
             name = name.replace("{gear_set:'", "").replace("'}", "")
-            rarity = "set"
         elif name.startswith("{Set:'"):
             name = name.replace("{Set:''", "").replace("''}", "")
-            rarity = "set"
         elif name.startswith("{set:'"):
             name = name.replace("{set:''", "").replace("''}", "")
-            rarity = "set"
         elif name.startswith("{.:'"):
             name = name.replace("{.:'", "").replace("':.}", "")
-            rarity = "forged"
         elif name.startswith("{Event:'"):
             name = name.replace("{Event:'", "").replace("''}", "")
-            rarity = "event"
+        return name
+
+    @classmethod
+    def from_json(cls, ctx: commands.Context, data: dict):
+        name = "".join(data.keys())
+        data = data[name]
+        name = cls._strip_prefix(name)
         rarity = data.get("rarity", "normal")
         att = data["att"] if "att" in data else 0
         dex = data["dex"] if "dex" in data else 0
@@ -329,13 +496,15 @@ class Item:
         if self.rarity is Rarities.set:
             updated_set = self._ctx.bot.get_cog("Adventure").TR_GEAR_SET.get(self.name)
             if updated_set:
-                self.att = updated_set.get("att", self.att)
-                self.int = updated_set.get("int", self.int)
-                self.cha = updated_set.get("cha", self.cha)
-                self.dex = updated_set.get("dex", self.dex)
-                self.luck = updated_set.get("luck", self.luck)
-                self.set = updated_set.get("set", self.set)
-                self.parts = updated_set.get("parts", self.parts)
+                self.template = self.template.replace(
+                    att=updated_set.get("att", self.att),
+                    int=updated_set.get("int", self.int),
+                    cha=updated_set.get("cha", self.cha),
+                    dex=updated_set.get("dex", self.dex),
+                    luck=updated_set.get("luck", self.luck),
+                    set=updated_set.get("set", self.set),
+                    parts=updated_set.get("parts", self.parts),
+                )
         data = {
             self.name: {
                 "slot": self.slot.to_json(),
@@ -364,26 +533,674 @@ class Item:
         return data
 
 
+_SortEntry = Tuple[Tuple[int, int, int], int, str]
+
+
+class SubstringIndex:
+    """Finds the keys whose text contains a fragment without checking every text.
+
+    Every run of :attr:`GRAM` characters in a text points back to its key, a fragment
+    only has to be checked against the keys that share all of its runs.
+    Fragments shorter than a run are checked against every text.
+    """
+
+    __slots__ = ("_texts", "_grams")
+
+    GRAM = 3
+
+    def __init__(self):
+        self._texts: Dict[str, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @classmethod
+    def grams(cls, text: str) -> Set[str]:
+        return {text[i : i + cls.GRAM] for i in range(len(text) - cls.GRAM + 1)}
+
+    def add(self, key: str, text: str) -> None:
+        self.discard(key)
+        self._texts[key] = text
+        for gram in self.grams(text):
+            self._grams.setdefault(gram, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self.grams(text):
+            keys = self._grams[gram]
+            keys.discard(key)
+            if not keys:
+                del self._grams[gram]
+
+    def search(self, fragment: str) -> Set[str]:
+        if len(fragment) < self.GRAM:
+            return {key for key, text in self._texts.items() if fragment in text}
+        postings = sorted((self._grams.get(gram, set()) for gram in self.grams(fragment)), key=len)
+        keys = set(postings[0])
+        for posting in postings[1:]:
+            if not keys:
+                break
+            keys &= posting
+        return {key for key in keys if fragment in self._texts[key]}
+
+
+def backpack_sort_key(item: Item) -> Tuple[int, int, int]:
+    """The order items are listed in within a slot of the backpack."""
+    return Character.get_rarity_index(item.rarity), item.lvl, item.total_stats
+
+
+class Backpack(MutableMapping[str, Item]):
+    """A mapping of item name to :class:`Item` that builds items only when they are needed.
+
+    Entries keep the data they were stored with until they are looked up, so
+    length checks and membership tests never build an item, and entries that were
+    never looked up are written back exactly as they were read. Every entry is kept
+    under the name of its item, stored names the item doesn't go by are fixed on load.
+
+    The first filtered lookup (:meth:`find`, :meth:`sorted_groups`) builds every item
+    and indexes them by slot, rarity, set and lowercase name, after which the indexes
+    and a sorted order per slot are kept up to date as items are added and removed.
+
+    Name searches (:meth:`search_names`, :meth:`search_display`, :meth:`find_by_display`)
+    add substring and display name indexes the first time they are used.
+    """
+
+    __slots__ = (
+        "_ctx",
+        "_data",
+        "_indexed",
+        "_next_position",
+        "_entries",
+        "_by_slot",
+        "_by_rarity",
+        "_by_set",
+        "_by_name",
+        "_sorted",
+        "_columns",
+        "_names_indexed",
+        "_displays",
+        "_by_display",
+        "_by_display_lower",
+        "_name_search",
+        "_display_search",
+    )
+
+    def __init__(self, ctx: commands.Context, data: Optional[Dict[str, dict]] = None):
+        self._ctx = ctx
+        self._data: Dict[str, Union[Item, dict]] = {}
+        for name, value in (data or {}).items():
+            # Older characters can hold items under names the item no longer goes by,
+            # those are built now so every entry sits under the name of its item
+            if Item.stored_name(name, value) == name:
+                self._data[name] = value
+            else:
+                item = Item.from_json(ctx, {name: value})
+                self._data[item.name] = item
+        self._indexed = False
+        self._next_position = 0
+        # (sort entry, slot, rarity, set) each name was indexed under, the sort entry
+        # includes where the name sits in the backpack so results keep backpack order
+        self._entries: Dict[str, Tuple[_SortEntry, Slot, Rarities, Union[str, bool]]] = {}
+        self._by_slot: Dict[Slot, Set[str]] = {}
+        self._by_rarity: Dict[Rarities, Set[str]] = {}
+        self._by_set: Dict[str, Set[str]] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._sorted: Dict[Slot, List[_SortEntry]] = {}
+        self._columns: Optional[BackpackColumns] = None
+        self._names_indexed = False
+        self._displays: Dict[str, str] = {}
+        self._by_display: Dict[str, Set[str]] = {}
+        self._by_display_lower: Dict[str, Set[str]] = {}
+        self._name_search = SubstringIndex()
+        self._display_search = SubstringIndex()
+
+    def __getitem__(self, name: str) -> Item:
+        value = self._data[name]
+        if not isinstance(value, Item):
+            value = self._data[name] = Item.from_json(self._ctx, {name: value})
+        return value
+
+    def __setitem__(self, name: str, item: Item) -> None:
+        if name != item.name:
+            raise ValueError(f"{item.name!r} can't be stored under {name!r}")
+        self._columns = None
+        if self._indexed:
+            if name in self._data:
+                position = self._unindex(name)
+            else:
+                position = self._next_position
+                self._next_position += 1
+            self._data[name] = item
+            self._index(name, item, position)
+        else:
+            self._data[name] = item
+
+    def __delitem__(self, name: str) -> None:
+        self._columns = None
+        if self._indexed and name in self._data:
+            self._unindex(name)
+        del self._data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._data
+
+    def __repr__(self) -> str:
+        loaded = sum(1 for v in self._data.values() if isinstance(v, Item))
+        return f"<Backpack items={len(self._data)} loaded={loaded}>"
+
+    def is_loaded(self, name: str) -> bool:
+        return isinstance(self._data.get(name), Item)
+
+    def count_owned(self, rarity: Rarities) -> int:
+        """Return how many items of a rarity are held without building them."""
+        count = 0
+        for value in self._data.values():
+            if isinstance(value, Item):
+                if value.rarity is rarity:
+                    count += value.owned
+            elif value.get("rarity", "normal") in (rarity.name, rarity.get_name()):
+                count += value.get("owned", 1)
+        return count
+
+    def to_json(self) -> Dict[str, dict]:
+        backpack = {}
+        for name, value in self._data.items():
+            if isinstance(value, Item):
+                backpack.update(value.to_json())
+            else:
+                backpack[name] = value
+        return backpack
+
+    def columns(self) -> BackpackColumns:
+        """The backpack as NumPy arrays, only call this when NumPy is installed.
+
+        The arrays are rebuilt after items are added or removed.
+        """
+        if self._columns is None:
+            self._columns = BackpackColumns(list(self), list(self.values()))
+        return self._columns
+
+    def _build_index(self) -> None:
+        if self._indexed:
+            return
+        self._indexed = True
+        for position, name in enumerate(list(self._data)):
+            self._index(name, self[name], position)
+        self._next_position = len(self._data)
+
+    def _index(self, name: str, item: Item, position: int) -> None:
+        entry = (backpack_sort_key(item), position, name)
+        self._entries[name] = (entry, item.slot, item.rarity, item.set)
+        self._by_slot.setdefault(item.slot, set()).add(name)
+        self._by_rarity.setdefault(item.rarity, set()).add(name)
+        if item.set:
+            self._by_set.setdefault(item.set, set()).add(name)
+        self._by_name.setdefault(name.lower(), set()).add(name)
+        bisect.insort(self._sorted.setdefault(item.slot, []), entry)
+        if self._names_indexed:
+            self._index_name(name, item)
+
+    def _unindex(self, name: str) -> int:
+        """Remove a name from the indexes and return its position."""
+        entry, slot, rarity, set_name = self._entries.pop(name)
+        self._by_slot[slot].discard(name)
+        self._by_rarity[rarity].discard(name)
+        if set_name:
+            self._by_set[set_name].discard(name)
+        self._by_name[name.lower()].discard(name)
+        if self._names_indexed:
+            self._unindex_name(name)
+        ordered = self._sorted[slot]
+        del ordered[bisect.bisect_left(ordered, entry)]
+        return entry[1]
+
+    def _position(self, name: str) -> int:
+        return self._entries[name][0][1]
+
+    def _build_name_index(self) -> None:
+        self._build_index()
+        if self._names_indexed:
+            return
+        self._names_indexed = True
+        for name in self._data:
+            self._index_name(name, self[name])
+
+    def _index_name(self, name: str, item: Item) -> None:
+        display = self._displays[name] = str(item)
+        self._by_display.setdefault(display, set()).add(name)
+        self._by_display_lower.setdefault(display.lower(), set()).add(name)
+        self._name_search.add(name, name.lower())
+        self._display_search.add(name, display.lower())
+
+    def _unindex_name(self, name: str) -> None:
+        display = self._displays.pop(name)
+        self._by_display[display].discard(name)
+        self._by_display_lower[display.lower()].discard(name)
+        self._name_search.discard(name)
+        self._display_search.discard(name)
+
+    def _ordered(self, names: Iterable[str], limit: Optional[int] = None) -> List[Item]:
+        return [self[name] for name in sorted(names, key=self._position)[:limit]]
+
+    def _matching(
+        self,
+        slots: Optional[Iterable[Slot]],
+        rarities: Optional[Iterable[Rarities]],
+        sets: Optional[Iterable[str]],
+        exclude: Optional[Iterable[Rarities]],
+    ) -> Optional[Set[str]]:
+        """The names that pass every filter given, ``None`` when nothing was filtered."""
+        self._build_index()
+        names: Optional[Set[str]] = None
+        if slots is not None:
+            names = set().union(*(self._by_slot.get(slot, ()) for slot in slots))
+        if rarities is not None:
+            matched = set().union(*(self._by_rarity.get(rarity, ()) for rarity in rarities))
+            names = matched if names is None else names & matched
+        if sets is not None:
+            matched = set().union(*(self._by_set.get(set_name, ()) for set_name in sets))
+            names = matched if names is None else names & matched
+        if exclude is not None:
+            excluded = set().union(*(self._by_rarity.get(rarity, ()) for rarity in exclude))
+            if excluded:
+                names = set(self._data).difference(excluded) if names is None else names - excluded
+        return names
+
+    def find(
+        self,
+        *,
+        slots: Optional[Iterable[Slot]] = None,
+        rarities: Optional[Iterable[Rarities]] = None,
+        set_name: Optional[str] = None,
+        exclude: Optional[Iterable[Rarities]] = None,
+    ) -> List[Item]:
+        """Return the items in any of ``slots`` and ``rarities``, of ``set_name`` and
+        not of an ``exclude`` rarity, in backpack order.
+        """
+        names = self._matching(slots, rarities, None if set_name is None else [set_name], exclude)
+        if names is None:
+            return list(self.values())
+        return [self[name] for name in sorted(names, key=self._position)]
+
+    def get_by_name(self, name: str) -> List[Item]:
+        """Return the items whose name matches ``name`` ignoring case."""
+        self._build_index()
+        return [self[n] for n in sorted(self._by_name.get(name.lower(), ()), key=self._position)]
+
+    def search_names(self, fragment: str, limit: Optional[int] = None) -> List[Item]:
+        """Return the items whose name contains ``fragment`` ignoring case, in backpack order."""
+        self._build_name_index()
+        return self._ordered(self._name_search.search(fragment.lower()), limit)
+
+    def search_display(self, fragment: str, limit: Optional[int] = None) -> List[Item]:
+        """Return the items whose display name (``str(item)``) contains ``fragment`` ignoring case."""
+        self._build_name_index()
+        return self._ordered(self._display_search.search(fragment.lower()), limit)
+
+    def find_by_display(self, *displays: str, ignore_case: bool = False) -> List[Item]:
+        """Return the items displayed as any of ``displays``, in backpack order."""
+        self._build_name_index()
+        if ignore_case:
+            index, displays = self._by_display_lower, tuple(d.lower() for d in displays)
+        else:
+            index = self._by_display
+        return self._ordered(set().union(*(index.get(display, ()) for display in displays)))
+
+    def sorted_groups(
+        self,
+        slot: Optional[Slot] = None,
+        rarity: Optional[Rarities] = None,
+        set_name: Optional[str] = None,
+    ) -> List[List[Item]]:
+        """Return the items grouped by slot, each group sorted by :func:`backpack_sort_key`.
+
+        Groups are listed in the order their slot first shows up in the backpack.
+        """
+        names = self._matching(
+            None, None if rarity is None else [rarity], None if set_name is None else [set_name], None
+        )
+        return self._groups(names, slot)
+
+    def _groups(self, names: Optional[Set[str]], slot: Optional[Slot] = None) -> List[List[Item]]:
+        groups = []
+        for group_slot, ordered in self._sorted.items():
+            if slot is not None and group_slot is not slot:
+                continue
+            if names is None:
+                entries = ordered
+            elif len(names) < len(ordered):
+                entries = sorted(self._entries[n][0] for n in names & self._by_slot[group_slot])
+            else:
+                entries = [e for e in ordered if e[2] in names]
+            if entries:
+                groups.append((min(e[1] for e in entries), [self[e[2]] for e in entries]))
+        groups.sort(key=lambda g: g[0])
+        return [items for _position, items in groups]
+
+
+_Test = Tuple[Optional[Callable[[Item], bool]], Callable[[Item], bool]]
+
+
+def _range_test(
+    bounds: MutableMapping[str, Any], stat: str, *, per_hand: bool = False, inclusive_max: bool = False
+) -> Callable[[Item], bool]:
+    """Compile a ``BackpackFilterParser`` range into a test.
+
+    ``per_hand`` stats count double on two handed items.
+    """
+
+    def value(item: Item) -> int:
+        return getattr(item, stat) * (2 if per_hand and item.slot is Slot.two_handed else 1)
+
+    if (equal := bounds.get("equal")) is not None:
+        return lambda item: value(item) == equal
+    low, high = bounds["min"], bounds["max"]
+    if inclusive_max:
+        return lambda item: low < value(item) <= high
+    return lambda item: low < value(item) < high
+
+
+def _text_test(text: str, ignore_case: bool) -> Callable[[Item], bool]:
+    if ignore_case:
+        text = text.lower()
+        return lambda item: text in str(item).lower()
+    return lambda item: text in str(item)
+
+
+class BackpackFilter:
+    """A ``BackpackFilterParser`` query compiled once into index lookups and residual tests.
+
+    Slot, rarity and set criteria are answered by the :class:`Backpack` indexes, every
+    other criterion is a test that only runs on the items left over. Each test can have
+    a guard saying which items it applies to, items it doesn't apply to pass it.
+
+    With ``--except`` the same plan is negated, an item is kept when it fails every
+    criterion that applies to it.
+    """
+
+    __slots__ = ("negate", "slots", "rarities", "sets", "excluded", "equippable", "text_tests", "ranges", "tests")
+
+    DEGRADING = (Rarities.legendary, Rarities.ascended, Rarities.event)
+
+    def __init__(
+        self,
+        *,
+        slots: Optional[List[Slot]] = None,
+        rarities: Optional[List[Rarities]] = None,
+        sets: Optional[List[str]] = None,
+        equippable: bool = False,
+        strength: Optional[MutableMapping[str, Any]] = None,
+        intelligence: Optional[MutableMapping[str, Any]] = None,
+        charisma: Optional[MutableMapping[str, Any]] = None,
+        luck: Optional[MutableMapping[str, Any]] = None,
+        dexterity: Optional[MutableMapping[str, Any]] = None,
+        level: Optional[MutableMapping[str, Any]] = None,
+        degrade: Optional[MutableMapping[str, Any]] = None,
+        ignore_case: bool = False,
+        match: Optional[str] = None,
+        no_match: Optional[str] = None,
+        negate: bool = False,
+        rarity_exclude: Optional[Iterable[str]] = None,
+    ):
+        self.negate = negate
+        # The parser fills in every slot and rarity when none are asked for, which never filters anything.
+        self.slots = slots if slots and slots != list(Slot) else None
+        self.rarities = rarities if rarities and rarities != list(Rarities) else None
+        self.sets = sets or None
+        if self.sets and not negate:
+            # Asking for a set only ever lists set items.
+            self.rarities = [r for r in (self.rarities or [Rarities.set]) if r is Rarities.set]
+        self.excluded = [Rarities[name] for name in rarity_exclude] if rarity_exclude else None
+        self.equippable = equippable
+        text_tests: List[_Test] = []
+        if no_match:
+            # no_match is the only criterion that passes when it is not found.
+            contains = _text_test(no_match, ignore_case)
+            text_tests.append((None, lambda item: not contains(item)))
+        if match:
+            text_tests.append((None, _text_test(match, ignore_case)))
+        # (stat, bounds, per hand, inclusive max, rarities it applies to)
+        ranges: List[Tuple[str, MutableMapping[str, Any], bool, bool, Optional[Tuple[Rarities, ...]]]] = []
+        if degrade:
+            ranges.append(("degrade", degrade, False, False, self.DEGRADING))
+        if level:
+            ranges.append(("lvl", level, False, False, None))
+        for bounds, stat in ((dexterity, "dex"), (luck, "luck"), (charisma, "cha"), (intelligence, "int")):
+            if bounds:
+                ranges.append((stat, bounds, True, False, None))
+        if strength:
+            ranges.append(("att", strength, True, True, None))
+        self.text_tests = text_tests
+        self.ranges = ranges
+        self.tests = text_tests + [
+            (
+                None if rarities is None else lambda item, rarities=rarities: item.rarity in rarities,
+                _range_test(bounds, stat, per_hand=per_hand, inclusive_max=inclusive_max),
+            )
+            for stat, bounds, per_hand, inclusive_max, rarities in ranges
+        ]
+
+    @classmethod
+    def from_query(
+        cls, query: MutableMapping[str, Any], rarity_exclude: Optional[Iterable[str]] = None
+    ) -> BackpackFilter:
+        """Compile the filter from the output of ``BackpackFilterParser``, removing the keys it uses."""
+        return cls(
+            slots=query.pop("slot", []),
+            rarities=query.pop("rarity", []),
+            sets=query.pop("set", []),
+            equippable=query.pop("equippable", False),
+            strength=query.pop("strength", {}),
+            intelligence=query.pop("intelligence", {}),
+            charisma=query.pop("charisma", {}),
+            luck=query.pop("luck", {}),
+            dexterity=query.pop("dexterity", {}),
+            level=query.pop("level", {}),
+            degrade=query.pop("degrade", {}),
+            ignore_case=query.pop("icase", False),
+            match=query.pop("match", None),
+            no_match=query.pop("no_match", None),
+            negate=query.pop("except", False),
+            rarity_exclude=rarity_exclude,
+        )
+
+    def candidates(self, backpack: Backpack) -> Set[str]:
+        """The names in the backpack that pass the slot, rarity and set criteria."""
+        backpack._build_index()
+        if not self.negate:
+            names = backpack._matching(self.slots, self.rarities, self.sets, self.excluded)
+            return set(backpack) if names is None else names
+        names = set(backpack)
+        for slots, rarities, sets in ((self.slots, None, None), (None, self.rarities, None), (None, None, self.sets)):
+            if slots or rarities or sets:
+                names -= backpack._matching(slots, rarities, sets, None)
+        if self.excluded:
+            names -= backpack._matching(None, self.excluded, None, None)
+        return names
+
+    def apply(self, character: Character) -> List[Tuple[str, List[Item]]]:
+        """Return the matching items in the characters backpack as ``(slot name, items)`` groups.
+
+        Groups are sorted the same way as :meth:`Backpack.sorted_groups`.
+        Large backpacks are filtered with NumPy when it is installed.
+        """
+        backpack = character.backpack
+        backpack._build_index()
+        if (self.ranges or self.equippable) and columnar_available(len(backpack)):
+            names = self._filter_columns(character, backpack.columns())
+        else:
+            names = self._filter_items(character, backpack)
+        return [(items[0].slot.get_name(), items) for items in backpack._groups(names)]
+
+    def _filter_items(self, character: Character, backpack: Backpack) -> Set[str]:
+        tests = self.tests
+        if self.equippable:
+            tests = tests + [(None, lambda item: character.lvl >= character.equip_level(item))]
+        names = self.candidates(backpack)
+        if tests:
+            names = {name for name in names if self._passes(backpack[name], tests)}
+        return names
+
+    def _filter_columns(self, character: Character, columns: BackpackColumns) -> Set[str]:
+        """The same plan as :meth:`_filter_items` worked out as boolean masks over every item at once."""
+        criteria = []
+        if self.slots:
+            criteria.append((None, columns.slot_in(self.slots)))
+        if self.rarities is not None:
+            criteria.append((None, columns.rarity_in(self.rarities)))
+        if self.sets:
+            criteria.append((None, columns.set_in(self.sets)))
+        for stat, bounds, per_hand, inclusive_max, rarities in self.ranges:
+            applies = None if rarities is None else columns.rarity_in(rarities)
+            criteria.append((applies, columns.in_range(stat, bounds, per_hand=per_hand, inclusive_max=inclusive_max)))
+        if self.equippable:
+            criteria.append((None, columns.equip_level(character.rebirths) <= character.lvl))
+        keep = ~columns.rarity_in(self.excluded or [])
+        for applies, passed in criteria:
+            failed = ~passed if not self.negate else passed
+            keep &= ~failed if applies is None else ~(failed & applies)
+        names = columns.select(keep)
+        if self.text_tests:
+            backpack = character.backpack
+            return {name for name in names if self._passes(backpack[name], self.text_tests)}
+        return set(names)
+
+    def _passes(self, item: Item, tests: List[_Test]) -> bool:
+        for applies, test in tests:
+            if (applies is None or applies(item)) and test(item) is self.negate:
+                return False
+        return True
+
+
+@functools.lru_cache(maxsize=ROW_CACHE_SIZE)
+def _backpack_lines(*cells: str) -> Tuple[Tuple[Tuple[str, int], ...], int, int]:
+    """The lines ``cells`` take up in a backpack page with their widths.
+
+    Also returns the width of the widest line including its padding and how many
+    characters of the lines are escape codes.
+    """
+    lines = tuple(line for cell in cells for line in cell_lines(cell, BACKPACK_CELL_WIDTH))
+    return lines, max(width for _line, width in lines) + 2, sum(len(line) - width for line, width in lines)
+
+
+EQUIPMENT_SLOTS = ("head", "neck", "chest", "gloves", "belt", "legs", "boots", "left", "right", "ring", "charm")
+EQUIPMENT_STATS = ("att", "cha", "int", "dex", "luck")
+
+
+def rebirth_bonus(rebirths: int) -> int:
+    """The stat points every equipment stat gets from the players rebirths.
+
+    The 1st to 9th rebirths are worth 2 points each, the 10th to 19th 1 point,
+    the 20th to 29th 5 points and every one after that 3 points, plus 5 for every 10 rebirths.
+    """
+    return (
+        rebirths // 10 * 5
+        + max(min(rebirths, 9), 0) * 2
+        + max(min(rebirths, 19) - 9, 0)
+        + max(min(rebirths, 29) - 19, 0) * 5
+        + max(rebirths - 29, 0) * 3
+    )
+
+
+def count_set_items(data: dict) -> int:
+    """Count the set items in a stored user document, equipped ones count once per slot."""
+    set_items = 0
+    for item in data.get("items", {}).values():
+        set_items += sum(1 for i in item.values() if i.get("rarity") == "set")
+    for item_data in data.get("backpack", {}).values():
+        if item_data.get("rarity") == "set":
+            set_items += item_data.get("owned", 1)
+    return set_items
+
+
+SET_MULTIPLIERS = ("statmult", "xpmult", "cpmult")
+
+
+def compile_set_bonuses(set_bonuses: Dict[str, List[dict]]) -> Dict[str, List[Dict[str, float]]]:
+    """Turn the tiers in ``set_bonuses.json`` into the total bonus for each number of equipped parts.
+
+    ``table[set_name][parts]`` is what wearing ``parts`` pieces of the set adds to the
+    base bonuses, multipliers are stored as the change to add to them.
+    """
+    tables = {}
+    for set_name, tiers in set_bonuses.items():
+        max_parts = max([bonus.get("parts", 100) for bonus in tiers] or [0])
+        table = [{} for _ in range(max_parts + 1)]
+        for bonus in tiers:
+            required_parts = bonus.get("parts", 100)
+            for key, value in bonus.items():
+                if key == "parts":
+                    continue
+                if key in SET_MULTIPLIERS:
+                    if value < 0:
+                        continue
+                    value -= 1
+                for totals in table[required_parts:]:
+                    totals[key] = totals.get(key, 0) + value
+        tables[set_name] = table
+    return tables
+
+
+def compile_set_pieces(tr_set: Dict[str, dict]) -> Dict[str, Dict[str, dict]]:
+    """Group the items in ``tr_set.json`` by the set they belong to."""
+    pieces = {}
+    for name, data in tr_set.items():
+        pieces.setdefault(data.get("set"), {})[name] = data
+    return pieces
+
+
+class _EquipmentSlot:
+    """An equipment slot on :class:`Character` that keeps the characters equipment stats current."""
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance: Optional[Character], owner=None):
+        if instance is None:
+            return self
+        return instance._equipped[self.name]
+
+    def __set__(self, instance: Character, item: Optional[Item]):
+        instance._set_equipment(self.name, item)
+
+
 class Character:
     """An class to represent the characters stats."""
 
+    head: Optional[Item] = _EquipmentSlot()
+    neck: Optional[Item] = _EquipmentSlot()
+    chest: Optional[Item] = _EquipmentSlot()
+    gloves: Optional[Item] = _EquipmentSlot()
+    belt: Optional[Item] = _EquipmentSlot()
+    legs: Optional[Item] = _EquipmentSlot()
+    boots: Optional[Item] = _EquipmentSlot()
+    left: Optional[Item] = _EquipmentSlot()
+    right: Optional[Item] = _EquipmentSlot()
+    ring: Optional[Item] = _EquipmentSlot()
+    charm: Optional[Item] = _EquipmentSlot()
+
     def __init__(self, **kwargs):
         self._ctx: commands.Context = kwargs.pop("ctx")
         self.exp: int = kwargs.pop("exp")
         self.lvl: int = kwargs.pop("lvl")
         self.treasure: Treasure = kwargs.pop("treasure", Treasure())
-        self.head: Item = kwargs.pop("head")
-        self.neck: Item = kwargs.pop("neck")
-        self.chest: Item = kwargs.pop("chest")
-        self.gloves: Item = kwargs.pop("gloves")
-        self.belt: Item = kwargs.pop("belt")
-        self.legs: Item = kwargs.pop("legs")
-        self.boots: Item = kwargs.pop("boots")
-        self.left: Item = kwargs.pop("left")
-        self.right: Item = kwargs.pop("right")
-        self.ring: Item = kwargs.pop("ring")
-        self.charm: Item = kwargs.pop("charm")
-        self.backpack: dict = kwargs.pop("backpack")
+        self._equipped: Dict[str, Optional[Item]] = {slot: kwargs.pop(slot) for slot in EQUIPMENT_SLOTS}
+        self._equipment_stats: Dict[str, int] = dict.fromkeys(EQUIPMENT_STATS, 0)
+        for item in self._equipped.values():
+            if item:
+                self._add_equipment_stats(item, 1)
+        self.backpack: Backpack = kwargs.pop("backpack")
         self.loadouts: dict = kwargs.pop("loadouts")
         self.heroclass: dict = kwargs.pop("heroclass")
         self.skill: dict = kwargs.pop("skill")
@@ -397,7 +1214,8 @@ class Character:
         self.get_set_bonus()
         self.maxlevel = self.get_max_level()
         self.lvl = self.lvl if self.lvl < self.maxlevel else self.maxlevel
-        self.set_items = self.get_set_item_count()
+        set_items = kwargs.pop("set_items", None)
+        self.set_items: int = self.get_set_item_count() if set_items is None else set_items
         self.att, self._att = self.get_stat_value("att")
         self.cha, self._cha = self.get_stat_value("cha")
         self.int, self._int = self.get_stat_value("int")
@@ -491,53 +1309,50 @@ class Character:
         return item.lvl if item.rarity is Rarities.event else max(item.lvl - min(max(level // 2 - 1, 0), 50), 1)
 
     def get_stat_value(self, stat: str):
-        """Calculates the stats dynamically for each slot of equipment."""
-        extrapoints = 0
-        rebirths = copy(self.rebirths)
-        extrapoints += rebirths // 10 * 5
+        """Return the stat with and without set bonuses applied.
 
-        for _loop_counter in range(rebirths):
-            if rebirths >= 30:
-                extrapoints += 3
-            elif rebirths >= 20:
-                extrapoints += 5
-            elif rebirths >= 10:
-                extrapoints += 1
-            elif rebirths < 10:
-                extrapoints += 2
-            rebirths -= 1
-
-        extrapoints = int(extrapoints)
-
-        stats = 0 + extrapoints
-        for slot in Slot:
-            if slot is Slot.two_handed:
-                continue
-            try:
-                item = getattr(self, slot.name)
-                if item:
-                    stats += int(getattr(item, stat))
-            except Exception as exc:
-                log.error(f"error calculating {stat}", exc_info=exc)
+        Equipment stats are kept up to date as items are equipped and unequipped.
+        """
+        stats = rebirth_bonus(self.rebirths) + self._equipment_stats[stat]
         return (
             int(stats * self.gear_set_bonus.get("statmult", 1)) + self.gear_set_bonus.get(stat, 0),
             stats,
         )
 
+    def _add_equipment_stats(self, item: Item, sign: int):
+        stats = self._equipment_stats
+        for stat in EQUIPMENT_STATS:
+            try:
+                stats[stat] += sign * int(getattr(item, stat))
+            except Exception as exc:
+                log.error(f"error calculating {stat}", exc_info=exc)
+
+    def _set_equipment(self, slot: str, item: Optional[Item]):
+        current = self._equipped[slot]
+        if current is item:
+            return
+        self._equipped[slot] = item
+        if current:
+            self._add_equipment_stats(current, -1)
+            if current.rarity is Rarities.set:
+                self.set_items -= 1
+        if item:
+            self._add_equipment_stats(item, 1)
+            if item.rarity is Rarities.set:
+                self.set_items += 1
+        if (current and current.set) or (item and item.set):
+            self.get_set_bonus()
+
     async def get_set_count(self, return_items: bool = False, set_name: str = None):
         set_names = {}
         returnable_items = []
         item_names = set()
-        async for item in AsyncIter(self.backpack, steps=100):
-            item = self.backpack[item]
-            if item.rarity is not Rarities.set:
-                continue
+        set_items = self.backpack.find(rarities=[Rarities.set], set_name=set_name or None)
+        async for item in AsyncIter(set_items, steps=100):
             if item.name in item_names:
                 continue
             if not item.set:
                 continue
-            if set_name and set_name != item.set:
-                continue
             if item.set and item.set not in set_names:
                 returnable_items.append(item)
                 item_names.add(item.name)
@@ -549,18 +1364,14 @@ class Character:
                 set_names[item.set] = (parts, count + 1)
         if return_items:
             return returnable_items
-        for set_name in self._ctx.bot.get_cog("Adventure").SET_BONUSES:
+        for set_name, parts in self._ctx.bot.get_cog("Adventure").SET_PARTS.items():
             if set_name in set_names:
                 continue
-            set_names[set_name] = (
-                max(bonus["parts"] for bonus in self._ctx.bot.get_cog("Adventure").SET_BONUSES[set_name]),
-                0,
-            )
+            set_names[set_name] = (parts, 0)
         return set_names
 
     def get_set_bonus(self):
         set_names = {}
-        last_slot = ""
         base = {
             "att": 0,
             "cha": 0,
@@ -571,44 +1382,24 @@ class Character:
             "xpmult": 1,
             "cpmult": 1,
         }
-        added = []
-        for slots in Slot:
-            if slots is Slot.two_handed:
+        added = set()
+        for item in self._equipped.values():
+            if item is None or not item.set or item.name in added:
                 continue
-            if last_slot == "two handed":
-                last_slot = slots
-                continue
-            item = getattr(self, slots.name)
-            if item is None or item.name in added:
+            added.add(item.name)
+            if item.set not in set_names:
+                set_names[item.set] = (item.parts, 1)
+            else:
+                parts, count = set_names[item.set]
+                set_names[item.set] = (parts, count + 1)
+        self.sets = [s for s, v in set_names.items() if s and v[1] >= v[0]]
+        set_bonus_tables = self._ctx.bot.get_cog("Adventure").SET_BONUS_TABLES
+        for _set, (_parts, count) in set_names.items():
+            table = set_bonus_tables.get(_set)
+            if not table:
                 continue
-            if item.set and item.set not in set_names:
-                added.append(item.name)
-                set_names.update(
-                    {item.set: (item.parts, 1, self._ctx.bot.get_cog("Adventure").SET_BONUSES.get(item.set, []))}
-                )
-            elif item.set and item.set in set_names:
-                added.append(item.name)
-                parts, count, bonus = set_names[item.set]
-                set_names[item.set] = (parts, count + 1, bonus)
-        full_sets = [(s, v[1]) for s, v in set_names.items() if v[1] >= v[0]]
-        partial_sets = [(s, v[1]) for s, v in set_names.items()]
-        self.sets = [s for s, _ in full_sets if s]
-        for _set, parts in partial_sets:
-            set_bonuses = self._ctx.bot.get_cog("Adventure").SET_BONUSES.get(_set, [])
-            for bonus in set_bonuses:
-                required_parts = bonus.get("parts", 100)
-                if required_parts > parts:
-                    continue
-                for key, value in bonus.items():
-                    if key == "parts":
-                        continue
-                    if key not in ["cpmult", "xpmult", "statmult"]:
-                        base[key] += value
-                    elif key in ["cpmult", "xpmult", "statmult"]:
-                        if value > 1:
-                            base[key] += value - 1
-                        elif value >= 0:
-                            base[key] -= 1 - value
+            for key, value in table[min(count, len(table) - 1)].items():
+                base[key] += value
         self.gear_set_bonus = base
         self.gear_set_bonus["cpmult"] = max(0, self.gear_set_bonus["cpmult"])
         self.gear_set_bonus["xpmult"] = max(0, self.gear_set_bonus["xpmult"])
@@ -789,38 +1580,17 @@ class Character:
         reverse_rarities = list(reversed(Rarities))
         return reverse_rarities.index(rarity)
 
-    async def get_sorted_backpack(self, backpack: dict, slot: Optional[Slot] = None, rarity: Optional[Rarities] = None):
-        tmp = {}
-
-        def _sort(item):
-            return self.get_rarity_index(item.rarity), item.lvl, item.total_stats
-
-        async for item in AsyncIter(backpack, steps=100):
-            slots = backpack[item].slot
-            slot_name = slots.get_name()
-            # if slots is Slot.two_handed:
-            # slot_name = "two handed"
-            if slot is not None and slots is not slot:
-                continue
-            if rarity is not None and rarity is not backpack[item].rarity:
-                continue
-
-            if slot_name not in tmp:
-                tmp[slot_name] = []
-            tmp[slot_name].append(backpack[item])
-        slots = sorted(list(tmp.keys()), key=self.get_slot_index)
-        final = []
-        async for (idx, slot_name) in AsyncIter(slots, steps=100).enumerate():
-            if tmp[slot_name]:
-                final.append(sorted(tmp[slot_name], key=_sort))
-        return final
+    async def get_sorted_backpack(
+        self, backpack: Backpack, slot: Optional[Slot] = None, rarity: Optional[Rarities] = None
+    ):
+        return backpack.sorted_groups(slot=slot, rarity=rarity)
 
     async def looted(self, how_many: int = 1, exclude: Optional[Set[Rarities]] = None) -> List[Tuple[str, int]]:
         if exclude is None:
             exclude = {Rarities.forged, Rarities.event}
         exclude.add(Rarities.forged)
         exclude.add(Rarities.event)
-        items = [i for i in self.backpack.values() if i.rarity not in exclude]
+        items = self.backpack.find(exclude=exclude)
         looted_so_far = 0
         looted = []
         if not items:
@@ -841,22 +1611,31 @@ class Character:
             loot_number = random.randint(1, min(item.owned, how_many - looted_so_far))
             looted_so_far += loot_number
             looted.append((item.ansi, loot_number))
-            item.owned -= loot_number
-            if item.owned <= 0:
-                del self.backpack[item.name]
-            else:
-                self.backpack[item.name] = item
+            self.remove_from_backpack(item, loot_number)
         return looted
 
     async def make_backpack_tables(
         self, items: List[Item], title: str = "", show_delta: bool = False, include_total: bool = False
     ) -> List[BackpackTable]:
-        table = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-        table.set_style(BeautifulTable.STYLE_RST)
-        table.border.top = ""
-        table.border.bottom = ""
-        tables = []
-        items_group = []
+        return list(self.iter_backpack_tables(items, title, show_delta, include_total))
+
+    def lazy_backpack_tables(
+        self, items: List[Item], title: str = "", show_delta: bool = False, include_total: bool = False
+    ) -> LazyPages[BackpackTable]:
+        """Backpack tables drawn as they are shown, see :meth:`make_backpack_tables`."""
+
+        def estimate(tables: List[BackpackTable]) -> int:
+            shown = sum(len(table.items) for table in tables)
+            if not shown:
+                return len(tables) + 1
+            return len(tables) + math.ceil((len(items) - shown) * len(tables) / shown)
+
+        return LazyPages(self.iter_backpack_tables(items, title, show_delta, include_total), estimate)
+
+    def iter_backpack_tables(
+        self, items: List[Item], title: str = "", show_delta: bool = False, include_total: bool = False
+    ) -> Iterator[BackpackTable]:
+        pages = 0
         headers = [
             # "Name",
             # "Slot",
@@ -870,72 +1649,49 @@ class Character:
             # "DEG",
             # "SET",
         ]
-        # table.columns.header = headers
-        headertable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-        headertable.set_style(BeautifulTable.STYLE_RST)
-        # subtable.rows.append(["Name"])
-        headertable.columns.width = COLUMN_WIDTHS
+        headertable = AnsiTable(widths=COLUMN_WIDTHS, top_border=False)
         headertable.rows.append(headers)
-        headertable.border.top = ""
-        # table.rows.append(["Name"])
-        table.rows.append([headertable])
         # used for displaying the "headers"
-
-        footer = _("\nPage {page_num}").format(page_num=len(tables) + 1)
-        att = 0
-        cha = 0
-        intel = 0
-        dex = 0
-        luck = 0
+        header_lines, header_width, header_escapes = _backpack_lines(str(headertable))
+
+        def make_page(footer: str) -> BackpackTable:
+            lines, width = page_lines, page_width
+            if include_total:
+                totaltable = AnsiTable(widths=COLUMN_WIDTHS)
+                totaltable.rows.append(totals)
+                # used when the total is to be included at the bottom
+                total_lines, total_width, _escapes = _backpack_lines(_("Total"), str(totaltable))
+                lines, width = lines + list(total_lines), max(width, total_width)
+            table = "\n".join(align(line, line_width, width) for line, line_width in lines)
+            return BackpackTable(table=box(f"{title}\n{table} {footer}", lang="ansi"), items=items_group)
+
+        # Every line of a page is padded to its widest line, so the length of the page is known
+        # from the number of lines, their width and the escape codes in them.
+        footer = _("\nPage {page_num}").format(page_num=pages + 1)
+        page_lines, page_width, page_escapes = list(header_lines), header_width, header_escapes
+        items_group = []
+        totals = [0, 0, 0, 0, 0]
         for item in items:
-            footer = _("\nPage {page_num}").format(page_num=len(tables) + 1)
-            item_name, item_row = item.row(self, show_delta=show_delta)
-            items_group.append(item)
-            table.rows.append([item_name])
-            table.rows.append([item_row])
-            if len(title + str(table) + footer) > 1600:
-                table.rows.pop()
-                table.rows.pop()
-                items_group.pop()
-                if include_total:
-                    totaltable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-                    totaltable.set_style(BeautifulTable.STYLE_RST)
-                    totaltable.columns.width = COLUMN_WIDTHS
-                    totaltable.rows.append([att, cha, intel, dex, luck])
-                    # used when the total is to be included at the bottom
-                    table.rows.append([_("Total")])
-                    table.rows.append([totaltable])
-                att = 0
-                cha = 0
-                intel = 0
-                dex = 0
-                luck = 0
-
-                tables.append(BackpackTable(table=box(f"{title}\n{table} {footer}", lang="ansi"), items=items_group))
+            footer = _("\nPage {page_num}").format(page_num=pages + 1)
+            item_lines, item_width, item_escapes = _backpack_lines(*item.row(self, show_delta=show_delta))
+            line_count = len(page_lines) + len(item_lines)
+            width = max(page_width, item_width)
+            escapes = page_escapes + item_escapes
+            if len(title) + line_count * (width + 1) - 1 + escapes + len(footer) > 1600:
+                yield make_page(footer)
+                pages += 1
+                totals = [0, 0, 0, 0, 0]
                 items_group = []
-                table = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-                table.set_style(BeautifulTable.STYLE_RST)
-                table.border.top = ""
-                table.border.bottom = ""
-                table.rows.append([headertable])
-                # table.columns.header = headers
-                table.rows.append([item_name])
-                table.rows.append([item_row])
-                items_group.append(item)
-            att += item.att * (1 if item.slot is not Slot.two_handed else 2)
-            cha += item.cha * (1 if item.slot is not Slot.two_handed else 2)
-            intel += item.int * (1 if item.slot is not Slot.two_handed else 2)
-            dex += item.dex * (1 if item.slot is not Slot.two_handed else 2)
-            luck += item.luck * (1 if item.slot is not Slot.two_handed else 2)
-        if include_total:
-            totaltable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
-            totaltable.set_style(BeautifulTable.STYLE_RST)
-            totaltable.columns.width = COLUMN_WIDTHS
-            totaltable.rows.append([att, cha, intel, dex, luck])
-            table.rows.append([_("Total")])
-            table.rows.append([totaltable])
-        tables.append(BackpackTable(table=box(f"{title}\n{table} {footer}", lang="ansi"), items=items_group))
-        return tables
+                page_lines = list(header_lines)
+                width = max(header_width, item_width)
+                escapes = header_escapes + item_escapes
+            page_lines += item_lines
+            page_width, page_escapes = width, escapes
+            items_group.append(item)
+            mult = 1 if item.slot is not Slot.two_handed else 2
+            for index, stat in enumerate(EQUIPMENT_STATS):
+                totals[index] += getattr(item, stat) * mult
+        yield make_page(footer)
 
     async def get_backpack(
         self,
@@ -950,7 +1706,7 @@ class Character:
     ):
         if consumed is None:
             consumed = []
-        bkpk = await self.get_sorted_backpack(self.backpack, slot=slot, rarity=rarity)
+        bkpk = self.backpack.sorted_groups(slot=slot, rarity=rarity, set_name=set_name)
         consumed_list = consumed
         rows = []
         if not forging:
@@ -959,295 +1715,27 @@ class Character:
             msg = _("{author}'s forgeables\n\n").format(author=escape(self.user.display_name, formatting=True))
         # subtable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
         async for slot_group in AsyncIter(bkpk, steps=100):
-            slot_name_org = slot_group[0].slot
-            if slot is not None and slot is not slot_name_org:
-                continue
-            if clean and not slot_group:
-                continue
             async for item in AsyncIter(slot_group, steps=100):
                 if forging and (item.rarity in [Rarities.forged, Rarities.set] or item in consumed_list):
                     continue
                 if forging and item.rarity is Rarities.ascended:
                     if self.rebirths < 30:
                         continue
-                if rarity is not None and rarity is not item.rarity:
-                    continue
                 if equippable and not self.can_equip(item):
                     continue
-                if set_name is not None and set_name != item.set:
-                    continue
                 rows.append(item)
-        return await self.make_backpack_tables(rows, msg, show_delta)
+        return self.lazy_backpack_tables(rows, msg, show_delta)
 
-    async def get_sorted_backpack_arg_parse(
-        self,
-        backpack: dict,
-        slots: List[Slot],
-        rarities: List[Rarities],
-        sets: List[str],
-        equippable: bool,
-        _except: bool,
-        strength: MutableMapping[str, Any],
-        intelligence: MutableMapping[str, Any],
-        charisma: MutableMapping[str, Any],
-        luck: MutableMapping[str, Any],
-        dexterity: MutableMapping[str, Any],
-        level: MutableMapping[str, Any],
-        degrade: MutableMapping[str, Any],
-        ignore_case: bool,
-        match: Optional[str],
-        no_match: Optional[str],
-        rarity_exclude: List[str] = None,
-    ):
-        tmp = {}
-
-        def _sort(item):
-            return self.get_rarity_index(item.rarity), item.lvl, item.total_stats
-
-        if not _except:
-            async for item_name in AsyncIter(backpack, steps=100):
-                item = backpack[item_name]
-                item_slots = item.slot
-                slot_name = item_slots.get_name()
-                mult = 2 if item.slot is Slot.two_handed else 1
-                if rarity_exclude is not None and item.rarity.name in rarity_exclude:
-                    continue
-
-                if no_match:
-                    actual_item_name = str(item)
-                    if ignore_case:
-                        if no_match.lower() in actual_item_name.lower():
-                            continue
-                    elif no_match in actual_item_name:
-                        continue
-                if match:
-                    actual_item_name = str(item)
-                    if ignore_case:
-                        if match.lower() not in actual_item_name.lower():
-                            continue
-                    elif match not in actual_item_name:
-                        continue
-                if slots and item_slots not in slots:
-                    continue
-                if sets and item.rarity is not Rarities.set:
-                    continue
-                elif rarities and item.rarity not in rarities:
-                    continue
-                if sets and item.set not in sets:
-                    continue
-                e_level = self.equip_level(item)
-                if equippable and self.lvl < e_level:
-                    continue
-                if degrade and item.rarity in [Rarities.legendary, Rarities.ascended, Rarities.event]:
-                    if (d := degrade.get("equal")) is not None:
-                        if item.degrade != d:
-                            continue
-                    elif not degrade["min"] < item.degrade < degrade["max"]:
-                        continue
-                if level:
-                    if (d := level.get("equal")) is not None:
-                        if item.lvl != d:
-                            continue
-                    elif not level["min"] < item.lvl < level["max"]:
-                        continue
-                if dexterity:
-                    if (d := dexterity.get("equal")) is not None:
-                        if item.dex * mult != d:
-                            continue
-                    elif not dexterity["min"] < item.dex * mult < dexterity["max"]:
-                        continue
-                if luck:
-                    if (d := luck.get("equal")) is not None:
-                        if item.luck * mult != d:
-                            continue
-                    elif not luck["min"] < item.luck * mult < luck["max"]:
-                        continue
-                if charisma:
-                    if (d := charisma.get("equal")) is not None:
-                        if item.cha * mult != d:
-                            continue
-                    elif not charisma["min"] < item.cha * mult < charisma["max"]:
-                        continue
-                if intelligence:
-                    if (d := intelligence.get("equal")) is not None:
-                        if item.int * mult != d:
-                            continue
-                    elif not intelligence["min"] < item.int * mult < intelligence["max"]:
-                        continue
-                if strength:
-                    if (d := strength.get("equal")) is not None:
-                        if item.att * mult != d:
-                            continue
-                    elif not strength["min"] < item.att * mult <= strength["max"]:
-                        continue
-
-                if slot_name not in tmp:
-                    tmp[slot_name] = []
-                tmp[slot_name].append(item)
-        else:
-            rarities = [] if rarities == [i for i in Rarities] else rarities
-            slots = [] if slots == [i for i in Slot] else slots
-            async for item_name in AsyncIter(backpack, steps=100):
-                item = backpack[item_name]
-                item_slots = item.slot
-                slot_name = item_slots.get_name()
-                mult = 2 if item.slot is Slot.two_handed else 1
-                if rarity_exclude is not None and item.rarity in rarity_exclude:
-                    continue
-
-                if no_match:
-                    actual_item_name = str(item)
-                    if ignore_case:
-                        if no_match.lower() not in actual_item_name.lower():
-                            continue
-                    elif no_match not in actual_item_name:
-                        continue
-                if match:
-                    actual_item_name = str(item)
-                    if ignore_case:
-                        if match.lower() in actual_item_name.lower():
-                            continue
-                    elif match in actual_item_name:
-                        continue
-                if slots and item_slots in slots:
-                    continue
-                elif rarities and item.rarity in rarities:
-                    continue
-                if sets and item.set in sets:
-                    continue
-                e_level = self.equip_level(item)
-                if equippable and self.lvl >= e_level:
-                    continue
-                if degrade and item.rarity in [Rarities.legendary, Rarities.ascended, Rarities.event]:
-                    if (d := degrade.get("equal")) is not None:
-                        if item.degrade == d:
-                            continue
-                    elif degrade["min"] < item.degrade < degrade["max"]:
-                        continue
-                if level:
-                    if (d := level.get("equal")) is not None:
-                        if item.lvl == d:
-                            continue
-                    elif level["min"] < item.lvl < level["max"]:
-                        continue
-                if dexterity:
-                    if (d := dexterity.get("equal")) is not None:
-                        if item.dex * mult == d:
-                            continue
-                    elif dexterity["min"] < item.dex * mult < dexterity["max"]:
-                        continue
-                if luck:
-                    if (d := luck.get("equal")) is not None:
-                        if item.luck * mult == d:
-                            continue
-                    elif luck["min"] < item.luck * mult < luck["max"]:
-                        continue
-                if charisma:
-                    if (d := charisma.get("equal")) is not None:
-                        if item.cha * mult == d:
-                            continue
-                    elif charisma["min"] < item.cha * mult < charisma["max"]:
-                        continue
-                if intelligence:
-                    if (d := intelligence.get("equal")) is not None:
-                        if item.int * mult == d:
-                            continue
-                    elif intelligence["min"] < item.int * mult < intelligence["max"]:
-                        continue
-                if strength:
-                    if (d := strength.get("equal")) is not None:
-                        if item.att * mult == d:
-                            continue
-                    elif strength["min"] < item.att * mult <= strength["max"]:
-                        continue
-                if slot_name not in tmp:
-                    tmp[slot_name] = []
-                tmp[slot_name].append(item)
-
-        slots = sorted(list(tmp.keys()), key=self.get_slot_index)
-        final = []
-        async for (idx, slot_name) in AsyncIter(slots, steps=100).enumerate():
-            if tmp[slot_name]:
-                final.append((slot_name, sorted(tmp[slot_name], key=_sort)))
-        return final
-
-    async def get_argparse_backpack(self, query: MutableMapping[str, Any]) -> List[str]:
+    async def get_argparse_backpack(self, query: MutableMapping[str, Any]) -> LazyPages[BackpackTable]:
         delta = query.pop("delta", False)
-        equippable = query.pop("equippable", False)
-        sets = query.pop("set", [])
-        rarities = query.pop("rarity", [])
-        slots = query.pop("slot", [])
-        strength = query.pop("strength", {})
-        intelligence = query.pop("intelligence", {})
-        charisma = query.pop("charisma", {})
-        luck = query.pop("luck", {})
-        dexterity = query.pop("dexterity", {})
-        level = query.pop("level", {})
-        degrade = query.pop("degrade", {})
-        ignore_case = query.pop("icase", False)
-        match = query.pop("match", None)
-        no_match = query.pop("no_match", None)
-        _except = query.pop("except", False)
-
-        bkpk = await self.get_sorted_backpack_arg_parse(
-            self.backpack,
-            slots=slots,
-            rarities=rarities,
-            sets=sets,
-            equippable=equippable,
-            strength=strength,
-            intelligence=intelligence,
-            charisma=charisma,
-            luck=luck,
-            dexterity=dexterity,
-            level=level,
-            degrade=degrade,
-            match=match,
-            no_match=no_match,
-            ignore_case=ignore_case,
-            _except=_except,
-        )
+        bkpk = BackpackFilter.from_query(query).apply(self)
         items = [item for groups in bkpk for item in groups[1]]
-        return await self.make_backpack_tables(items, show_delta=delta)
+        return self.lazy_backpack_tables(items, show_delta=delta)
 
     async def get_argparse_backpack_items(
         self, query: MutableMapping[str, Any], rarity_exclude: List[str] = None
-    ) -> List[Item]:
-        equippable = query.pop("equippable", False)
-        sets = query.pop("set", [])
-        rarities = query.pop("rarity", [])
-        slots = query.pop("slot", [])
-        strength = query.pop("strength", {})
-        intelligence = query.pop("intelligence", {})
-        charisma = query.pop("charisma", {})
-        luck = query.pop("luck", {})
-        dexterity = query.pop("dexterity", {})
-        level = query.pop("level", {})
-        degrade = query.pop("degrade", {})
-        ignore_case = query.pop("icase", False)
-        match = query.pop("match", None)
-        no_match = query.pop("no_match", None)
-        _except = query.pop("except", False)
-
-        bkpk = await self.get_sorted_backpack_arg_parse(
-            self.backpack,
-            slots=slots,
-            rarities=rarities,
-            sets=sets,
-            equippable=equippable,
-            strength=strength,
-            intelligence=intelligence,
-            charisma=charisma,
-            luck=luck,
-            dexterity=dexterity,
-            level=level,
-            degrade=degrade,
-            match=match,
-            no_match=no_match,
-            ignore_case=ignore_case,
-            _except=_except,
-        )
-        return bkpk
+    ) -> List[Tuple[str, List[Item]]]:
+        return BackpackFilter.from_query(query, rarity_exclude=rarity_exclude).apply(self)
 
     def get_equipped_delta(self, equiped: Optional[Item], to_compare: Optional[Item], stat_name: str) -> str:
         if (equiped and equiped.slot is Slot.two_handed) and (to_compare and to_compare.slot is Slot.two_handed):
@@ -1276,11 +1764,8 @@ class Character:
                 if not from_backpack:
                     await self.add_to_backpack(item)
                 return self
-        if from_backpack and item.name in self.backpack:
-            if self.backpack[item.name].owned > 1:
-                self.backpack[item.name].owned -= 1
-            else:
-                del self.backpack[item.name]
+        if from_backpack:
+            self.remove_from_backpack(item)
         if item.slot is not Slot.two_handed:
             current = getattr(self, item.slot.name)
             if current:
@@ -1312,6 +1797,21 @@ class Character:
                 self.backpack[item.name].owned += number
             else:
                 self.backpack[item.name] = item
+                number = item.owned
+            if item.rarity is Rarities.set:
+                self.set_items += number
+
+    def remove_from_backpack(self, item: Item, number: int = 1):
+        """Take ``number`` of an item out of the backpack, removing it once none are left."""
+        if item.name not in self.backpack:
+            return
+        item = self.backpack[item.name]
+        removed = min(number, max(item.owned, 0))
+        item.owned -= number
+        if item.owned <= 0:
+            del self.backpack[item.name]
+        if item.rarity is Rarities.set:
+            self.set_items -= removed
 
     async def equip_loadout(self, loadout_name):
         loadout = self.loadouts[loadout_name]
@@ -1372,10 +1872,7 @@ class Character:
 
     async def unequip_item(self, item: Item):
         """This handles moving an item equipment to backpack."""
-        if item.name in self.backpack:
-            self.backpack[item.name].owned += 1
-        else:
-            self.backpack[item.name] = item
+        await self.add_to_backpack(item)
         if item.slot is not Slot.two_handed:
             setattr(self, item.slot.name, None)
         else:
@@ -1390,9 +1887,14 @@ class Character:
         config: Config,
         user: Union[discord.Member, discord.User],
         daily_bonus_mapping: Dict[str, float],
+        data: Optional[dict] = None,
     ):
-        """Return a Character object from config and user."""
-        data = await config.user(user).all()
+        """Return a Character object from config and user.
+
+        ``data`` can be passed to build the character from an already loaded user document.
+        """
+        if data is None:
+            data = await config.user(user).all()
         try:
             balance = await bank.get_balance(user)
         except Exception:
@@ -1418,12 +1920,12 @@ class Character:
             heroclass = data["heroclass"]
         if "backpack" not in data:
             # helps move old data to new format
-            backpack = {}
+            backpack = Backpack(ctx)
             for n, i in data["items"]["backpack"].items():
                 item = Item.from_json(ctx, {n: i})
                 backpack[item.name] = item
         else:
-            backpack = {n: Item.from_json(ctx, {n: i}) for n, i in data["backpack"].items()}
+            backpack = Backpack(ctx, data["backpack"])
         while len(data["treasure"]) < 5:
             data["treasure"].append(0)
 
@@ -1483,7 +1985,7 @@ class Character:
             "bal": balance,
             "user": user,
             "rebirths": data.pop("rebirths", 0),
-            "set_items": data.get("set_items", 0),
+            "set_items": data.get("set_items"),
         }
         for k, v in equipment.items():
             hero_data[k] = v
@@ -1493,30 +1995,17 @@ class Character:
         return cls(**hero_data, ctx=ctx, daily_bonus_mapping=daily_bonus_mapping)
 
     def get_set_item_count(self):
-        count_set = 0
-        last_slot = ""
-        for slots in Slot:
-            if slots is Slot.two_handed:
-                continue
-            if last_slot == "two handed":
-                last_slot = slots
-                continue
-            item = getattr(self, slots.name)
-            if item is None:
-                continue
-            if item.rarity in [Rarities.set]:
-                count_set += 1
-        for k, v in self.backpack.items():
-            for n, i in v.to_json().items():
-                if i.get("rarity", False) in ["set"]:
-                    count_set += v.owned
+        """Count the set items this character has by looking through everything they own.
+
+        ``set_items`` is kept up to date as items move around, this is only needed for
+        sheets that have no stored count or to check that count.
+        """
+        count_set = sum(1 for item in self._equipped.values() if item and item.rarity is Rarities.set)
+        count_set += self.backpack.count_owned(Rarities.set)
         return count_set
 
     async def to_json(self, ctx: commands.Context, config: Config) -> dict:
-        backpack = {}
-        for k, v in self.backpack.items():
-            for n, i in v.to_json().items():
-                backpack[n] = i
+        backpack = self.backpack.to_json()
 
         if self.hc is HeroClasses.ranger and self.heroclass.get("pet"):
             theme = await config.theme()
@@ -1558,6 +2047,13 @@ class Character:
             "last_known_currency": self.last_known_currency,
         }
 
+    async def to_json_changes(
+        self, ctx: commands.Context, config: Config, original: Optional[dict]
+    ) -> Tuple[dict, ChangeSet]:
+        """Serialize the character and work out what changed compared to ``original``."""
+        data = await self.to_json(ctx, config)
+        return data, ChangeSet.between(original, data)
+
     async def rebirth(self, dev_val: int = None) -> dict:
         if dev_val is None:
             self.rebirths += 1
@@ -1616,7 +2112,7 @@ class Character:
 
         self.weekly_score.update({"rebirths": self.weekly_score.get("rebirths", 0) + 1})
         self.heroclass["cooldown"] = time.time() + 60  # Set skill cooldown to 60s from rebirth
-        return {
+        data = {
             "adventures": self.adventures,
             "nega": self.nega,
             "weekly_score": self.weekly_score,
@@ -1644,10 +2140,11 @@ class Character:
             "heroclass": self.heroclass,
             "skill": {"pool": 0, "att": 0, "cha": 0, "int": 0},
             "rebirths": self.rebirths,
-            "set_items": self.set_items,
             "last_known_currency": 0,
             "last_currency_check": 0,
         }
+        data["set_items"] = count_set_items(data)
+        return data
 
     def keep_equipped(self):
         items_to_keep = {}
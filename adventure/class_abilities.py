@@ -77,7 +77,7 @@ class ClassAbilities(AdventureMixin):
                     currency_name = "credits"
                 spend = round(bal * 0.2)
                 try:
-                    c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                    c = await self.character_store.load(ctx, ctx.author)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     ctx.command.reset_cooldown(ctx)
@@ -128,7 +128,7 @@ class ClassAbilities(AdventureMixin):
                 if not await bank.can_spend(ctx.author, spend):
                     return await class_msg.edit(content=broke, view=None)
                 try:
-                    c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                    c = await self.character_store.load(ctx, ctx.author)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     return
@@ -176,7 +176,7 @@ class ClassAbilities(AdventureMixin):
                             for item in tinker_wep:
                                 del c.backpack[item.name]
                             if current_class is HeroClasses.tinkerer:
-                                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                                await self.character_store.save(ctx, ctx.author, c)
                                 if tinker_wep:
                                     await class_msg.edit(
                                         content=box(
@@ -193,7 +193,7 @@ class ClassAbilities(AdventureMixin):
                                 c.heroclass["pet"] = {}
                                 c.heroclass = clz.to_json()
 
-                                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                                await self.character_store.save(ctx, ctx.author, c)
                                 await self._clear_react(class_msg)
                                 await class_msg.edit(
                                     content=box(
@@ -236,7 +236,7 @@ class ClassAbilities(AdventureMixin):
                         c.heroclass["cooldown"] = max(900, (3600 - max((c.luck + c.total_int) * 2, 0))) + time.time()
                     elif c.hc is HeroClasses.psychic:
                         c.heroclass["cooldown"] = max(300, (900 - max((c.luck - c.total_cha) * 2, 0))) + time.time()
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                     await self._clear_react(class_msg)
                     await class_msg.edit(content=box(now_class_msg, lang="ansi"), view=None)
                     try:
@@ -267,7 +267,7 @@ class ClassAbilities(AdventureMixin):
                 return await smart_embed(ctx, _("This command is not available in DM's on this bot."))
             async with self.get_lock(ctx.author):
                 try:
-                    c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                    c = await self.character_store.load(ctx, ctx.author)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     return
@@ -303,7 +303,7 @@ class ClassAbilities(AdventureMixin):
                                 else _("1 second")
                             ),
                         )
-                    theme = await self.config.theme()
+                    theme = self.settings["theme"]
                     extra_pets = await self.config.themes.all()
                     extra_pets = extra_pets.get(theme, {}).get("pets", {})
                     pet_list = {**self.PETS, **extra_pets}
@@ -387,7 +387,7 @@ class ClassAbilities(AdventureMixin):
                             await user_msg.edit(content=f"{pet_msg}\n{pet_msg2}\n{pet_msg3}")
                             c.heroclass["pet"] = pet_list[pet]
                             c.heroclass["catch_cooldown"] = time.time() + cooldown_time
-                            await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                            await self.character_store.save(ctx, ctx.author, c)
                         elif roll == 1:
                             bonus = _("But they stepped on a twig and scared it away.")
                             pet_msg3 = box(
@@ -417,7 +417,7 @@ class ClassAbilities(AdventureMixin):
             return await smart_embed(ctx, _("You're too distracted with the monster you are facing."))
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -439,7 +439,7 @@ class ClassAbilities(AdventureMixin):
             if c.heroclass["cooldown"] <= time.time():
                 await self._open_chest(ctx, ctx.author, Rarities.pet, character=c)
                 c.heroclass["cooldown"] = time.time() + cooldown_time
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, c)
             else:
                 cooldown_time = int(c.heroclass["cooldown"])
                 return await smart_embed(
@@ -454,7 +454,7 @@ class ClassAbilities(AdventureMixin):
             return await smart_embed(ctx, _("You're too distracted with the monster you are facing."))
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -465,7 +465,7 @@ class ClassAbilities(AdventureMixin):
                 )
             if c.heroclass["pet"]:
                 c.heroclass["pet"] = {}
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, c)
                 return await smart_embed(
                     ctx,
                     _("{user} released their pet into the wild..").format(user=bold(ctx.author.display_name)),
@@ -481,7 +481,7 @@ class ClassAbilities(AdventureMixin):
         """
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -503,7 +503,7 @@ class ClassAbilities(AdventureMixin):
                 if c.heroclass["cooldown"] <= time.time():
                     c.heroclass["ability"] = True
                     c.heroclass["cooldown"] = time.time() + cooldown_time
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
 
                     await smart_embed(
                         ctx,
@@ -530,7 +530,7 @@ class ClassAbilities(AdventureMixin):
         This allows a Psychic to expose the current enemy's weakeness to the party.
         """
         try:
-            c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            c = await self.character_store.load(ctx, ctx.author)
         except Exception:
             log.exception("Error with the new character sheet")
             ctx.command.reset_cooldown(ctx)
@@ -571,7 +571,7 @@ class ClassAbilities(AdventureMixin):
                 c.heroclass["ability"] = True
                 c.heroclass["cooldown"] = time.time() + cooldown_time
                 async with self.get_lock(c.user):
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                     if good:
                         await smart_embed(
                             ctx,
@@ -727,7 +727,7 @@ class ClassAbilities(AdventureMixin):
         """
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -749,7 +749,7 @@ class ClassAbilities(AdventureMixin):
                 if c.heroclass["cooldown"] <= time.time():
                     c.heroclass["ability"] = True
                     c.heroclass["cooldown"] = time.time() + cooldown_time
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                     await smart_embed(
                         ctx,
                         _("{skill} {c} is starting to froth at the mouth... {skill}").format(
@@ -776,7 +776,7 @@ class ClassAbilities(AdventureMixin):
         """
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -799,7 +799,7 @@ class ClassAbilities(AdventureMixin):
                     c.heroclass["ability"] = True
                     c.heroclass["cooldown"] = time.time() + cooldown_time
 
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                     await smart_embed(
                         ctx,
                         _("{skill} {c} is focusing all of their energy... {skill}").format(
@@ -825,7 +825,7 @@ class ClassAbilities(AdventureMixin):
         """
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -847,7 +847,7 @@ class ClassAbilities(AdventureMixin):
                 if c.heroclass["cooldown"] <= time.time():
                     c.heroclass["ability"] = True
                     c.heroclass["cooldown"] = time.time() + cooldown_time
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                     await smart_embed(
                         ctx,
                         _("{skill} {c} is whipping up a performance... {skill}").format(
@@ -879,7 +879,7 @@ class ClassAbilities(AdventureMixin):
             return await smart_embed(ctx, _("This command is not available in DM's on this bot."))
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -904,7 +904,7 @@ class ClassAbilities(AdventureMixin):
                     ignored_rarities.add(Rarities.ascended)
                     ascended_forge_msg += _("\n\nAscended items will be forgeable after 30 rebirths.")
                 consumed = []
-                forgeables_items = [str(i) for n, i in c.backpack.items() if i.rarity not in ignored_rarities]
+                forgeables_items = [str(i) for i in c.backpack.find(exclude=ignored_rarities)]
                 if len(forgeables_items) <= 1:
                     return await smart_embed(
                         ctx,
@@ -948,10 +948,8 @@ class ClassAbilities(AdventureMixin):
                                 lang="ansi",
                             )
                         )
-                    c.backpack[x.name].owned -= 1
-                    if c.backpack[x.name].owned <= 0:
-                        del c.backpack[x.name]
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    c.remove_from_backpack(x)
+                    await self.character_store.save(ctx, ctx.author, c)
                 # save so the items are eaten up already
                 for item in c.get_current_equipment():
                     if item.rarity is Rarities.forged:
@@ -989,10 +987,10 @@ class ClassAbilities(AdventureMixin):
                             del c.backpack[item.name]
                         await view.message.edit(content=created_item, view=None)
                         c.backpack[newitem.name] = newitem
-                        await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, c)
                     else:
                         c.heroclass["cooldown"] = time.time() + cooldown_time
-                        await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, c)
                         mad_forge = box(
                             _("{author}, {newitem} got mad at your rejection and blew itself up.").format(
                                 author=escape(ctx.author.display_name), newitem=newitem.as_ansi()
@@ -1010,7 +1008,7 @@ class ClassAbilities(AdventureMixin):
                     if view.confirmed:
                         c.heroclass["cooldown"] = time.time() + cooldown_time
                         c.backpack[newitem.name] = newitem
-                        await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, c)
                         forged_item = box(
                             _("{author}, your new {newitem} is lurking in your backpack.").format(
                                 author=escape(ctx.author.display_name), newitem=newitem.as_ansi()
@@ -1020,7 +1018,7 @@ class ClassAbilities(AdventureMixin):
                         await view.message.edit(content=forged_item, view=None)
                     else:
                         c.heroclass["cooldown"] = time.time() + cooldown_time
-                        await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, c)
                         mad_forge = box(
                             _("{author}, {newitem} got mad at your rejection and blew itself up.").format(
                                 author=escape(ctx.author.display_name), newitem=newitem.as_ansi()
@@ -1036,7 +1034,7 @@ class ClassAbilities(AdventureMixin):
             ignored_rarities.append(Rarities.ascended)
             ascended_forge_msg += _("\n\nAscended items will be forgeable after 30 rebirths.")
         consumed = []
-        forgeables_items = [str(i) for n, i in c.backpack.items() if i.rarity not in ignored_rarities]
+        forgeables_items = [str(i) for i in c.backpack.find(exclude=ignored_rarities)]
         await smart_embed(
             ctx,
             _(
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping
+
+from .constants import Rarities, Slot
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the backpack falls back to checking items one at a time
+    np = None
+
+if TYPE_CHECKING:
+    from .charsheet import Item
+
+# Backpacks smaller than this are filtered item by item, building the arrays isn't worth it.
+COLUMNAR_MIN_ITEMS = 500
+
+COLUMN_STATS = ("att", "cha", "int", "dex", "luck", "lvl", "degrade")
+SLOT_CODES: Dict[Slot, int] = {slot: code for code, slot in enumerate(Slot)}
+
+
+def columnar_available(size: int) -> bool:
+    """Whether a backpack of this size should be filtered through :class:`BackpackColumns`."""
+    return np is not None and size >= COLUMNAR_MIN_ITEMS
+
+
+class BackpackColumns:
+    """A snapshot of a backpack as NumPy arrays with one row per item in backpack order.
+
+    Rows are named by the backpack keys, so selected names can be looked up in the backpack.
+
+    Stats are stored as floats so the unbounded ends of ``BackpackFilterParser``
+    ranges compare the same way they do against the items themselves.
+    """
+
+    __slots__ = ("names", "stats", "slot", "rarity", "set", "_set_codes")
+
+    def __init__(self, names: List[str], items: List[Item]):
+        count = len(items)
+        self.names = np.array(names, dtype=object)
+        self.stats = {
+            stat: np.fromiter((getattr(item, stat) for item in items), dtype=np.float64, count=count)
+            for stat in COLUMN_STATS
+        }
+        self.slot = np.fromiter((SLOT_CODES[item.slot] for item in items), dtype=np.int8, count=count)
+        self.rarity = np.fromiter((item.rarity.value for item in items), dtype=np.int16, count=count)
+        # Set names get a code in the order they are first seen, 0 is no set.
+        self._set_codes: Dict[str, int] = {}
+        self.set = np.fromiter(
+            (self._set_codes.setdefault(item.set, len(self._set_codes) + 1) if item.set else 0 for item in items),
+            dtype=np.int32,
+            count=count,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def slot_in(self, slots: Iterable[Slot]) -> Any:
+        return np.isin(self.slot, [SLOT_CODES[slot] for slot in slots])
+
+    def rarity_in(self, rarities: Iterable[Rarities]) -> Any:
+        return np.isin(self.rarity, [rarity.value for rarity in rarities])
+
+    def set_in(self, sets: Iterable[str]) -> Any:
+        return np.isin(self.set, [self._set_codes[name] for name in sets if name in self._set_codes])
+
+    def value(self, stat: str, per_hand: bool = False) -> Any:
+        values = self.stats[stat]
+        if per_hand:
+            values = np.where(self.slot == SLOT_CODES[Slot.two_handed], values * 2, values)
+        return values
+
+    def in_range(
+        self, stat: str, bounds: Mapping[str, Any], *, per_hand: bool = False, inclusive_max: bool = False
+    ) -> Any:
+        """The vectorized form of a ``BackpackFilterParser`` range, see ``charsheet._range_test``."""
+        values = self.value(stat, per_hand)
+        if (equal := bounds.get("equal")) is not None:
+            return values == equal
+        above = values > bounds["min"]
+        if inclusive_max:
+            return above & (values <= bounds["max"])
+        return above & (values < bounds["max"])
+
+    def equip_level(self, rebirths: int) -> Any:
+        """The level needed to equip each item, mirrors :meth:`Character.equip_level`."""
+        lvl = self.stats["lvl"]
+        reduced = np.maximum(lvl - min(max(rebirths // 2 - 1, 0), 50), 1)
+        return np.where(self.rarity == Rarities.event.value, lvl, reduced)
+
+    def select(self, mask: Any) -> List[str]:
+        return self.names[mask].tolist()
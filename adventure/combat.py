@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from random import Random
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from .constants import HeroClasses
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only simulate() needs it
+    np = None
+
+if TYPE_CHECKING:
+    from .charsheet import Character
+
+# Rolls below these fractions of the highest roll fumble, rolls above CRIT_ROLL are critical.
+FUMBLE_ROLL = 0.10
+PRAYER_FUMBLE_ROLL = 0.15
+CRIT_ROLL = 0.95
+
+
+class Combatant(NamedTuple):
+    """The stats of a character that matter in a fight."""
+
+    total_att: int
+    total_int: int
+    total_cha: int
+    dex: int
+    luck: int
+    rebirths: int
+    hc: HeroClasses
+    ability: bool
+    pet_crit: int
+
+    @classmethod
+    def from_character(cls, c: Character) -> Combatant:
+        pet_crit = c.heroclass.get("pet", {}).get("bonuses", {}).get("crit", False)
+        return cls(
+            total_att=c.total_att,
+            total_int=c.total_int,
+            total_cha=c.total_cha,
+            dex=c.dex,
+            luck=c.luck,
+            rebirths=c.rebirths,
+            hc=c.hc,
+            ability=bool(c.heroclass["ability"]),
+            pet_crit=pet_crit or 0,
+        )
+
+
+class Style(NamedTuple):
+    """How one way of dealing with a monster is rolled.
+
+    Attacks, spells and talking share their dice and bonuses and differ in the
+    stat used, the class that gets a bonus on every roll and what happens on a fumble.
+    """
+
+    name: str
+    stat: str
+    hc: HeroClasses
+    # The stats added to the crit modifier are divided by these, 0 leaves the stat out
+    att_crit: int
+    int_crit: int
+    cha_crit: int
+    pets: bool
+    # Rebirths count three times for the class, or for everyone but the class when this is False
+    class_rebirths: bool
+
+
+FIGHT = Style("fight", "total_att", HeroClasses.berserker, 20, 0, 0, True, False)
+MAGIC = Style("magic", "total_int", HeroClasses.wizard, 0, 20, 0, True, True)
+TALK = Style("talk", "total_cha", HeroClasses.bard, 0, 50, 20, False, True)
+STYLES: Dict[str, Style] = {style.name: style for style in (FIGHT, MAGIC, TALK)}
+
+
+class Outcome(NamedTuple):
+    """What a single attack, spell or argument came to.
+
+    ``value`` is what it adds to the party's attack, magic or diplomacy.
+    ``bonus`` is the class ability's bonus when it turned a fumbled roll around,
+    ``base_bonus`` and ``crit_bonus`` are set for critical rolls and for the style's class.
+    """
+
+    roll: int
+    max_roll: int
+    value: int
+    fumbled: bool = False
+    critical: bool = False
+    bonus: Optional[int] = None
+    base_bonus: Optional[int] = None
+    crit_bonus: int = 0
+
+
+class Blessing(NamedTuple):
+    """What a prayer came to, the bonuses are added to the party's attack, diplomacy and magic."""
+
+    roll: int
+    cleric: bool
+    fumbled: bool = False
+    attack: Union[int, float] = 0
+    diplomacy: Union[int, float] = 0
+    magic: Union[int, float] = 0
+
+
+def max_roll(rebirths: int) -> int:
+    return 100 if rebirths >= 30 else 50 if rebirths >= 15 else 20
+
+
+def roll_mod(crit_mod: int, rebirths: int) -> int:
+    """How much the lowest roll is raised by, from a character's crit modifier."""
+    mod = 0
+    if crit_mod != 0:
+        mod = round(crit_mod / 10)
+    if rebirths < 15 < mod:
+        mod = 15
+    elif (mod + 1) > 45:
+        mod = 45
+    return mod
+
+
+def crit_mod(c: Combatant, style: Style) -> int:
+    crit = max(c.dex, c.luck // 2)
+    if style.att_crit:
+        crit += c.total_att // style.att_crit
+    if style.int_crit:
+        crit += c.total_int // style.int_crit
+    if style.cha_crit:
+        crit += c.total_cha // style.cha_crit
+    return max(crit, 0)
+
+
+def roll_dice(c: Combatant, style: Style, rng: Random) -> int:
+    top = max_roll(c.rebirths)
+    roll = max(rng.randint(1 + roll_mod(crit_mod(c, style), c.rebirths), top), 1)
+    if style.pets and c.pet_crit:
+        pet_crit = rng.randint(c.pet_crit, 100)
+        if pet_crit == 100:
+            roll = top
+        elif roll <= 25 and pet_crit >= 95:
+            roll = rng.randint(top - 5, top)
+        elif roll > 25 and pet_crit >= 95:
+            roll = rng.randint(roll, top)
+    return roll
+
+
+def strike(c: Combatant, style: Style, defence: float, rng: Random) -> Outcome:
+    """Roll one attack, spell or argument against a monster with ``defence``.
+
+    ``rng`` is drawn from in the same order the results of every adventure
+    since seeds were added were rolled in, so they can be replayed.
+    """
+    roll = roll_dice(c, style, rng)
+    top = max_roll(c.rebirths)
+    roll_perc = roll / top
+    stat = getattr(c, style.stat)
+    classed = c.hc is style.hc
+    rebirths = c.rebirths * (3 if classed is style.class_rebirths else 1)
+    if roll_perc < FUMBLE_ROLL:
+        if not (classed and c.ability):
+            return Outcome(roll, top, 0, fumbled=True)
+        if style is TALK:
+            bonus = rng.randint(5, 15)
+            return Outcome(roll, top, int((roll - bonus + stat + rebirths) / defence), bonus=bonus)
+        bonus_roll = rng.randint(5, 15)
+        bonus_multi = rng.choice([0.2, 0.3, 0.4, 0.5])
+        bonus = max(bonus_roll, int((roll + stat + rebirths) * bonus_multi))
+        # A wizard's spell still goes off in their face, a berserker shrugs it off
+        return Outcome(roll, top, int((roll - bonus + stat) / defence), fumbled=style is MAGIC, bonus=bonus)
+    critical = roll_perc > CRIT_ROLL
+    if critical or classed:
+        crit_bonus = 0
+        base_bonus = rng.randint(5, 10) + rebirths
+        if critical:
+            crit_bonus = rng.randint(5, 20) + (rebirths * 2)
+        if classed and c.ability:
+            base_bonus = (rng.randint(1, 10) + 5) * (rebirths // 2)
+        value = int((roll + base_bonus + crit_bonus + stat) / defence)
+        return Outcome(roll, top, value, critical=critical, base_bonus=base_bonus, crit_bonus=crit_bonus)
+    if style is FIGHT:
+        value = int((roll + stat) / defence) + rebirths
+    elif style is MAGIC:
+        value = int((roll + stat) / defence) + c.rebirths // 5
+    else:
+        value = int((roll + stat + c.rebirths // 5) / defence)
+    return Outcome(roll, top, value)
+
+
+def resolve(combatants: Sequence[Combatant], style: Style, defence: float, rng: Random) -> List[Outcome]:
+    """Roll for every combatant in order, see :func:`strike`."""
+    return [strike(c, style, defence, rng) for c in combatants]
+
+
+def pray(c: Combatant, fighters: int, talkers: int, casters: int, rng: Random) -> Blessing:
+    """Roll one prayer for a party with this many fighters, talkers and casters."""
+    if c.hc is not HeroClasses.cleric:
+        roll = rng.randint(1, 10)
+        if fighters + talkers + casters == 0:
+            return Blessing(roll, False)
+        if roll != 5:
+            return Blessing(roll, False, fumbled=True)
+        rebirths = c.rebirths
+        return Blessing(
+            roll,
+            False,
+            attack=10 * (fighters + rebirths // 15) if fighters else 0,
+            diplomacy=10 * (talkers + rebirths // 15) if talkers else 0,
+            magic=10 * (casters + rebirths // 15) if casters else 0,
+        )
+    rebirths = c.rebirths * 2
+    top = max_roll(c.rebirths)
+    roll = max(rng.randint(1 + roll_mod(crit_mod(c, MAGIC), c.rebirths), top), 1)
+    if roll / top < PRAYER_FUMBLE_ROLL:
+        # The sermon's penalty works out below 0, so an offended god still helps a little
+        scale = max(rebirths * 0.01, 1.5)
+        return Blessing(
+            roll,
+            True,
+            fumbled=True,
+            attack=-((5 * fighters) - ((5 * fighters) * scale)) if fighters else 0,
+            diplomacy=-((5 * talkers) - ((5 * talkers) * scale)) if talkers else 0,
+            magic=-((5 * casters) - ((5 * casters) * scale)) if casters else 0,
+        )
+    mod = roll // 3 if not c.ability else roll
+    scale = max(rebirths * 0.05, 1.5)
+    return Blessing(
+        roll,
+        True,
+        attack=int((mod * fighters) + ((mod * fighters) * scale)) if fighters else 0,
+        diplomacy=int((mod * talkers) + ((mod * talkers) * scale)) if talkers else 0,
+        magic=int((mod * casters) + ((mod * casters) * scale)) if casters else 0,
+    )
+
+
+class Simulation(NamedTuple):
+    """Outcomes of many rounds of the same party, one row per round and one column per combatant."""
+
+    values: np.ndarray
+    fumbled: np.ndarray
+    critical: np.ndarray
+
+    def totals(self) -> np.ndarray:
+        return self.values.sum(axis=1)
+
+
+def simulate(
+    combatants: Sequence[Combatant], style: Style, defence: float, rounds: int, seed: Optional[int] = None
+) -> Simulation:
+    """Roll ``rounds`` rounds for every combatant at once with NumPy.
+
+    The odds are the same as :func:`strike`, the rolls aren't: NumPy draws its
+    own numbers, so this is for working out how likely a party is to win rather
+    than replaying an adventure.
+    """
+    if np is None:
+        raise RuntimeError("Simulating fights needs NumPy installed.")
+    gen = np.random.default_rng(seed)
+    shape = (rounds, len(combatants))
+
+    def column(values) -> np.ndarray:
+        return np.array(values, dtype=np.int64)
+
+    rebirths = column([c.rebirths for c in combatants])
+    top = column([max_roll(c.rebirths) for c in combatants])
+    low = 1 + column([roll_mod(crit_mod(c, style), c.rebirths) for c in combatants])
+    stat = column([getattr(c, style.stat) for c in combatants])
+    classed = np.array([c.hc is style.hc for c in combatants], dtype=bool)
+    ability = classed & np.array([c.ability for c in combatants], dtype=bool)
+    multiplied = rebirths * np.where(classed == style.class_rebirths, 3, 1)
+
+    roll = np.maximum(gen.integers(low, top + 1, size=shape), 1)
+    if style.pets:
+        pet = column([c.pet_crit for c in combatants])
+        has_pet = pet > 0
+        pet_roll = gen.integers(np.where(has_pet, pet, 100), 101, size=shape)
+        lucky = has_pet & (pet_roll >= 95)
+        boosted = np.where(roll <= 25, gen.integers(top - 5, top + 1, size=shape), gen.integers(roll, top + 1))
+        roll = np.where(has_pet & (pet_roll == 100), top, np.where(lucky, boosted, roll))
+
+    roll_perc = roll / top
+    fumble = roll_perc < FUMBLE_ROLL
+    critical = ~fumble & (roll_perc > CRIT_ROLL)
+
+    if style is TALK:
+        bonus = gen.integers(5, 16, size=shape)
+        saved = np.trunc((roll - bonus + stat + multiplied) / defence)
+    else:
+        bonus_multi = gen.choice([0.2, 0.3, 0.4, 0.5], size=shape)
+        bonus = np.maximum(gen.integers(5, 16, size=shape), np.trunc((roll + stat + multiplied) * bonus_multi))
+        saved = np.trunc((roll - bonus + stat) / defence)
+
+    base_bonus = np.where(
+        ability, (gen.integers(1, 11, size=shape) + 5) * (multiplied // 2), gen.integers(5, 11, size=shape) + multiplied
+    )
+    crit_bonus = np.where(critical, gen.integers(5, 21, size=shape) + multiplied * 2, 0)
+    bonused = np.trunc((roll + base_bonus + crit_bonus + stat) / defence)
+
+    if style is FIGHT:
+        plain = np.trunc((roll + stat) / defence) + multiplied
+    elif style is MAGIC:
+        plain = np.trunc((roll + stat) / defence) + rebirths // 5
+    else:
+        plain = np.trunc((roll + stat + rebirths // 5) / defence)
+
+    values = np.where(
+        fumble,
+        np.where(ability, saved, 0),
+        np.where(critical | classed, bonused, plain),
+    ).astype(np.int64)
+    fumbled = fumble & ~ability if style is not MAGIC else fumble
+    return Simulation(values, fumbled, critical)
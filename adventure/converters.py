@@ -22,7 +22,8 @@ from redbot.core.utils.chat_formatting import box, humanize_list
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.predicates import ReactionPredicate
 
-from .charsheet import Character, Item
+from .character_store import ItemChoices
+from .charsheet import Item
 from .constants import DEV_LIST, HeroClasses, Rarities, Skills, Slot
 from .helpers import smart_embed
 
@@ -209,15 +210,20 @@ class Stats(commands.FlagConverter, case_insensitive=True):
         return result
 
 
+async def get_item_choices(interaction: discord.Interaction) -> ItemChoices:
+    """Return the autocomplete choices of the user typing, loading their sheet only when none are cached."""
+    store = interaction.client.get_cog("Adventure").character_store
+    choices = store.get_choices(interaction.user.id)
+    if choices is None:
+        ctx = await interaction.client.get_context(interaction)
+        choices = await store.load_choices(ctx, ctx.author)
+    return choices
+
+
 class ItemsConverter(Converter):
     async def convert(self, ctx, argument) -> Tuple[str, List[Item]]:
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            c = await ctx.bot.get_cog("Adventure").character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             raise BadArgument
@@ -238,9 +244,9 @@ class ItemsConverter(Converter):
 
         if rarity is None:
             no_markdown = Item.remove_markdowns(argument)
-            lookup = list(i for x, i in c.backpack.items() if no_markdown.lower() in x.lower())
-            lookup_m = list(i for i in c.backpack.values() if argument.lower() == str(i).lower() and str(i))
-            lookup_e = list(i for i in c.backpack.values() if argument == str(i))
+            lookup = c.backpack.search_names(no_markdown)
+            lookup_m = c.backpack.find_by_display(argument, ignore_case=True)
+            lookup_e = c.backpack.find_by_display(argument)
             _temp_items = set()
             for i in lookup:
                 _temp_items.add(str(i))
@@ -266,7 +272,7 @@ class ItemsConverter(Converter):
         elif len(lookup) == 0 and len(lookup_m) == 0:
             raise BadArgument(_("`{}` doesn't seem to match any items you own.").format(argument))
         else:
-            lookup = list(i for i in c.backpack.values() if str(i) in _temp_items)
+            lookup = c.backpack.find_by_display(*_temp_items)
             if len(lookup) > 10:
                 raise BadArgument(
                     _("You have too many items matching the name `{}`, please be more specific.").format(argument)
@@ -320,19 +326,14 @@ class ItemConverter(Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> Item:
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            c = await ctx.bot.get_cog("Adventure").character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             raise BadArgument
         no_markdown = Item.remove_markdowns(argument)
-        lookup = list(i for x, i in c.backpack.items() if no_markdown.lower() in x.lower())
-        lookup_m = list(i for i in c.backpack.values() if argument.lower() == str(i).lower() and str(i))
-        lookup_e = list(i for i in c.backpack.values() if argument == str(i))
+        lookup = c.backpack.search_names(no_markdown)
+        lookup_m = c.backpack.find_by_display(argument, ignore_case=True)
+        lookup_e = c.backpack.find_by_display(argument)
 
         _temp_items = set()
         for i in lookup:
@@ -351,7 +352,7 @@ class ItemConverter(Transformer):
         elif len(lookup) == 0 and len(lookup_m) == 0:
             raise BadArgument(_("`{}` doesn't seem to match any items you own.").format(argument))
         else:
-            lookup = list(i for i in c.backpack.values() if str(i) in _temp_items)
+            lookup = c.backpack.find_by_display(*_temp_items)
             if len(lookup) > 25:
                 raise BadArgument(
                     _("You have too many items matching the name `{}`, please be more specific.").format(argument)
@@ -378,32 +379,19 @@ class ItemConverter(Transformer):
         return await cls.convert(ctx, argument)
 
     async def autocomplete(self, interaction: discord.Interaction, current: str) -> List[Choice]:
-        ctx = await interaction.client.get_context(interaction)
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            choices = await get_item_choices(interaction)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return []
-        return [Choice(name=str(x), value=x.name) for x in c.backpack.values() if current.lower() in str(x).lower()][
-            :25
-        ]
+        return [Choice(name=name, value=value) for name, value in choices.search_backpack(current)]
 
 
 class EquipableItemConverter(Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> Item:
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            c = await ctx.bot.get_cog("Adventure").character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             raise BadArgument
@@ -415,21 +403,16 @@ class EquipableItemConverter(Transformer):
             if item:
                 equipped_items.add(str(item))
         no_markdown = Item.remove_markdowns(argument)
-        lookup = list(
-            i for x, i in c.backpack.items() if no_markdown.lower() in x.lower() and str(i) not in equipped_items
-        )
-        lookup_m = list(
-            i for i in c.backpack.values() if argument.lower() == str(i).lower() and str(i) not in equipped_items
-        )
-        lookup_e = list(i for i in c.backpack.values() if argument == str(i) and str(i) not in equipped_items)
+        name_matches = c.backpack.search_names(no_markdown)
+        case_matches = c.backpack.find_by_display(argument, ignore_case=True)
+        exact_matches = c.backpack.find_by_display(argument)
+        lookup = [i for i in name_matches if str(i) not in equipped_items]
+        lookup_m = [i for i in case_matches if str(i) not in equipped_items]
+        lookup_e = [i for i in exact_matches if str(i) not in equipped_items]
 
-        already_lookup = list(
-            i for x, i in c.backpack.items() if no_markdown.lower() in x.lower() and str(i) in equipped_items
-        )
-        already_lookup_m = list(
-            i for i in c.backpack.values() if argument.lower() == str(i).lower() and str(i) in equipped_items
-        )
-        already_lookup_e = list(i for i in c.backpack.values() if argument == str(i) and str(i) in equipped_items)
+        already_lookup = [i for i in name_matches if str(i) in equipped_items]
+        already_lookup_m = [i for i in case_matches if str(i) in equipped_items]
+        already_lookup_e = [i for i in exact_matches if str(i) in equipped_items]
 
         _temp_items = set()
         for i in lookup:
@@ -450,7 +433,7 @@ class EquipableItemConverter(Transformer):
                 raise BadArgument(_("`{}` matches the name of an item already equipped.").format(argument))
             raise BadArgument(_("`{}` doesn't seem to match any items you own.").format(argument))
         else:
-            lookup = list(i for i in c.backpack.values() if str(i) in _temp_items)
+            lookup = c.backpack.find_by_display(*_temp_items)
             if len(lookup) > 10:
                 raise BadArgument(
                     _("You have too many items matching the name `{}`, please be more specific.").format(argument)
@@ -479,42 +462,19 @@ class EquipableItemConverter(Transformer):
         return await cls.convert(ctx, argument)
 
     async def autocomplete(self, interaction: discord.Interaction, current: str) -> List[Choice]:
-        ctx = await interaction.client.get_context(interaction)
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            choices = await get_item_choices(interaction)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             raise BadArgument
-        equipped_items = set()
-        for slot in Slot:
-            if slot is Slot.two_handed:
-                continue
-            item = slot.get_item_slot(c)
-            if item:
-                equipped_items.add(str(item))
-        lookup = [
-            Choice(name=str(i), value=i.name)
-            for x, i in c.backpack.items()
-            if current.lower() in x.lower() and str(i) not in equipped_items
-        ]
-        return lookup[:25]
+        return [Choice(name=name, value=value) for name, value in choices.search_unequipped(current)]
 
 
 class EquipmentConverter(Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> Union[Item, List[Item]]:
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            c = await ctx.bot.get_cog("Adventure").character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             raise BadArgument
@@ -591,21 +551,12 @@ class EquipmentConverter(Transformer):
         return await cls.convert(ctx, argument)
 
     async def autocomplete(self, interaction: discord.Interaction, current: str) -> List[Choice]:
-        ctx = await interaction.client.get_context(interaction)
         try:
-            c = await Character.from_json(
-                ctx,
-                ctx.bot.get_cog("Adventure").config,
-                ctx.author,
-                ctx.bot.get_cog("Adventure")._daily_bonus,
-            )
+            choices = await get_item_choices(interaction)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             raise BadArgument
-        choices = [
-            Choice(name=str(i), value=i.name) for i in c.get_current_equipment() if current.lower() in str(i).lower()
-        ]
-        return choices[:25]
+        return [Choice(name=name, value=value) for name, value in choices.search_equipment(current)]
 
 
 class ThemeSetMonterConverter(Converter):
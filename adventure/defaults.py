@@ -80,4 +80,5 @@ default_global = {
     "max_allowed_withdraw": 50000,
     "disallow_withdraw": False,
     "easy_mode": False,
+    "session_update_interval": 2.0,
 }
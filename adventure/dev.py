@@ -13,7 +13,7 @@ from redbot.core.utils.chat_formatting import bold, box, humanize_number, pagify
 from .abc import AdventureMixin
 from .bank import bank
 from .cart import Trader
-from .charsheet import Character
+from .charsheet import count_set_items
 from .constants import DEV_LIST, Rarities, Slot
 from .converters import RarityConverter, SlotConverter
 from .helpers import escape, is_dev
@@ -61,7 +61,7 @@ class DevCommands(AdventureMixin):
         """[Dev] Resets the after-adventure cooldown in this server."""
         if not await self.no_dev_prompt(ctx):
             return
-        await self.config.guild(ctx.guild).cooldown.set(0)
+        await self.settings.set_guild(ctx.guild, "cooldown", 0)
         await ctx.tick()
 
     @commands.command()
@@ -73,9 +73,7 @@ class DevCommands(AdventureMixin):
             return
         trader = Trader(60, ctx, self)
         await trader.start(ctx, bypass=True, stockcount=stockcount)
-        await asyncio.sleep(60)
-        trader.stop()
-        await trader.on_timeout()
+        self.scheduler.schedule(("cart", ctx.guild.id), 60, trader.leave)
 
     @commands.command()
     @commands.is_owner()
@@ -93,13 +91,13 @@ class DevCommands(AdventureMixin):
         slot = slot.lower()
         async with self.get_lock(user):
             try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                c = await self.character_store.load(ctx, user)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
             for _loop_counter in range(num):
                 await c.add_to_backpack(await self._genitem(ctx, rarity, slot))
-            await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, c)
         await ctx.invoke(self._backpack)
 
     @commands.command()
@@ -110,8 +108,10 @@ class DevCommands(AdventureMixin):
 
         Note this overrides your current data.
         """
-        user_data = await self.config.user_from_id(user_id).all()
-        await self.config.user(ctx.author).set(user_data)
+        async with self.get_lock(discord.Object(id=user_id)):
+            await self.character_store.flush([user_id], force=True)
+            user_data = await self.config.user_from_id(user_id).all()
+        self.character_store.set(ctx.author, user_data)
         await ctx.tick()
 
     @commands.command()
@@ -140,7 +140,7 @@ class DevCommands(AdventureMixin):
         for target in targets:
             async with self.get_lock(target):
                 try:
-                    c = await Character.from_json(ctx, self.config, target, self._daily_bonus)
+                    c = await self.character_store.load(ctx, target)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -152,7 +152,7 @@ class DevCommands(AdventureMixin):
                     withdraw = bal
                     await bank.set_balance(target, 0)
                 character_data = await c.rebirth(dev_val=rebirth_level)
-                await self.config.user(target).set(character_data)
+                self.character_store.set(target, character_data)
                 await ctx.send(
                     content=box(
                         _("{c}, congratulations on your rebirth.\nYou paid {bal}.").format(
@@ -175,7 +175,7 @@ class DevCommands(AdventureMixin):
         for target in targets:
             async with self.get_lock(target):
                 try:
-                    c = await Character.from_json(ctx, self.config, target, self._daily_bonus)
+                    c = await self.character_store.load(ctx, target)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -183,9 +183,45 @@ class DevCommands(AdventureMixin):
                 c.heroclass["cooldown"] = 0
                 if "catch_cooldown" in c.heroclass:
                     c.heroclass["catch_cooldown"] = 0
-                await self.config.user(target).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, target, c)
         await ctx.tick()
 
+    @commands.command(name="recountsets")
+    @commands.bot_has_permissions(add_reactions=True)
+    @commands.is_owner()
+    async def recountsets(self, ctx: commands.Context, users: commands.Greedy[Union[discord.Member, discord.User]]):
+        """[Owner] Check the stored set item counts and repair any that are wrong.
+
+        Checks every adventurer when no users are given.
+        """
+        if users:
+            user_ids = [user.id for user in users]
+        else:
+            await self.character_store.flush()
+            user_ids = [
+                user_id
+                for user_id, data in (await self.config.all_users()).items()
+                if data.get("set_items") != count_set_items(data)
+            ]
+        repaired = []
+        async with ctx.typing():
+            for user_id in user_ids:
+                async with self.get_lock(discord.Object(id=user_id)):
+                    await self.character_store.flush([user_id], force=True)
+                    group = self.config.user_from_id(user_id)
+                    data = await group.all()
+                    set_items = count_set_items(data)
+                    if data.get("set_items") == set_items:
+                        continue
+                    await group.set_raw("set_items", value=set_items)
+                    self.character_store.invalidate(user_id)
+                    repaired.append(f"{user_id}: {data.get('set_items')} -> {set_items}")
+        if not repaired:
+            return await ctx.send(_("All set item counts are correct."))
+        msg = _("Repaired the set item count of {count} adventurers.\n").format(count=humanize_number(len(repaired)))
+        for page in pagify(msg + "\n".join(repaired), page_length=1900):
+            await ctx.send(box(page))
+
     @commands.command(name="adventureseed")
     @commands.bot_has_permissions(add_reactions=True, embed_links=True)
     @commands.is_owner()
@@ -195,7 +231,7 @@ class DevCommands(AdventureMixin):
             seed = int(seed, 16)
         gameseed = GameSeed.from_int(int(seed))
         rng = Random(gameseed)
-        c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+        c = await self.character_store.load(ctx, ctx.author)
         monster_roster, monster_stats, transcended = await self.update_monster_roster(c=c, rng=rng)
         challenge = await self.get_challenge(monster_roster, rng)
         attribute = rng.choice(list(self.ATTRIBS.keys()))
@@ -240,6 +276,7 @@ class DevCommands(AdventureMixin):
 
         embed.add_field(name="Seed Stats", value=f"{str(gameseed.stat_range)}")
         embed.add_field(name="Seed", value=seed_box)
+        embed.add_field(name="Seed Version", value=str(gameseed.version))
         embed.add_field(
             name="Easy Mode under 30 rebirths",
             value=str(easy_mode),
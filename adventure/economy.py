@@ -5,7 +5,6 @@ import time
 from typing import Literal, Union
 
 import discord
-from beautifultable import ALIGN_CENTER, BeautifulTable
 from redbot.core import commands
 from redbot.core.errors import BalanceTooHigh
 from redbot.core.i18n import Translator
@@ -13,11 +12,12 @@ from redbot.core.utils.chat_formatting import box, humanize_list, humanize_numbe
 
 from .abc import AdventureMixin
 from .bank import bank
-from .charsheet import Character, Item
+from .charsheet import Item
 from .constants import ANSITextColours, Rarities
 from .converters import RarityConverter, Stats
 from .helpers import escape, has_separated_economy, smart_embed
 from .menus import BaseMenu, SimpleSource
+from .tables import ALIGN_CENTER, ALIGN_LEFT, AnsiTable
 
 _ = Translator("Adventure", __file__)
 
@@ -36,7 +36,7 @@ class EconomyCommands(AdventureMixin):
     @commands.guild_only()
     async def commands_atransfer_deposit(self, ctx: commands.Context, *, amount: int):
         """Convert bank currency to gold."""
-        from_conversion_rate = await self.config.to_conversion_rate()
+        from_conversion_rate = self.settings["to_conversion_rate"]
         transferable_amount = amount * from_conversion_rate
         if amount <= 0:
             await smart_embed(
@@ -77,14 +77,14 @@ class EconomyCommands(AdventureMixin):
             ),
         )
         try:
-            character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            character = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
         else:
             if character.last_currency_check + 600 < time.time() or character.bal > character.last_known_currency:
                 character.last_known_currency = await bank.get_balance(ctx.author)
                 character.last_currency_check = time.time()
-                await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, character)
 
     @commands_atransfer.command(name="withdraw", cooldown_after_parsing=True)
     @commands.guild_only()
@@ -92,12 +92,12 @@ class EconomyCommands(AdventureMixin):
     async def commands_atransfer_withdraw(self, ctx: commands.Context, *, amount: int):
         """Convert gold to bank currency."""
         if await bank.is_global(_forced=True):
-            global_config = await self.config.all()
+            global_config = self.settings
             can_withdraw = global_config["disallow_withdraw"]
             max_allowed_withdraw = global_config["max_allowed_withdraw"]
             is_global = True
         else:
-            guild_config = await self.config.guild(ctx.guild).all()
+            guild_config = self.settings.guild(ctx.guild)
             can_withdraw = guild_config["disallow_withdraw"]
             max_allowed_withdraw = guild_config["max_allowed_withdraw"]
             is_global = False
@@ -117,8 +117,7 @@ class EconomyCommands(AdventureMixin):
                 _("{author.mention} You can't withdraw 0 or negative values.").format(author=ctx.author),
             )
             return
-        configs = await self.config.all()
-        from_conversion_rate = configs.get("from_conversion_rate")
+        from_conversion_rate = self.settings["from_conversion_rate"]
         transferable_amount = amount // from_conversion_rate
         if not await bank.can_spend(member=ctx.author, amount=amount):
             return await smart_embed(
@@ -237,32 +236,25 @@ class EconomyCommands(AdventureMixin):
         """Show your sets."""
 
         try:
-            character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            character = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return
 
         sets = await character.get_set_count()
-        table = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=500)
-        table.set_style(BeautifulTable.STYLE_RST)
-        table.columns.header = [
+        header = [
             "Name",
             "Unique\nPieces",
             # "Unique Owned",
         ]
-        table.columns.alignment["Name"] = BeautifulTable.ALIGN_LEFT
+        alignments = [ALIGN_LEFT, ALIGN_CENTER]
+        table = AnsiTable(header=header, alignments=alignments, maxwidth=500)
         msgs = []
         for k, v in sets.items():
             if len(str(table)) > 1500:
-                table.rows.sort("Name", reverse=False)
+                table.rows.sort(key=lambda row: row[0])
                 msgs.append(box(str(table) + f"\nPage {len(msgs) + 1}", lang="ansi"))
-                table = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=500)
-                table.set_style(BeautifulTable.STYLE_RST)
-                table.columns.header = [
-                    "Name",
-                    "Unique\nPieces",
-                    # "Unique Owned",
-                ]
+                table = AnsiTable(header=header, alignments=alignments, maxwidth=500)
 
             total = v[0]
             owned = v[1]
@@ -278,7 +270,7 @@ class EconomyCommands(AdventureMixin):
                     owned_str,
                 )
             )
-        table.rows.sort("Name", reverse=False)
+        table.rows.sort(key=lambda row: row[0])
         msgs.append(box(str(table) + f"\nPage {len(msgs) + 1}", lang="ansi"))
         await BaseMenu(
             source=SimpleSource(msgs),
@@ -323,14 +315,14 @@ class EconomyCommands(AdventureMixin):
                 ),
             )
         try:
-            character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            character = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
         else:
             if character.last_currency_check + 600 < time.time() or character.bal > character.last_known_currency:
                 character.last_known_currency = await bank.get_balance(ctx.author)
                 character.last_currency_check = time.time()
-                await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, character)
 
     # in economy since it affects the loot economy, might move later
     @commands.group()
@@ -376,12 +368,12 @@ class EconomyCommands(AdventureMixin):
         item = Item.from_json(ctx, new_item)
         async with self.get_lock(user):
             try:
-                c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                c = await self.character_store.load(ctx, user)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
             await c.add_to_backpack(item)
-            await self.config.user(user).set(await c.to_json(ctx, self.config))
+            await self.character_store.save(ctx, user, c)
         item_table = item.table(c)
         msg = box(
             _("An item named {item} has been created and placed in {author}'s backpack.").format(
@@ -430,7 +422,7 @@ class EconomyCommands(AdventureMixin):
         for user in users:
             async with self.get_lock(user):
                 try:
-                    c = await Character.from_json(ctx, self.config, user, self._daily_bonus)
+                    c = await self.character_store.load(ctx, user)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     continue
@@ -446,7 +438,7 @@ class EconomyCommands(AdventureMixin):
                     c.treasure.set += number
                 else:
                     c.treasure.normal += number
-                await self.config.user(user).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, user, c)
                 chests = c.treasure.ansi
                 await ctx.send(
                     box(
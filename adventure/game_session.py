@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Mapping, MutableMapping, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple
 
 import discord
 from redbot.core.commands import Context
@@ -13,6 +15,7 @@ from redbot.core.utils.chat_formatting import box, humanize_list, humanize_numbe
 
 from .abc import AdventureMixin
 from .charsheet import Character, has_funds
+from .combat import Combatant
 from .constants import HeroClasses
 from .helpers import escape, smart_embed
 from .rng import Random
@@ -51,7 +54,7 @@ class ActionButton(discord.ui.Button):
     async def send_response(self, interaction: discord.Interaction):
         user = interaction.user
         try:
-            c = await Character.from_json(self.view.ctx, self.view.cog.config, user, self.view.cog._daily_bonus)
+            c = await self.view.cog.character_store.load(self.view.ctx, user)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             pass
@@ -66,22 +69,16 @@ class ActionButton(discord.ui.Button):
         choice = choice.replace("$monster", self.view.challenge_name())
         weapon = c.get_weapons()
         choice = choice.replace("$weapon", weapon)
-        god = await self.view.cog.config.god_name()
-        if await self.view.cog.config.guild(interaction.guild).god_name():
-            god = await self.view.cog.config.guild(interaction.guild).god_name()
+        god = self.view.cog.settings["god_name"]
+        if self.view.cog.settings.guild(interaction.guild)["god_name"]:
+            god = self.view.cog.settings.guild(interaction.guild)["god_name"]
         choice = choice.replace("$god", god)
         await smart_embed(message=box(choice, lang="ansi"), ephemeral=True, interaction=interaction)
 
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer()
         user = interaction.user
-        for action in Action:
-            if action is self.action:
-                continue
-            if user in getattr(self.view, action.name, []):
-                getattr(self.view, action.name).remove(user)
-        if user not in getattr(self.view, self.action.name):
-            getattr(self.view, self.action.name).append(user)
+        if self.view.join(user, self.action.name):
             await self.send_response(interaction)
             await self.view.update()
         else:
@@ -130,7 +127,7 @@ class SpecialActionButton(discord.ui.Button):
             if c.heroclass["cooldown"] <= time.time():
                 c.heroclass["ability"] = True
                 c.heroclass["cooldown"] = time.time() + cooldown_time
-                await self.view.cog.config.user(user).set(await c.to_json(self.view.ctx, self.view.cog.config))
+                await self.view.cog.character_store.save(self.view.ctx, user, c)
                 msg = _("{bless} **{c}** is starting an inspiring sermon. {bless}").format(
                     c=escape(user.display_name), bless=self.view.cog.emojis.skills.bless
                 )
@@ -164,7 +161,7 @@ class SpecialActionButton(discord.ui.Button):
             c.heroclass["ability"] = True
             c.heroclass["cooldown"] = time.time() + cooldown_time
 
-            await self.view.cog.config.user(user).set(await c.to_json(self.view.ctx, self.view.cog.config))
+            await self.view.cog.character_store.save(self.view.ctx, user, c)
             if good:
                 msg = _("{skill} **{c}** is focusing on the monster ahead...{skill}").format(
                     c=escape(user.display_name),
@@ -310,7 +307,7 @@ class SpecialActionButton(discord.ui.Button):
         if c.heroclass["cooldown"] <= time.time():
             c.heroclass["ability"] = True
             c.heroclass["cooldown"] = time.time() + cooldown_time
-            await self.view.cog.config.user(user).set(await c.to_json(self.view.ctx, self.view.cog.config))
+            await self.view.cog.character_store.save(self.view.ctx, user, c)
             await smart_embed(
                 None,
                 _("{skill} **{c}** is starting to froth at the mouth... {skill}").format(
@@ -335,7 +332,7 @@ class SpecialActionButton(discord.ui.Button):
             c.heroclass["ability"] = True
             c.heroclass["cooldown"] = time.time() + cooldown_time
 
-            await self.view.cog.config.user(user).set(await c.to_json(self.view.ctx, self.view.cog.config))
+            await self.view.cog.character_store.save(self.view.ctx, user, c)
             await smart_embed(
                 None,
                 _("{skill} **{c}** is focusing all of their energy... {skill}").format(
@@ -359,7 +356,7 @@ class SpecialActionButton(discord.ui.Button):
         if c.heroclass["cooldown"] <= time.time():
             c.heroclass["ability"] = True
             c.heroclass["cooldown"] = time.time() + cooldown_time
-            await self.view.cog.config.user(user).set(await c.to_json(self.view.ctx, self.view.cog.config))
+            await self.view.cog.character_store.save(self.view.ctx, user, c)
             await smart_embed(
                 None,
                 _("{skill} **{c}** is whipping up a performance... {skill}").format(
@@ -386,7 +383,7 @@ class SpecialActionButton(discord.ui.Button):
             return
         async with self.view.cog.get_lock(user):
             try:
-                c = await Character.from_json(self.view.ctx, self.view.cog.config, user, self.view.cog._daily_bonus)
+                c = await self.view.cog.character_store.load(self.view.ctx, user)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 await smart_embed(
@@ -413,6 +410,78 @@ class SpecialActionButton(discord.ui.Button):
                 await self.send_music(interaction, c)
 
 
+class SessionCharacters:
+    """Character sheets shared by every phase of a single adventure.
+
+    Each participant is loaded from config once, mutated in place by the
+    result handlers and rewards, and written back once when the adventure ends.
+    Only what the adventure changed is written back, so anything saved for a
+    participant while it ran, such as a cart purchase, is kept.
+    """
+
+    def __init__(self, ctx: Context, cog: AdventureMixin):
+        self.ctx = ctx
+        self.cog = cog
+        self._characters: Dict[int, Character] = {}
+        self._users: Dict[int, discord.abc.User] = {}
+        # The document each sheet was built from, or last saved as
+        self._bases: Dict[int, dict] = {}
+        self._dirty: Set[int] = set()
+
+    def __contains__(self, user: discord.abc.User) -> bool:
+        return user.id in self._characters
+
+    async def _load(self, user: discord.abc.User) -> Character:
+        c, self._bases[user.id] = await self.cog.character_store.checkout(self.ctx, user)
+        self._characters[user.id] = c
+        self._users[user.id] = user
+        return c
+
+    async def load(self, users: List[discord.abc.User]) -> None:
+        """Load every user not already cached concurrently."""
+        to_load = {u.id: u for u in users if u.id not in self._characters}
+        results = await asyncio.gather(*(self._load(u) for u in to_load.values()), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                log.exception("Error with the new character sheet", exc_info=result)
+
+    async def get(self, user: discord.abc.User) -> Character:
+        """Return the shared character for this user, loading it if required."""
+        if user.id in self._characters:
+            return self._characters[user.id]
+        return await self._load(user)
+
+    async def combatants(self, users: Iterable[discord.abc.User]) -> List[Tuple[discord.abc.User, Combatant]]:
+        """The combat stats of ``users`` in order, leaving out anyone whose character can't be loaded."""
+        ret = []
+        for user in users:
+            try:
+                c = await self.get(user)
+            except Exception as exc:
+                log.exception("Error with the new character sheet", exc_info=exc)
+                continue
+            ret.append((user, Combatant.from_character(c)))
+        return ret
+
+    def mark_dirty(self, user: discord.abc.User) -> None:
+        if user.id in self._characters:
+            self._dirty.add(user.id)
+
+    async def save(self) -> None:
+        """Write every modified character back to config exactly once."""
+        while self._dirty:
+            user_id = self._dirty.pop()
+            user = self._users[user_id]
+            c = self._characters[user_id]
+            async with self.cog.get_lock(user):
+                try:
+                    self._bases[user_id] = await self.cog.character_store.save(
+                        self.ctx, user, c, base=self._bases.get(user_id)
+                    )
+                except Exception as exc:
+                    log.exception("Error saving character sheet for %s", user_id, exc_info=exc)
+
+
 class GameSession(discord.ui.View):
     """A class to represent and hold current game sessions per server."""
 
@@ -444,6 +513,8 @@ class GameSession(discord.ui.View):
     exposed: bool = False
     finished: bool = False
     rng: Random
+    characters: SessionCharacters
+    update_interval: float = 2.0
     _last_update: Dict[Action, int]
 
     def __init__(self, **kwargs):
@@ -470,6 +541,7 @@ class GameSession(discord.ui.View):
         self.talk: List[discord.Member] = []
         self.pray: List[discord.Member] = []
         self.run: List[discord.Member] = []
+        self.joined: Set[int] = set()
         self.transcended: bool = kwargs.pop("transcended", False)
         self.insight: Tuple[float, Character] = (0, None)
         self.start_time = datetime.now()
@@ -479,6 +551,11 @@ class GameSession(discord.ui.View):
         self.immortal = self.attribute == "n immortal"
         self.ascended = "Ascended" in self.challenge
         self.rng = kwargs["rng"]
+        self.characters = SessionCharacters(self.ctx, self.cog)
+        self.update_interval: float = kwargs.pop("update_interval", 2.0)
+        self._update_pending = False
+        self._last_edit = 0.0
+        self._updater: Optional[asyncio.Task] = None
         super().__init__(timeout=self.timer)
         self.attack_button = ActionButton(Action.fight)
         self.talk_button = ActionButton(Action.talk)
@@ -501,6 +578,42 @@ class GameSession(discord.ui.View):
         return max(int(self.monster_modified_stats.get("dipl", 0) * self.attribute_stats[1] * self.monster_stats), 1)
 
     async def update(self):
+        """Edit the message with how many people picked each action.
+
+        Clicks coming in close together share one edit, there is at most one
+        every ``update_interval`` seconds and each sends the latest counts.
+        """
+        self._update_pending = True
+        if self._updater is None or self._updater.done():
+            self._updater = asyncio.create_task(self._send_updates())
+
+    async def flush(self):
+        """Send the latest counts now instead of waiting for the next edit, if there is one to send."""
+        if self._updater is not None and not self._updater.done():
+            self._updater.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._updater
+        if self._update_pending:
+            self._update_pending = False
+            with contextlib.suppress(discord.HTTPException):
+                await self._edit_labels()
+
+    async def _send_updates(self):
+        while self._update_pending:
+            delay = self._last_edit + self.update_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._update_pending = False
+            try:
+                await self._edit_labels()
+            except asyncio.CancelledError:
+                self._update_pending = True
+                raise
+            except discord.HTTPException:
+                log.debug("Could not update the adventure message in %s", self.guild.id, exc_info=True)
+            self._last_edit = time.monotonic()
+
+    async def _edit_labels(self):
         buttons = {
             Action.fight: self.attack_button,
             Action.talk: self.talk_button,
@@ -519,17 +632,30 @@ class GameSession(discord.ui.View):
         await self.message.edit(view=self)
 
     def in_adventure(self, user: discord.Member) -> bool:
-        participants_ids = set(
-            p.id
-            for p in [
-                *self.fight,
-                *self.magic,
-                *self.pray,
-                *self.talk,
-                *self.run,
-            ]
-        )
-        return bool(user.id in participants_ids)
+        return user.id in self.joined
+
+    def join(self, user: discord.Member, action: str) -> bool:
+        """Put ``user`` on ``action``, taking them off any other one.
+
+        Returns False when they had already picked ``action``.
+        """
+        for other in Action:
+            if other.name != action and user in getattr(self, other.name):
+                getattr(self, other.name).remove(user)
+        if user in getattr(self, action):
+            return False
+        getattr(self, action).append(user)
+        self.joined.add(user.id)
+        self.cog._sessions.add_participant(user.id, self.guild.id)
+        return True
+
+    def leave(self, user: discord.Member) -> None:
+        """Take ``user`` off every action."""
+        for action in Action:
+            while user in getattr(self, action.name):
+                getattr(self, action.name).remove(user)
+        self.joined.discard(user.id)
+        self.cog._sessions.remove_participant(user.id, self.guild.id)
 
     def challenge_name(self):
         if self.easy_mode:
@@ -561,16 +687,9 @@ class GameSession(discord.ui.View):
                 ephemeral=True,
             )
             return False
-        if await self.cog.config.restrict():
+        if self.cog.settings["restrict"]:
             user = interaction.user
-            all_users = []
-            in_adventure = False
-            for guild_session in self.cog._sessions.values():
-                if guild_session.ctx.message.id == self.ctx.message.id:
-                    continue
-                if guild_session.in_adventure(user):
-                    in_adventure = True
-
+            in_adventure = self.cog._sessions.participating(user.id, exclude=self.guild.id)
             if in_adventure:
                 user_id = f"{user.id}-{user.guild.id}"
                 # iterating through reactions here and removing them seems to be expensive
@@ -584,3 +703,60 @@ class GameSession(discord.ui.View):
                 )
             return not in_adventure
         return True
+
+
+class SessionRegistry(MutableMapping[int, GameSession]):
+    """The live session of each guild, with the guilds each user is adventuring in.
+
+    Sessions record people in :attr:`participation` as they pick an action and
+    everyone who joined a session is dropped from it when the session is
+    removed or replaced, so checking whether someone is busy doesn't need to
+    look through every session.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[int, GameSession] = {}
+        self.participation: Dict[int, Set[int]] = {}
+
+    def __getitem__(self, guild_id: int) -> GameSession:
+        return self._sessions[guild_id]
+
+    def __setitem__(self, guild_id: int, session: GameSession) -> None:
+        old = self._sessions.get(guild_id)
+        if old is not None and old is not session:
+            self._forget(guild_id, old)
+        self._sessions[guild_id] = session
+
+    def __delitem__(self, guild_id: int) -> None:
+        self._forget(guild_id, self._sessions.pop(guild_id))
+
+    def __contains__(self, guild_id: object) -> bool:
+        return guild_id in self._sessions
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._sessions)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def add_participant(self, user_id: int, guild_id: int) -> None:
+        self.participation.setdefault(user_id, set()).add(guild_id)
+
+    def remove_participant(self, user_id: int, guild_id: int) -> None:
+        guilds = self.participation.get(user_id)
+        if guilds is None:
+            return
+        guilds.discard(guild_id)
+        if not guilds:
+            del self.participation[user_id]
+
+    def participating(self, user_id: int, *, exclude: Optional[int] = None) -> bool:
+        """Whether the user has joined a session, other than the one in ``exclude`` if it's given."""
+        guilds = self.participation.get(user_id)
+        if not guilds:
+            return False
+        return exclude is None or len(guilds) > 1 or exclude not in guilds
+
+    def _forget(self, guild_id: int, session: GameSession) -> None:
+        for user_id in session.joined:
+            self.remove_participant(user_id, guild_id)
@@ -14,6 +14,7 @@ from redbot.core.utils.chat_formatting import escape as _escape
 from redbot.core.utils.common_filters import filter_various_mentions
 
 from .charsheet import Character, Item
+from .columns import np
 from .constants import DEV_LIST, Rarities
 
 _ = Translator("Adventure", __file__)
@@ -67,7 +68,7 @@ async def smart_embed(
     if cog is None:
         cog = bot.get_cog("Adventure")
     if guild:
-        use_embeds = await cog.config.guild(guild).embed()
+        use_embeds = cog.settings.guild(guild)["embed"]
     else:
         use_embeds = True or await bot.embed_requested(channel)
     if use_embeds:
@@ -95,14 +96,7 @@ async def smart_embed(
 
 
 def check_running_adventure(ctx):
-    for guild_id, session in ctx.bot.get_cog("Adventure")._sessions.items():
-        user_ids: list = []
-        options = ["fight", "magic", "talk", "pray", "run"]
-        for i in options:
-            user_ids += [u.id for u in getattr(session, i)]
-        if ctx.author.id in user_ids:
-            return False
-    return True
+    return not ctx.bot.get_cog("Adventure")._sessions.participating(ctx.author.id)
 
 
 async def _title_case(phrase: str):
@@ -131,6 +125,7 @@ async def _remaining(epoch):
 
 
 def _sell(c: Character, item: Item, *, amount: int = 1):
+    """Return what selling ``amount`` of an item earns, every one sold is priced on its own."""
     if item.rarity is Rarities.ascended:
         base = (5000, 10000)
     elif item.rarity is Rarities.legendary:
@@ -141,18 +136,35 @@ def _sell(c: Character, item: Item, *, amount: int = 1):
         base = (250, 500)
     else:
         base = (10, 100)
-    price = random.randint(base[0], base[1]) * abs(item.max_main_stat)
-    price += price * max(int((c.total_cha) / 1000), -1)
-
-    if c.luck > 0:
-        price = price + round(price * (c.luck / 1000))
-    if c.luck < 0:
-        price = price - round(price * (abs(c.luck) / 1000))
-    if price < 0:
-        price = 0
-    price += round(price * min(0.1 * c.rebirths / 15, 0.4))
-
-    return max(price, base[0])
+    rolls = [random.randint(base[0], base[1]) for _ in range(amount)]
+    cha_bonus = max(int((c.total_cha) / 1000), -1)
+    rebirth_bonus = min(0.1 * c.rebirths / 15, 0.4)
+    if np is not None and amount >= 100:
+        # Python and NumPy both round halves to even so this matches pricing them one by one.
+        price = np.array(rolls, dtype=np.int64) * abs(item.max_main_stat)
+        price += price * cha_bonus
+        if c.luck > 0:
+            price += np.round(price * (c.luck / 1000)).astype(np.int64)
+        if c.luck < 0:
+            price -= np.round(price * (abs(c.luck) / 1000)).astype(np.int64)
+        price = np.maximum(price, 0)
+        price += np.round(price * rebirth_bonus).astype(np.int64)
+        return int(np.maximum(price, base[0]).sum())
+    total = 0
+    for roll in rolls:
+        price = roll * abs(item.max_main_stat)
+        price += price * cha_bonus
+
+        if c.luck > 0:
+            price = price + round(price * (c.luck / 1000))
+        if c.luck < 0:
+            price = price - round(price * (abs(c.luck) / 1000))
+        if price < 0:
+            price = 0
+        price += round(price * rebirth_bonus)
+
+        total += max(price, base[0])
+    return total
 
 
 def is_dev(user: Union[discord.User, discord.Member]):
@@ -33,7 +33,7 @@ class LoadoutCommands(AdventureMixin):
         name = name.lower()
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -52,7 +52,7 @@ class LoadoutCommands(AdventureMixin):
                     return
             loadout = await Character.save_loadout(c)
             c.loadouts[name] = loadout
-            await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, c)
             await smart_embed(
                 ctx,
                 _("{author}, your current equipment has been saved to {name}.").format(
@@ -68,7 +68,7 @@ class LoadoutCommands(AdventureMixin):
         async with self.get_lock(ctx.author):
             name = name.lower()
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -81,7 +81,7 @@ class LoadoutCommands(AdventureMixin):
                 )
             else:
                 del c.loadouts[name]
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, c)
                 await smart_embed(
                     ctx,
                     _("{author}, loadout {name} has been deleted.").format(
@@ -96,7 +96,7 @@ class LoadoutCommands(AdventureMixin):
         if not await self.allow_in_dm(ctx):
             return await smart_embed(ctx, _("This command is not available in DM's on this bot."))
         try:
-            c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+            c = await self.character_store.load(ctx, ctx.author)
         except Exception as exc:
             log.exception("Error with the new character sheet", exc_info=exc)
             return
@@ -149,7 +149,7 @@ class LoadoutCommands(AdventureMixin):
         name = name.lower()
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 ctx.command.reset_cooldown(ctx)
@@ -164,13 +164,7 @@ class LoadoutCommands(AdventureMixin):
                 )
             else:
                 c = await c.equip_loadout(name)
-                await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
-                try:
-                    c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
-                except Exception as exc:
-                    log.exception("Error with the new character sheet", exc_info=exc)
-                    ctx.command.reset_cooldown(ctx)
-                    return
+                await self.character_store.save(ctx, ctx.author, c)
                 current_stats = box(
                     _(
                         "{author}'s new stats: "
@@ -54,7 +54,7 @@ class LootCommands(AdventureMixin):
             async with self.get_lock(ctx.author):
                 msgs = []
                 try:
-                    c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                    c = await self.character_store.load(ctx, ctx.author)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     return
@@ -94,7 +94,7 @@ class LootCommands(AdventureMixin):
                         # atomically save reduced loot count then lock again when saving inside
                         # open chests
                         c.treasure[redux] -= number
-                        await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, c)
                         items = await self._open_chests(ctx, box_type, number, character=c)
                         msg = _("{}, you've opened the following items:\n\n").format(escape(ctx.author.display_name))
                         rows = []
@@ -107,7 +107,7 @@ class LootCommands(AdventureMixin):
                         # atomically save reduced loot count then lock again when saving inside
                         # open chests
                         c.treasure[redux] -= 1
-                        await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                        await self.character_store.save(ctx, ctx.author, c)
                         await self._open_chest(ctx, ctx.author, box_type, character=c)
                         # returns item and msg
         if msgs:
@@ -240,7 +240,7 @@ class LootCommands(AdventureMixin):
             plural = ""
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -286,7 +286,7 @@ class LootCommands(AdventureMixin):
                         author=escape(ctx.author.display_name),
                         chests=c.treasure.ansi,
                     )
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                 else:
                     msg = failed_msg.format(author=escape(ctx.author.display_name), amount=converted)
             elif box_rarity is Rarities.rare and c.rebirths >= rebirth_rare:
@@ -304,7 +304,7 @@ class LootCommands(AdventureMixin):
                         author=escape(ctx.author.display_name),
                         chests=c.treasure.ansi,
                     )
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                 else:
                     msg = failed_msg.format(author=escape(ctx.author.display_name), amount=converted)
             elif box_rarity is Rarities.epic and c.rebirths >= rebirth_epic:
@@ -322,7 +322,7 @@ class LootCommands(AdventureMixin):
                         author=escape(ctx.author.display_name),
                         chests=c.treasure.ansi,
                     )
-                    await self.config.user(ctx.author).set(await c.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, c)
                 else:
                     msg = failed_msg.format(author=escape(ctx.author.display_name), amount=converted)
             await ctx.send(box(msg, lang="ansi"))
@@ -343,7 +343,7 @@ class LootCommands(AdventureMixin):
             else:
                 items[item_name] = item
             await character.add_to_backpack(item)
-        await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+        await self.character_store.save(ctx, ctx.author, character)
         return items
 
     async def _open_chest(self, ctx: commands.Context, user: discord.User, chest_type: Rarities, character: Character):
@@ -373,7 +373,7 @@ class LootCommands(AdventureMixin):
         if old_item:
             old_item_name, old_item_row = old_item.row(character)
             table.rows.append([_("Currently Equipped\n") + old_item_name])
-            table.rows.append(old_item_row)
+            table.rows.append([old_item_row])
         view = LootView(60, ctx.author)
 
         old_stats = str(table)
@@ -411,7 +411,7 @@ class LootCommands(AdventureMixin):
                 ),
                 view=None,
             )
-            await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, character)
             return
         await self._clear_react(open_msg)
         if view.result.value == 2:
@@ -444,14 +444,14 @@ class LootCommands(AdventureMixin):
             await self._clear_react(open_msg)
             character.last_known_currency = await bank.get_balance(ctx.author)
             character.last_currency_check = time.time()
-            await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, character)
         elif view.result.value == 1:
             equiplevel = character.equip_level(item)
             if is_dev(ctx.author):
                 equiplevel = 0
             if not character.can_equip(item):
                 await character.add_to_backpack(item)
-                await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                await self.character_store.save(ctx, ctx.author, character)
                 await open_msg.edit(view=None)
                 return await smart_embed(
                     ctx=ctx,
@@ -474,4 +474,4 @@ class LootCommands(AdventureMixin):
             equip_msg += f".\n{item.table(character)}"
             await open_msg.edit(content=box(equip_msg, lang="ansi"), view=None)
             character = await character.equip_item(item, False, is_dev(ctx.author))
-            await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+            await self.character_store.save(ctx, ctx.author, character)
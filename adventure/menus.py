@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import discord
 from redbot.core.commands import commands
@@ -10,8 +11,8 @@ from redbot.core.utils.chat_formatting import box, escape, humanize_number
 from redbot.vendored.discord.ext import menus
 
 from .bank import bank
-from .charsheet import Character
 from .helpers import is_dev, smart_embed
+from .pages import LazyPages
 
 if TYPE_CHECKING:
     from .abc import AdventureMixin
@@ -303,13 +304,32 @@ class NVScoreboardSource(WeeklyScoreboardSource):
         return msg
 
 
-class SimpleSource(menus.ListPageSource):
-    def __init__(self, entries: List[str, discord.Embed]):
-        super().__init__(entries, per_page=1)
+class LazySource(menus.PageSource):
+    """Shows one page at a time from :class:`LazyPages`, drawing pages as they are navigated to.
+
+    The next page is drawn once the one asked for has been sent, so paging forward doesn't wait on it.
+    """
+
+    def __init__(self, entries: Union[LazyPages, Iterable[Any]]):
+        self.entries = entries if isinstance(entries, LazyPages) else LazyPages(entries)
 
     def is_paginating(self):
         return True
 
+    def get_max_pages(self):
+        return self.entries.estimate()
+
+    async def get_page(self, page_number: int):
+        page = self.entries[page_number]
+        if page_number >= 0 and not self.entries.complete:
+            asyncio.get_running_loop().call_soon(self.entries.load, page_number + 2)
+        return page
+
+
+class SimpleSource(LazySource):
+    def __init__(self, entries: Union[LazyPages[Union[str, discord.Embed]], Iterable[Union[str, discord.Embed]]]):
+        super().__init__(entries)
+
     async def format_page(self, menu: menus.MenuPages, page: Union[str, discord.Embed]):
         return page
 
@@ -427,14 +447,17 @@ class StopButton(discord.ui.Button):
 
 
 class _NavigateButton(discord.ui.Button):
-    def __init__(self, style: discord.ButtonStyle, emoji: Union[str, discord.PartialEmoji], direction: int):
+    def __init__(self, style: discord.ButtonStyle, emoji: Union[str, discord.PartialEmoji], direction: Optional[int]):
+        """A button moving ``direction`` pages, 0 goes to the first page and None to the last."""
         super().__init__(style=style, emoji=emoji)
         self.direction = direction
 
     async def callback(self, interaction: discord.Interaction):
         if self.direction == 0:
             self.view.current_page = 0
-        elif self.direction == self.view.source.get_max_pages():
+        elif self.direction is None:
+            if isinstance(self.view.source, LazySource):
+                self.view.source.entries.load()
             self.view.current_page = self.view.source.get_max_pages() - 1
         else:
             self.view.current_page += self.direction
@@ -480,7 +503,7 @@ class BaseMenu(discord.ui.View):
         self.last_button = _NavigateButton(
             discord.ButtonStyle.grey,
             "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}",
-            direction=self.source.get_max_pages(),
+            direction=None,
         )
         self.stop_button = StopButton(discord.ButtonStyle.red)
         self.add_item(self.stop_button)
@@ -854,9 +877,7 @@ class BackpackSelectEquip(discord.ui.Select):
             for item_index in self.values:
                 equip_item = self.view.source.current_table.items[int(item_index)]
                 try:
-                    c = await Character.from_json(
-                        self.view.ctx, self.view.cog.config, self.view.ctx.author, self.view.cog._daily_bonus
-                    )
+                    c = await self.view.cog.character_store.load(self.view.ctx, self.view.ctx.author)
                 except Exception as exc:
                     log.exception("Error with the new character sheet", exc_info=exc)
                     return
@@ -888,9 +909,7 @@ class BackpackSelectEquip(discord.ui.Select):
                             put=getattr(c, equip.slot.char_slot).as_ansi(),
                         )
                     c = await c.equip_item(equip, True, is_dev(self.view.ctx.author))  # FIXME:
-                    await self.view.cog.config.user(self.view.ctx.author).set(
-                        await c.to_json(self.view.ctx, self.view.cog.config)
-                    )
+                    await self.view.cog.character_store.save(self.view.ctx, self.view.ctx.author, c)
                 equip_msg += ".\n\n"
         await smart_embed(message=box(equip_msg, lang="ansi"), interaction=interaction)
 
@@ -916,18 +935,15 @@ class BackpackSelectEquip(discord.ui.Select):
         await self.equip_items(interaction)
 
 
-class BackpackSource(menus.ListPageSource):
-    def __init__(self, entries: List[BackpackTable]):
-        super().__init__(entries, per_page=1)
-        self.current_table = entries[0]
+class BackpackSource(LazySource):
+    def __init__(self, entries: Union[LazyPages[BackpackTable], List[BackpackTable]]):
+        super().__init__(entries)
+        self.current_table = self.entries[0]
         self.select_options = [
             discord.SelectOption(label=str(item), value=i, description=item.stat_str(), emoji=item.rarity.emoji)
             for i, item in enumerate(self.current_table.items)
         ]
 
-    def is_paginating(self):
-        return True
-
     async def format_page(self, view: BackpackMenu, page: BackpackTable):
         self.current_table = page
         self.select_options = [
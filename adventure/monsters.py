@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from random import Random
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .types import Monster
+
+# How likely a monster is picked relative to the others in range. Before seeds had versions
+# every normal monster was added between 0 and 14 times and bosses once, these are the same odds.
+COMMON_WEIGHT = 7
+BOSS_WEIGHT = 1
+
+
+def monster_weight(monster: Monster) -> int:
+    if monster["boss"] or monster["miniboss"]:
+        return BOSS_WEIGHT
+    return COMMON_WEIGHT
+
+
+class MonsterIndex:
+    """The monsters of a roster sorted by hp and by diplomacy.
+
+    Each ordering keeps a running total of the monsters' weights, so finding
+    the monsters within a range of stats and picking one of them both take a
+    binary search rather than a walk through the whole roster.
+    """
+
+    __slots__ = ("monsters", "names", "_orders")
+
+    def __init__(self, monsters: Mapping[str, Monster]):
+        self.monsters = monsters
+        self.names: List[str] = list(monsters)
+        self._orders: Dict[str, Tuple[List[float], List[str], List[int]]] = {}
+        for stat in ("hp", "dipl"):
+            ordered = sorted(monsters.items(), key=lambda item: item[1][stat])
+            self._orders[stat] = (
+                [monster[stat] for name, monster in ordered],
+                [name for name, monster in ordered],
+                list(accumulate(monster_weight(monster) for name, monster in ordered)),
+            )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def window(self, stat: str, low: float, high: float) -> List[str]:
+        """The monsters with ``stat`` between ``low`` and ``high``, lowest first."""
+        values, names, totals = self._orders[stat]
+        return names[bisect_left(values, low) : bisect_right(values, high)]
+
+    def pick(self, stat: str, low: float, high: float, rng: Random) -> Optional[str]:
+        """Pick a monster with ``stat`` between ``low`` and ``high`` by weight, None if there are none."""
+        values, names, totals = self._orders[stat]
+        start = bisect_left(values, low)
+        end = bisect_right(values, high)
+        if start >= end:
+            return None
+        before = totals[start - 1] if start else 0
+        target = before + rng.random() * (totals[end - 1] - before)
+        return names[bisect_right(totals, target, start, end - 1)]
+
+
+class MonsterRoster(Mapping[str, Monster]):
+    """Every monster of a theme, sorted by name.
+
+    The roster is built once for the theme and shared by every adventure
+    started while it is in use, it can't be changed. When the monsters of the
+    theme change a new roster is built in its place.
+    """
+
+    __slots__ = ("theme", "_monsters", "_index")
+
+    def __init__(self, theme: str, *rosters: Mapping[str, Monster]):
+        merged: Dict[str, Monster] = {}
+        for roster in rosters:
+            merged.update(roster)
+        self.theme = theme
+        self._monsters: Dict[str, Monster] = {name: merged[name] for name in sorted(merged)}
+        self._index: Optional[MonsterIndex] = None
+
+    def __repr__(self):
+        return f"<MonsterRoster theme={self.theme!r} monsters={len(self._monsters)}>"
+
+    def __getitem__(self, name: str) -> Monster:
+        return self._monsters[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._monsters
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._monsters)
+
+    def __len__(self) -> int:
+        return len(self._monsters)
+
+    @property
+    def index(self) -> MonsterIndex:
+        """The roster sorted by stats, built the first time it is needed."""
+        if self._index is None:
+            self._index = MonsterIndex(self._monsters)
+        return self._index
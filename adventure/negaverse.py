@@ -13,7 +13,6 @@ from redbot.core.utils.chat_formatting import bold, box, humanize_number, pagify
 
 from .abc import AdventureMixin
 from .bank import bank
-from .charsheet import Character
 from .constants import Rarities, Treasure
 from .helpers import ConfirmView, escape, is_dev, smart_embed
 
@@ -152,7 +151,7 @@ class Negaverse(AdventureMixin):
             )
 
             try:
-                character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                character = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 lock.release()
@@ -196,7 +195,7 @@ class Negaverse(AdventureMixin):
                 )
                 if items:
                     item_string = "\n".join([f"{v} {i}" for v, i in items])
-                    await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, character)
                     looted_msg = _("{negachar} also stole the following items:\n\n{items}").format(
                         items=item_string, negachar=bold(negachar)
                     )
@@ -240,7 +239,7 @@ class Negaverse(AdventureMixin):
                 )
                 if items:
                     item_string = "\n".join([f"{v} {i}" for v, i in items])
-                    await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, character)
                     looted_msg = _("{negachar} also stole the following items:\n\n{items}").format(
                         items=item_string, negachar=bold(negachar)
                     )
@@ -351,7 +350,7 @@ class Negaverse(AdventureMixin):
                 )
                 if items:
                     item_string = "\n".join([f"{v} {i}" for v, i in items])
-                    await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, character)
                     looted_msg = _("{negachar} also stole the following items:\n\n{items}").format(
                         items=item_string, negachar=bold(negachar)
                     )
@@ -363,7 +362,7 @@ class Negaverse(AdventureMixin):
             with contextlib.suppress(Exception):
                 lock.release()
             try:
-                character = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                character = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
             else:
@@ -390,7 +389,7 @@ class Negaverse(AdventureMixin):
                     changed = True
 
                 if changed:
-                    await self.config.user(ctx.author).set(await character.to_json(ctx, self.config))
+                    await self.character_store.save(ctx, ctx.author, character)
 
     @_negaverse_command.error
     async def negaverse_error(self, ctx: commands.Context, error: Exception):
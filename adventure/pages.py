@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import math
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from redbot.core.utils.chat_formatting import box, pagify
+
+T = TypeVar("T")
+
+
+class LazyPages(Generic[T]):
+    """Pages taken from an iterable the first time they are asked for.
+
+    Pages are drawn in order, so asking for a page draws every page before it
+    and asking for a negative index draws them all. Until the last page has
+    been drawn the number of pages is a guess, ``estimate`` is called with the
+    pages drawn so far to make it.
+    """
+
+    def __init__(self, pages: Iterable[T], estimate: Optional[Callable[[List[T]], int]] = None):
+        self._estimate = estimate
+        self._iterator: Optional[Iterator[T]]
+        if isinstance(pages, Sequence):
+            self._pages = list(pages)
+            self._iterator = None
+        else:
+            self._pages = []
+            self._iterator = iter(pages)
+
+    def __repr__(self):
+        return f"<LazyPages drawn={len(self._pages)} complete={self.complete}>"
+
+    @property
+    def complete(self) -> bool:
+        return self._iterator is None
+
+    def load(self, count: Optional[int] = None) -> None:
+        """Draw pages until ``count`` of them are drawn, or all of them when it's None."""
+        while self._iterator is not None and (count is None or len(self._pages) < count):
+            try:
+                self._pages.append(next(self._iterator))
+            except StopIteration:
+                self._iterator = None
+
+    def estimate(self) -> int:
+        """How many pages there are, exact once they have all been drawn."""
+        if self.complete:
+            return len(self._pages)
+        if self._estimate is None:
+            return len(self._pages) + 1
+        return max(self._estimate(self._pages), len(self._pages) + 1)
+
+    def __getitem__(self, index: int) -> T:
+        self.load(index + 1 if index >= 0 else None)
+        return self._pages[index]
+
+    def __iter__(self) -> Iterator[T]:
+        index = 0
+        while True:
+            self.load(index + 1)
+            if index >= len(self._pages):
+                return
+            yield self._pages[index]
+            index += 1
+
+    def __bool__(self) -> bool:
+        self.load(1)
+        return bool(self._pages)
+
+
+def boxed_pages(text: str, lang: str = "ansi", *, shorten_by: int = 10, page_length: int = 1900) -> LazyPages[str]:
+    """Split ``text`` with ``pagify`` into pages in code blocks, drawn as they are shown."""
+    return LazyPages(
+        (box(page, lang=lang) for page in pagify(text, shorten_by=shorten_by, page_length=page_length)),
+        lambda pages: math.ceil(len(text) / (page_length - shorten_by)),
+    )
@@ -8,7 +8,7 @@ from redbot.core.utils.chat_formatting import box, humanize_number
 
 from .abc import AdventureMixin
 from .bank import bank
-from .charsheet import Character, has_funds
+from .charsheet import has_funds
 from .helpers import ConfirmView, escape, smart_embed
 
 _ = Translator("Adventure", __file__)
@@ -31,7 +31,7 @@ class RebirthCommands(AdventureMixin):
         await ctx.defer()
         async with self.get_lock(ctx.author):
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -40,9 +40,9 @@ class RebirthCommands(AdventureMixin):
             if not c.last_currency_check + 10 < time.time():
                 return await smart_embed(ctx, _("You need to wait a little before rebirthing.").format(c=c))
             if not await bank.is_global():
-                rebirth_cost = await self.config.guild(ctx.guild).rebirth_cost()
+                rebirth_cost = self.settings.guild(ctx.guild)["rebirth_cost"]
             else:
-                rebirth_cost = await self.config.rebirth_cost()
+                rebirth_cost = self.settings["rebirth_cost"]
             base_cost = 1000 * c.rebirths
             current_balance = c.bal
             last_known_currency = c.last_known_currency
@@ -113,7 +113,7 @@ class RebirthCommands(AdventureMixin):
                 return
 
             try:
-                c = await Character.from_json(ctx, self.config, ctx.author, self._daily_bonus)
+                c = await self.character_store.load(ctx, ctx.author)
             except Exception as exc:
                 log.exception("Error with the new character sheet", exc_info=exc)
                 return
@@ -143,4 +143,4 @@ class RebirthCommands(AdventureMixin):
                 embed=None,
                 view=None,
             )
-            await self.config.user(ctx.author).set(await c.rebirth())
+            self.character_store.set(ctx.author, await c.rebirth())
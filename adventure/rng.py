@@ -32,6 +32,9 @@ class GameSeed:
     The next 20 bits contain the min and max. These are limited to 16383 bits.
     Since the base monsters cap at 560 stat this should be good enough.
     Custom monsters with higher stats will break this if they go above 16383.
+    The win percentage takes the last 7 bits and the 2 bits above it hold the
+    seed version, which decides how the monster is picked. Seeds from before
+    versions existed have 0 there and are replayed the way they were made.
     """
 
     TIMESTAMP_SHIFT = 38
@@ -43,10 +46,15 @@ class GameSeed:
     # We want to encode the min and max stat within half of what is left
     # all of these variables are included to more easily adjust this
     # If any value is changed past adventure results RNG will differ
+    VERSION_SHIFT = 7
+    # The win percentage is at most 100 which fits under this
+    VERSION = 1
+    # 0 picks monsters by walking the whole roster, 1 uses the MonsterIndex
 
-    def __init__(self, message_id: int, stats: StatRange):
+    def __init__(self, message_id: int, stats: StatRange, version: int = VERSION):
         self.stat_range = stats
         self.message_id = message_id
+        self.version = version
 
     def __int__(self):
         ret = self.timestamp() << self.TIMESTAMP_SHIFT
@@ -56,10 +64,11 @@ class GameSeed:
         min_s = self.min_stat() << self.MIN_STAT_SHIFT
         # Store the min stat 10 bits in leaving the last 10 bits for the max stat
         max_s = self.max_stat() << self.MAX_STAT_SHIFT
+        version = self.version << self.VERSION_SHIFT
         win_pct = round(self.win_pct() * 100)
         # Python doesn't like converting some values to a float and casting to int
         # will cause it to round down even though it should round up
-        ret += hp + min_s + max_s + win_pct
+        ret += hp + min_s + max_s + version + win_pct
         return ret
 
     def __index__(self):
@@ -100,8 +109,11 @@ class GameSeed:
         max_stat = number >> cls.MAX_STAT_SHIFT
 
         number ^= max_stat << cls.MAX_STAT_SHIFT
+        version = number >> cls.VERSION_SHIFT
+        # Strip the version leaving the win percentage
+        number ^= version << cls.VERSION_SHIFT
         win_percent = number / 100
         # Leaving us with just the max stat as the last 10 bits of data
         stat_type = "hp" if hp_or_diplo else "dipl"
         stats = StatRange(stat_type=stat_type, min_stat=min_stat, max_stat=max_stat, win_percent=win_percent)
-        return cls(message_id, stats)
+        return cls(message_id, stats, version=version)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+log = logging.getLogger("red.cogs.adventure")
+
+Callback = Callable[[], Union[None, Awaitable[Any]]]
+
+
+class Deadline:
+    """A point in time on the event loop's clock, with what to do once it is reached.
+
+    ``done`` resolves when the deadline is reached and is cancelled with it,
+    awaiting the deadline waits for ``done``.
+    """
+
+    __slots__ = ("key", "when", "callback", "done")
+
+    def __init__(self, key: Hashable, when: float, callback: Optional[Callback], done: asyncio.Future):
+        self.key = key
+        self.when = when
+        self.callback = callback
+        self.done = done
+
+    def __repr__(self):
+        return f"<Deadline key={self.key!r} remaining={self.remaining():.1f}>"
+
+    def __await__(self):
+        return self.done.__await__()
+
+    def remaining(self) -> float:
+        """Seconds until the deadline, negative once it has passed."""
+        return self.when - self.done.get_loop().time()
+
+    def cancel(self) -> None:
+        """Drop the deadline without calling its callback."""
+        self.done.cancel()
+
+
+class Scheduler:
+    """Every deadline the cog waits on, kept in one heap.
+
+    Adventure countdowns, carts leaving and old sessions being dropped are each
+    a :class:`Deadline` under a key such as ``("adventure", guild_id)``. A single
+    timer is armed on the event loop for the earliest one, so nothing wakes up
+    between deadlines and how long is left is worked out when it is asked for.
+
+    Scheduling a key again replaces its deadline. Replaced and cancelled
+    deadlines are left in the heap and skipped when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Deadline]] = []
+        self._deadlines: Dict[Hashable, Deadline] = {}
+        self._counter = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def get(self, key: Hashable) -> Optional[Deadline]:
+        deadline = self._deadlines.get(key)
+        if deadline is None or deadline.done.done():
+            return None
+        return deadline
+
+    def remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until the deadline under ``key``, or None when there isn't one."""
+        deadline = self.get(key)
+        if deadline is None:
+            return None
+        return deadline.remaining()
+
+    def schedule(self, key: Hashable, delay: float, callback: Optional[Callback] = None) -> Deadline:
+        """Reach a deadline under ``key`` in ``delay`` seconds, calling ``callback`` when it does.
+
+        ``callback`` may return an awaitable, it is then run as a task.
+        """
+        loop = self._loop = asyncio.get_running_loop()
+        self.cancel(key)
+        deadline = Deadline(key, loop.time() + delay, callback, loop.create_future())
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline.when, next(self._counter), deadline))
+        self._arm()
+        return deadline
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the deadline under ``key`` without calling its callback."""
+        deadline = self._deadlines.pop(key, None)
+        if deadline is None:
+            return False
+        deadline.done.cancel()
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._compact()
+        return True
+
+    def close(self) -> None:
+        """Cancel every deadline and any callbacks still running."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for deadline in self._deadlines.values():
+            deadline.done.cancel()
+        self._deadlines.clear()
+        self._heap.clear()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def _arm(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2].done.done():
+            self._forget(heapq.heappop(heap)[2])
+        if not heap:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+        when = heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() == when:
+                return
+            self._timer.cancel()
+        self._timer = self._loop.call_at(when, self._fire, when)
+
+    def _fire(self, now: float) -> None:
+        # The loop may run the timer a little early, everything due by the time
+        # it was armed for is reached rather than comparing with the clock again.
+        self._timer = None
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline = heapq.heappop(heap)[2]
+            self._forget(deadline)
+            if deadline.done.done():
+                continue
+            deadline.done.set_result(None)
+            if deadline.callback is not None:
+                self._run(deadline)
+        self._arm()
+
+    def _compact(self) -> None:
+        heap = []
+        for entry in self._heap:
+            if entry[2].done.done():
+                self._forget(entry[2])
+            else:
+                heap.append(entry)
+        heapq.heapify(heap)
+        self._heap = heap
+
+    def _forget(self, deadline: Deadline) -> None:
+        if self._deadlines.get(deadline.key) is deadline:
+            del self._deadlines[deadline.key]
+
+    def _run(self, deadline: Deadline) -> None:
+        try:
+            result = deadline.callback()
+        except Exception:
+            log.exception("Error reaching the deadline for %r", deadline.key)
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            task.add_done_callback(self._task_done)
+            self._tasks.add(task)
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Error reaching a deadline", exc_info=task.exception())
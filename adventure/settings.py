@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+import logging
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Set
+
+import discord
+from redbot.core import Config
+
+from .defaults import default_global, default_guild
+
+log = logging.getLogger("red.cogs.adventure")
+
+
+class Settings:
+    """Global and guild settings kept in memory in front of Config.
+
+    Everything is read from config once when the cog starts, after that
+    reading a setting is a dictionary lookup. Changes to global and guild
+    settings have to go through :meth:`set` and :meth:`set_guild` so the copy
+    here is written along with config.
+
+    Guilds that never changed a setting share the defaults until they do.
+    :attr:`cart_channels` holds the id of every channel carts can show up in,
+    so checking a message's channel needs neither config nor the guild's settings.
+    """
+
+    def __init__(self, config: Config):
+        self._config = config
+        self._global: Dict[str, Any] = copy.deepcopy(default_global)
+        self._guilds: Dict[int, Dict[str, Any]] = {}
+        self._guild_defaults = MappingProxyType(default_guild)
+        self.cart_channels: Set[int] = set()
+
+    async def load(self) -> None:
+        self._global = await self._config.all()
+        self._guilds = await self._config.all_guilds()
+        self.cart_channels = {
+            channel_id for data in self._guilds.values() for channel_id in data.get("cart_channels") or []
+        }
+        log.debug("Loaded settings for %s guilds", len(self._guilds))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._global[key]
+
+    def guild(self, guild: discord.abc.Snowflake) -> Mapping[str, Any]:
+        """The settings of ``guild``, read only."""
+        data = self._guilds.get(guild.id)
+        if data is None:
+            return self._guild_defaults
+        return MappingProxyType(data)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self._config.get_attr(key).set(value)
+        self._global[key] = value
+
+    async def set_guild(self, guild: discord.abc.Snowflake, key: str, value: Any) -> None:
+        await self._config.guild_from_id(guild.id).get_attr(key).set(value)
+        if guild.id not in self._guilds:
+            self._guilds[guild.id] = copy.deepcopy(default_guild)
+        if key == "cart_channels":
+            self.cart_channels.difference_update(self._guilds[guild.id]["cart_channels"] or [])
+            self.cart_channels.update(value or [])
+        self._guilds[guild.id][key] = value
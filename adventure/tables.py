@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import re
+from itertools import zip_longest
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    from wcwidth import wcwidth
+except ImportError:  # installed alongside beautifultable, without it every character is one column wide
+    wcwidth = len
+
+ANSI_REGEX = re.compile(r"(\x1B(?:[()][AB012]|[@-Z\\-_]|\[[0-?]*[ -/]*[@-~]))")
+ANSI_RESET = "\x1b[0m"
+
+ALIGN_LEFT = "<"
+ALIGN_CENTER = "^"
+ALIGN_RIGHT = ">"
+
+
+# Anything int() or float() accepts matches, other strings are left alone without trying them.
+NUMERIC_REGEX = re.compile(r"\s*[-+]?(?:[\d_.]+(?:e[-+]?[\d_]+)?|nan|inf|infinity)\s*", re.IGNORECASE)
+
+
+def display(value: Any) -> str:
+    """Format a cell the way ``BeautifulTable`` does, numeric strings are shown as numbers."""
+    if value is None:
+        return ""
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, str):
+        if not NUMERIC_REGEX.fullmatch(value):
+            return value
+        try:
+            value = int(value)
+        except ValueError:
+            try:
+                value = float(value)
+            except ValueError:
+                return value
+    if isinstance(value, float):
+        value = round(value, 3)
+    try:
+        return "{:-}".format(value)
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def termwidth(text: str) -> int:
+    """The number of columns ``text`` takes up on a terminal, escape codes take up none."""
+    if "\x1b" in text:
+        text = "".join(ANSI_REGEX.split(text)[::2])
+    if text.isascii():
+        return len(text)
+    return sum(wcwidth(char) for char in text)
+
+
+def _change_state(part: List[str], prev_state: List[str], state: List[str]) -> None:
+    if state == prev_state:
+        return
+    if prev_state and prev_state == state[: len(prev_state)]:
+        part.extend(state[len(prev_state) :])
+    else:
+        if prev_state:
+            part.append(ANSI_RESET)
+        part.extend(state)
+
+
+def wrap(text: str, width: int) -> List[Tuple[str, int]]:
+    """Split ``text`` into pieces no wider than ``width`` columns.
+
+    Returns each piece with its width on a terminal. Escape codes are reopened
+    at the start of a piece and closed at its end so every piece can be drawn
+    on its own line, codes which colour nothing are dropped.
+    """
+    if "\x1b" not in text and text.isascii():
+        if len(text) <= width:
+            return [(text, len(text))] if text else []
+        return [(text[start : start + width], len(text[start : start + width])) for start in range(0, len(text), width)]
+    tokens = ANSI_REGEX.split(text)
+    plain = "".join(tokens[::2])
+    text_width = len(plain) if plain.isascii() else sum(wcwidth(char) for char in plain)
+    pieces = []
+    part: List[str] = []
+    part_width = 0
+    state: List[str] = []
+    prev_state: List[str] = []
+    for index, token in enumerate(tokens):
+        if index % 2:
+            if token == ANSI_RESET:
+                state = []
+            elif token not in state:
+                state = state + [token]
+        elif text_width <= width:
+            # Nothing is split so the codes can only change between tokens.
+            if token:
+                _change_state(part, prev_state, state)
+                prev_state = state
+                part.append(token)
+                part_width = text_width
+        else:
+            for char in token:
+                char_width = wcwidth(char) if not char.isascii() else 1
+                if part_width + char_width > width:
+                    if prev_state:
+                        part.append(ANSI_RESET)
+                    pieces.append(("".join(part), part_width))
+                    prev_state = []
+                    part = []
+                    part_width = 0
+                part_width += char_width
+                _change_state(part, prev_state, state)
+                prev_state = state
+                part.append(char)
+    if prev_state:
+        part.append(ANSI_RESET)
+    if part:
+        pieces.append(("".join(part), part_width))
+    return pieces
+
+
+def cell_lines(cell: Any, width: int) -> List[Tuple[str, int]]:
+    """The lines ``cell`` is drawn on in a column with ``width`` columns of space, with their widths."""
+    return [piece for line in display(cell).split("\n") for piece in wrap(display(line), width) or [("", 0)]]
+
+
+def align(piece: str, piece_width: int, width: int, alignment: str = ALIGN_CENTER) -> str:
+    """Pad a line of a cell to fill its column, ``width`` includes the column's padding."""
+    pad = width - piece_width - 2
+    if alignment == ALIGN_LEFT:
+        return f" {piece} {' ' * pad}"
+    if alignment == ALIGN_RIGHT:
+        return f"{' ' * pad} {piece} "
+    return f"{' ' * (pad // 2)} {piece} {' ' * (pad - pad // 2)}"
+
+
+class AnsiTable:
+    """A table drawn like ``BeautifulTable`` in ``STYLE_RST`` with ANSI coloured cells.
+
+    Only the parts of ``BeautifulTable`` the cog uses are supported, the table has
+    no left or right border, columns are separated by a space and lines of ``=``
+    draw the borders. Columns get ``widths`` including one space of padding on either
+    side, or are sized from their contents up to ``maxwidth`` for the whole table.
+    Cells wider than their column wrap onto more lines.
+
+    ``rows`` is a plain list of rows, one cell per column.
+    """
+
+    __slots__ = ("header", "widths", "alignments", "rows", "top_border", "bottom_border", "maxwidth")
+
+    def __init__(
+        self,
+        columns: int = 1,
+        *,
+        header: Optional[Sequence[str]] = None,
+        widths: Optional[Sequence[int]] = None,
+        alignments: Optional[Sequence[str]] = None,
+        top_border: bool = True,
+        bottom_border: bool = True,
+        maxwidth: int = 250,
+    ):
+        if header is not None:
+            columns = len(header)
+        elif widths is not None:
+            columns = len(widths)
+        self.header = list(header) if header is not None else None
+        self.widths = list(widths) if widths is not None else None
+        self.alignments = list(alignments) if alignments is not None else [ALIGN_CENTER] * columns
+        self.rows: List[Sequence[Any]] = []
+        self.top_border = top_border
+        self.bottom_border = bottom_border
+        self.maxwidth = maxwidth
+
+    def __str__(self) -> str:
+        return self.render()[0]
+
+    def _cells(self) -> List[List[List[str]]]:
+        rows = list(self.rows)
+        if self.header is not None and "".join(self.header).strip():
+            rows.insert(0, self.header)
+        return [[[display(line) for line in display(cell).split("\n")] for cell in row] for row in rows]
+
+    def _column_widths(self, cells: List[List[List[str]]]) -> List[int]:
+        if self.widths is not None:
+            return self.widths
+        widths = [0] * len(self.alignments)
+        for row in cells:
+            for column, lines in enumerate(row):
+                widths[column] = max(widths[column], *map(termwidth, lines))
+        # Like BeautifulTable, columns wider than their share of maxwidth are narrowed
+        # in proportion to their width when the table would not fit otherwise.
+        available = self.maxwidth - 3 * len(widths) + 1
+        share = int(available / len(widths))
+        fits = sum(width if width <= share else 1 for width in widths)
+        total = sum(widths)
+        if total > available:
+            widths = [
+                width if width <= share else min(width, 1 + int((width - 1) * (available - fits) / (total - fits)))
+                for width in widths
+            ]
+        return [width + 2 for width in widths]
+
+    def render(self) -> Tuple[str, List[int]]:
+        """Draw the table, returning it with the width of each column including its padding."""
+        if not self.rows:
+            return "", []
+        cells = self._cells()
+        widths = self._column_widths(cells)
+        border = " ".join("=" * width for width in widths)
+        lines = []
+        if self.top_border:
+            lines.append(border)
+        for row_index, row in enumerate(cells):
+            for row_lines in zip_longest(*row, fillvalue=""):
+                pieces = [wrap(line, width - 2) or [("", 0)] for line, width in zip(row_lines, widths)]
+                for line_pieces in zip_longest(*pieces, fillvalue=("", 0)):
+                    lines.append(
+                        " ".join(
+                            align(piece, piece_width, width, alignment)
+                            for (piece, piece_width), width, alignment in zip(line_pieces, widths, self.alignments)
+                        )
+                    )
+            if row_index == 0 and len(cells) > len(self.rows):
+                lines.append(border)
+        if self.bottom_border:
+            lines.append(border)
+        return "\n".join(lines), widths
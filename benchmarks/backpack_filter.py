@@ -0,0 +1,100 @@
+"""Per item cost of ``[p]cbackpack`` filters on large backpacks.
+
+Queries are timed item by item and, when NumPy is installed, as arrays.
+
+Run from the repository root in an environment with Red installed::
+
+    python -m benchmarks.backpack_filter
+"""
+from __future__ import annotations
+
+import random
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from adventure import columns
+from adventure.charsheet import Backpack, BackpackFilter, Character
+from adventure.constants import Rarities, Slot
+
+ITEMS = 10_000
+RUNS = 20
+
+SLOTS = [["head"], ["neck"], ["chest"], ["gloves"], ["belt"], ["legs"], ["boots"], ["left"], ["right"], ["ring"]]
+SLOTS.append(["left", "right"])
+RARITIES = ["normal", "rare", "epic", "legendary", "ascended", "set", "event"]
+
+QUERIES: Dict[str, Dict[str, Any]] = {
+    "everything": {},
+    "--slot head": {"slot": [Slot.head]},
+    "--rarity legendary ascended --str >10": {
+        "rarity": [Rarities.legendary, Rarities.ascended],
+        "strength": {"min": 10, "max": float("inf")},
+    },
+    "--set S1 --equip": {"set": ["S1"], "equippable": True},
+    "--match sword --icase --int 5": {"match": "sword", "icase": True, "intelligence": {"equal": 5}},
+    "--except --rarity normal rare --lvl <20": {
+        "except": True,
+        "rarity": [Rarities.normal, Rarities.rare],
+        "level": {"min": float("-inf"), "max": 20},
+    },
+    "--except --no-match shield --deg 1": {"except": True, "no_match": "shield", "degrade": {"equal": 1}},
+}
+
+
+def make_backpack(size: int) -> Dict[str, dict]:
+    rng = random.Random(0)
+    backpack = {}
+    for i in range(size):
+        rarity = rng.choice(RARITIES)
+        name = f"{rng.choice(['sword', 'shield', 'helm', 'ring'])} {i}"
+        if rarity in ("set", "legendary", "ascended"):
+            name = name.title()
+        item = {
+            "slot": rng.choice(SLOTS),
+            "att": rng.randint(-5, 30),
+            "int": rng.randint(-5, 30),
+            "cha": rng.randint(-5, 30),
+            "dex": rng.randint(0, 10),
+            "luck": rng.randint(0, 10),
+            "rarity": rarity,
+            "owned": rng.randint(1, 5),
+            "degrade": rng.randint(0, 5),
+        }
+        if rarity == "event":
+            item["lvl"] = rng.randint(1, 200)
+        if rarity == "set":
+            item["set"] = f"S{rng.randint(1, 10)}"
+        backpack[name] = item
+    return backpack
+
+
+def main() -> None:
+    data = make_backpack(ITEMS)
+    character = SimpleNamespace(backpack=Backpack(None, data), lvl=100, rebirths=20)
+    character.equip_level = lambda item: Character.equip_level(character, item)
+
+    start = time.perf_counter()
+    character.backpack._build_index()
+    built = time.perf_counter() - start
+    print(f"{ITEMS} items, building items and indexes: {built * 1000:.1f}ms ({built / ITEMS * 1e6:.2f}us per item)")
+
+    modes = {"items": ITEMS + 1}
+    if columns.np is not None:
+        character.backpack.columns()
+        modes["numpy"] = 0
+    for mode, min_items in modes.items():
+        print(f"\n{mode}")
+        columns.COLUMNAR_MIN_ITEMS = min_items
+        for label, query in QUERIES.items():
+            compiled = BackpackFilter.from_query(dict(query), rarity_exclude=["forged"])
+            start = time.perf_counter()
+            for _ in range(RUNS):
+                groups = compiled.apply(character)
+            elapsed = (time.perf_counter() - start) / RUNS
+            matched = sum(len(items) for _slot, items in groups)
+            print(f"{label:<45} {matched:>6} matched {elapsed * 1000:>8.2f}ms {elapsed / ITEMS * 1e6:>6.3f}us per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Cost of rolling a party's attacks, spells and arguments.
+
+Rounds are rolled one combatant at a time the way adventures are and, when
+NumPy is installed, all at once with ``combat.simulate``.
+
+Run from the repository root in an environment with Red installed::
+
+    python -m benchmarks.combat
+"""
+from __future__ import annotations
+
+import random
+import time
+from typing import List
+
+from adventure import combat
+from adventure.constants import HeroClasses
+
+PARTY = 25
+ROUNDS = 20_000
+DEFENCE = 1.2
+
+
+def make_party(size: int) -> List[combat.Combatant]:
+    rng = random.Random(0)
+    return [
+        combat.Combatant(
+            total_att=rng.randint(0, 600),
+            total_int=rng.randint(0, 600),
+            total_cha=rng.randint(0, 600),
+            dex=rng.randint(0, 100),
+            luck=rng.randint(0, 100),
+            rebirths=rng.choice([0, 10, 20, 40, 80]),
+            hc=rng.choice(list(HeroClasses)),
+            ability=rng.random() < 0.5,
+            pet_crit=rng.choice([0, 0, 0, 90, 96]),
+        )
+        for i in range(size)
+    ]
+
+
+def main() -> None:
+    party = make_party(PARTY)
+    print(f"{PARTY} combatants, {ROUNDS} rounds")
+    for name, style in combat.STYLES.items():
+        rng = random.Random(0)
+        start = time.perf_counter()
+        totals = [sum(o.value for o in combat.resolve(party, style, DEFENCE, rng)) for _ in range(ROUNDS)]
+        elapsed = time.perf_counter() - start
+        line = f"{name:<6} scalar {elapsed * 1000:>8.1f}ms mean {sum(totals) / ROUNDS:>9.1f}"
+        if combat.np is not None:
+            start = time.perf_counter()
+            simulation = combat.simulate(party, style, DEFENCE, ROUNDS, seed=0)
+            simulated = time.perf_counter() - start
+            line += f" | numpy {simulated * 1000:>8.1f}ms mean {simulation.totals().mean():>9.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Cost of drawing item tables with ``AnsiTable`` and with ``BeautifulTable``.
+
+Run from the repository root in an environment with Red installed::
+
+    python -m benchmarks.tables
+"""
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, List, Tuple
+
+from beautifultable import ALIGN_CENTER, BeautifulTable
+
+from adventure.charsheet import COLUMN_WIDTHS
+from adventure.constants import ANSITextColours, Rarities
+from adventure.tables import AnsiTable
+
+ITEMS = 2_000
+RUNS = 5
+
+
+def make_cells(size: int) -> List[Tuple[str, List[str]]]:
+    rng = random.Random(0)
+    cells = []
+    for i in range(size):
+        rarity = rng.choice(list(Rarities))
+        name = rarity.as_ansi(f"{rng.choice(['sword', 'shield', 'helm', 'ring'])} of the item {i}")
+        lvl = ANSITextColours.red.as_str(str(rng.randint(1, 200)))
+        stats = [rng.randint(-5, 30) for _ in COLUMN_WIDTHS]
+        stats[0] = ANSITextColours.green.as_str(stats[0])
+        cells.append((f"{rng.randint(1, 5)}x Lvl: {lvl} Head\n{name}", stats))
+    return cells
+
+
+def draw_beautifultable(cells: List[Tuple[str, List[str]]]) -> str:
+    table = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
+    table.set_style(BeautifulTable.STYLE_RST)
+    table.border.top = ""
+    table.border.bottom = ""
+    for name, stats in cells:
+        subtable = BeautifulTable(default_alignment=ALIGN_CENTER, maxwidth=250)
+        subtable.set_style(BeautifulTable.STYLE_RST)
+        subtable.rows.append(stats)
+        subtable.columns.width = COLUMN_WIDTHS
+        subtable.border.top = ""
+        table.rows.append([name])
+        table.rows.append([subtable])
+    return str(table)
+
+
+def draw_ansitable(cells: List[Tuple[str, List[str]]]) -> str:
+    table = AnsiTable(top_border=False, bottom_border=False)
+    for name, stats in cells:
+        subtable = AnsiTable(widths=COLUMN_WIDTHS, top_border=False)
+        subtable.rows.append(stats)
+        table.rows.append([name])
+        table.rows.append([str(subtable)])
+    return str(table)
+
+
+def main() -> None:
+    cells = make_cells(ITEMS)
+    renderers: List[Tuple[str, Callable[[List[Tuple[str, List[str]]]], str]]] = [
+        ("BeautifulTable", draw_beautifultable),
+        ("AnsiTable", draw_ansitable),
+    ]
+    drawn = set()
+    for label, draw in renderers:
+        for size in (1, 15, ITEMS):
+            runs = RUNS if size == ITEMS else RUNS * 100
+            start = time.perf_counter()
+            for _ in range(runs):
+                text = draw(cells[:size])
+            elapsed = (time.perf_counter() - start) / runs
+            print(f"{label:<15} {size:>6} items {elapsed * 1000:>9.3f}ms {elapsed / size * 1e6:>8.2f}us per item")
+        drawn.add(text)
+    print("\nsame output" if len(drawn) == 1 else "\noutput differs")
+
+
+if __name__ == "__main__":
+    main()